@@ -21,7 +21,14 @@ ACC遥测交互音乐模块
 from .audio_config import AudioConfig
 from .mbux_controller import MBUXSoundDriveController, MusicalExpressionEngine
 from .music_engine import AudioEngine, MockAudioEngine, MusicEngine
-from .music_mapper import MusicParameters
+from .music_mapper import (
+    TRIG_CELEBRATE,
+    TRIG_DRS,
+    TRIG_TURBO,
+    TRIG_WARN,
+    MusicParameters,
+    ParameterRing,
+)
 
 __all__ = [
     "MusicEngine",
@@ -29,6 +36,11 @@ __all__ = [
     "MockAudioEngine",
     "AudioConfig",
     "MusicParameters",
+    "ParameterRing",
+    "TRIG_TURBO",
+    "TRIG_DRS",
+    "TRIG_WARN",
+    "TRIG_CELEBRATE",
     "MBUXSoundDriveController",
     "MusicalExpressionEngine",
 ]
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模块: _kernels
+
+遥测 → 音乐参数的数值计算内核。
+
+控制器以 update_rate(默认 60Hz)调用这些函数, 其中全部为标量浮点运算,
+瓶颈在于解释器分派而非计算本身。若环境中安装了 numba, 内核以
+@njit 编译为机器码; 否则回退为纯 Python 执行, 两种模式结果一致。
+控制器/引擎线程直接调用的入口内核以 nogil 编译, 执行期间不占用 GIL,
+不与 Tk 主线程争抢。
+
+表现力状态保存在长度为 STATE_SIZE 的状态向量中并原地更新,
+索引见 ENERGY/PUSH/BREATHING/WIDTH/BRIGHTNESS。
+
+作者: Assistant
+日期: 2024
+"""
+
+import math
+from typing import Any, Callable, List, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+
+    HAS_NUMBA = True
+except ImportError:  # numba 为可选依赖
+    HAS_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore
+        """numba 不可用时的空装饰器, 原样返回被装饰函数"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+
+        return decorator
+
+
+# 状态向量索引
+ENERGY = 0  # 能量密度(速度驱动)
+PUSH = 1  # 节拍推力(油门驱动)
+BREATHING = 2  # 呼吸空间(刹车驱动)
+WIDTH = 3  # 立体宽度(横向G驱动)
+BRIGHTNESS = 4  # 音色亮度(转速驱动)
+STATE_SIZE = 5
+
+# 热路径常量: 以乘法代替除法, 在 numba 下作为编译期常量折叠
+_INV_3 = 1.0 / 3.0
+_INV_30 = 1.0 / 30.0
+_INV_50 = 1.0 / 50.0
+_INV_60 = 1.0 / 60.0
+_INV_70 = 1.0 / 70.0
+_INV_80 = 1.0 / 80.0
+_INV_260 = 1.0 / 260.0
+_INV_6000 = 1.0 / 6000.0
+
+State = Union[np.ndarray, List[float]]
+
+# 速度曲线查表上限(km/h): 能量曲线在 310 处饱和, 存在感曲线在 140 处饱和
+_LUT_MAX = 310
+
+
+def _energy_curve(speed: float) -> float:
+    """能量密度目标值: 低速轻柔, 高速饱满(分段线性)"""
+    if speed <= 50:
+        return 0.2 + 0.3 * (speed * _INV_50)
+    if speed <= 230:
+        return 0.5 + 0.3 * ((speed - 50) * _INV_70)
+    excess = (speed - 230) * _INV_80
+    return 0.8 + 0.2 * (excess if excess < 1.0 else 1.0)
+
+
+def _presence_curve(speed: float) -> float:
+    """基础存在感: 低速安静, 中速渐强, 高速以平方根曲线趋于饱满"""
+    if speed <= 30:
+        return 0.25 + 0.15 * (speed * _INV_30)
+    if speed <= 80:
+        return 0.4 + 0.3 * ((speed - 30) * _INV_50)
+    progress = (speed - 80) * _INV_60
+    return 0.7 + 0.25 * math.sqrt(progress if progress < 1.0 else 1.0)
+
+
+def _build_lut(curve: Callable[[float], float]) -> Union[np.ndarray, List[float]]:
+    """将速度曲线按 1 km/h 分箱, 生成交错排列的 (截距, 斜率) 表
+
+    第 i 个分箱覆盖 (i, i+1], 与曲线分段条件 ``speed <= 断点`` 一致;
+    以箱内两点拟合直线, 因此分段线性曲线(含断点处的跳变)被精确还原,
+    末项斜率为 0 表示饱和段。容器类型与状态向量保持一致。
+    """
+    table: List[float] = []
+    for i in range(_LUT_MAX):
+        y0 = curve(i + 0.25)
+        slope = (curve(i + 0.75) - y0) * 2.0
+        table += [y0 - 0.25 * slope, slope]
+    table += [curve(float(_LUT_MAX)), 0.0]
+    if HAS_NUMBA:
+        return np.array(table, dtype=np.float64)
+    return table
+
+
+_ENERGY_LUT = _build_lut(_energy_curve)
+_PRESENCE_LUT = _build_lut(_presence_curve)
+
+# 声像时间呼吸(0.5 rad/s)使用的正弦表: 相位直接由循环时钟换算为表索引
+_SIN_LUT_SIZE = 1024
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_BREATH_INDEX_RATE = 0.5 * _SIN_LUT_SIZE / (2.0 * math.pi)
+_SIN_LUT: Union[np.ndarray, List[float]] = [
+    math.sin(2.0 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)
+]
+if HAS_NUMBA:
+    _SIN_LUT = np.array(_SIN_LUT, dtype=np.float64)
+
+# 等功率声像表: 第 i 项为声像 -1 + 2i/(N-1) 处的 (左, 右) 增益, 交错排列, 平方和恒为 1
+_PAN_LUT_SIZE = 1024
+_PAN_INDEX_SCALE = (_PAN_LUT_SIZE - 1) * 0.5
+_PAN_LUT: Union[np.ndarray, List[float]] = []
+for _i in range(_PAN_LUT_SIZE):
+    _p = -1.0 + 2.0 * _i / (_PAN_LUT_SIZE - 1)
+    _PAN_LUT += [math.sqrt(max(0.0, 1.0 - _p) * 0.5), math.sqrt((1.0 + _p) * 0.5)]
+if HAS_NUMBA:
+    _PAN_LUT = np.array(_PAN_LUT, dtype=np.float32)
+
+
+def new_state() -> State:
+    """创建初始表现力状态向量
+
+    numba 模式下返回 float64 数组; 纯 Python 模式下返回 list,
+    避免逐元素读写 numpy 标量带来的额外开销。
+
+    Returns:
+        State: 状态向量
+    """
+    init = [0.5, 0.5, 0.5, 0.0, 0.5]
+    if HAS_NUMBA:
+        return np.array(init, dtype=np.float64)
+    return init
+
+
+@njit(cache=True, fastmath=True)
+def _clamp01(v: float) -> float:
+    """将数值限制在 [0, 1] 区间"""
+    return 0.0 if v < 0.0 else (1.0 if v > 1.0 else v)
+
+
+@njit(cache=True, fastmath=True)
+def _lut_interp(table: Union[np.ndarray, List[float]], speed: float) -> float:
+    """按速度查分箱表并在箱内线性求值, 超出表范围时取端点值"""
+    if speed <= 0.0:
+        return table[0]
+    i = int(math.ceil(speed)) - 1
+    if i >= _LUT_MAX:
+        return table[2 * _LUT_MAX]
+    j = 2 * i
+    return table[j] + table[j + 1] * (speed - i)
+
+
+@njit(cache=True, fastmath=True)
+def _update_state(
+    state: State,
+    speed: float,
+    throttle: float,
+    brake: float,
+    lat_g: float,
+    rpm_norm: float,
+    alpha: float,
+    alpha_wide: float,
+) -> None:
+    """以归一化转速原地更新表现力状态(供 compute_params 复用 rpm_norm)"""
+    # 一阶 IIR 平滑 y = y * (1 - a) + x * a, 保留系数每次调用只计算一次
+    keep = 1.0 - alpha
+    keep_wide = 1.0 - alpha_wide
+
+    # 能量密度: 低速轻柔, 高速饱满
+    target_energy = _lut_interp(_ENERGY_LUT, speed)
+    state[ENERGY] = state[ENERGY] * keep + target_energy * alpha
+
+    # 节拍推力: 油门
+    throttle = 0.0 if throttle < 0.0 else (1.0 if throttle > 1.0 else throttle)
+    state[PUSH] = state[PUSH] * keep + (0.3 + 0.7 * throttle) * alpha
+
+    # 呼吸空间: 刹车越强, 给出更多呼吸
+    brake = 0.0 if brake < 0.0 else (1.0 if brake > 1.0 else brake)
+    state[BREATHING] = state[BREATHING] * keep + (1.0 - 0.4 * brake) * alpha
+
+    # 立体宽度: 横向G
+    target_width = lat_g * _INV_3
+    if target_width < -1.0:
+        target_width = -1.0
+    elif target_width > 1.0:
+        target_width = 1.0
+    state[WIDTH] = state[WIDTH] * keep_wide + target_width * alpha_wide
+
+    # 音色亮度: 转速
+    state[BRIGHTNESS] = state[BRIGHTNESS] * keep + (0.4 + 0.6 * rpm_norm) * alpha
+
+
+@njit(cache=True, fastmath=True)
+def update_expression(
+    state: State,
+    speed: float,
+    throttle: float,
+    brake: float,
+    lat_g: float,
+    rpm: float,
+    alpha: float,
+    alpha_wide: float,
+) -> None:
+    """根据驾驶输入原地更新表现力状态
+
+    Args:
+        state: 表现力状态向量
+        speed: 速度(km/h)
+        throttle: 油门 0-1
+        brake: 刹车 0-1
+        lat_g: 横向 G
+        rpm: 转速
+        alpha: 通用平滑系数
+        alpha_wide: 立体宽度平滑系数
+    """
+    _update_state(
+        state,
+        speed,
+        throttle,
+        brake,
+        lat_g,
+        _clamp01((rpm - 2000) * _INV_6000),
+        alpha,
+        alpha_wide,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def master_presence(energy: float, speed: float) -> float:
+    """基于速度与能量密度的主存在感"""
+    base_presence = _lut_interp(_PRESENCE_LUT, speed)
+    presence = base_presence * (0.8 + 0.2 * energy)
+    return 0.2 if presence < 0.2 else (0.95 if presence > 0.95 else presence)
+
+
+@njit(cache=True, fastmath=True)
+def spatial_position(width: float, base_pan: float, t: float) -> float:
+    """将机械声像转化为空间表达(带缓慢的时间呼吸)
+
+    t 为循环时钟时间(秒), 呼吸项 sin(0.5t) 通过正弦表查得。
+    """
+    breath = _SIN_LUT[int(t * _BREATH_INDEX_RATE) & _SIN_LUT_MASK]
+    final_position = base_pan + width * 0.3 + 0.1 * breath
+    if final_position < -1.0:
+        return -1.0
+    return 1.0 if final_position > 1.0 else final_position
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def compute_params(
+    speed: float,
+    throttle: float,
+    brake: float,
+    lat_g: float,
+    rpm: float,
+    slip_avg: float,
+    t: float,
+    alpha: float,
+    state: State,
+) -> Tuple[float, float, float, int, float, float, float]:
+    """单次完成表现力更新与音乐参数映射
+
+    Args:
+        speed/throttle/brake/lat_g/rpm: 驾驶输入
+        slip_avg: 四轮平均滑移
+        t: 循环时钟时间(秒), 用于声像的时间呼吸
+        alpha: 通用平滑系数
+        state: 表现力状态向量(原地更新)
+
+    Returns:
+        (bpm, presence, pan, base_pitch, brightness, reverb, distortion)
+    """
+    # 归一化输入: 各钳位以内联比较完成, 转速只归一化一次, 同时供状态更新与映射使用
+    speed_norm = speed * _INV_260
+    speed_norm = 0.0 if speed_norm < 0.0 else (1.0 if speed_norm > 1.0 else speed_norm)
+    rpm_norm = (rpm - 2000) * _INV_6000
+    rpm_norm = 0.0 if rpm_norm < 0.0 else (1.0 if rpm_norm > 1.0 else rpm_norm)
+
+    _update_state(state, speed, throttle, brake, lat_g, rpm_norm, alpha, 0.08)
+
+    # 1) BPM: 结合速度与转速
+    bpm = 90.0 + 50.0 * speed_norm + 20.0 * rpm_norm
+
+    # 2) 主存在感与空间
+    presence = master_presence(state[ENERGY], speed)
+    pan = spatial_position(state[WIDTH], lat_g * 0.25, t)
+
+    # 3) 基础音高: 以 C4 为基, 随转速轻微上扬(约 C#4 ~ G4)
+    base_pitch = 58 + int(8 * rpm_norm)
+
+    # 4) 音色亮度/混响/失真(刹车更多 -> 空间感更强)
+    # 呼吸空间由 [0.6, 1.0] 内的目标平滑而来(初值 0.5), 混响因此落在
+    # [0.15, 0.4], 失真钳位到 [0, 0.8], 二者均无需再限制到 [0, 1]
+    brightness = state[BRIGHTNESS]
+    reverb = 0.15 + 0.5 * (1.0 - state[BREATHING])
+    distortion = 0.0 if slip_avg < 0.0 else (0.8 if slip_avg > 0.8 else slip_avg)
+
+    return bpm, presence, pan, base_pitch, brightness, reverb, distortion
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def volume_matrix(
+    base: np.ndarray,
+    coeffs: np.ndarray,
+    gate: np.ndarray,
+    gain: float,
+    pan: float,
+    out: np.ndarray,
+) -> None:
+    """计算各分轨的 (左, 右) 音量并写入 out
+
+    各分轨音量 = min(基础音量 x 调制系数, 1) x gain, 限制到 [0, 1],
+    经静音/独奏掩码后按等功率声像分配到左右声道。
+
+    Args:
+        base: 分轨基础音量
+        coeffs: 分轨动态调制系数
+        gate: 静音/独奏掩码(bool)
+        gain: 主存在感 x 主音量
+        pan: 声像 -1(左) ~ 1(右)
+        out: 形状为 (分轨数, 2) 的输出音量表
+    """
+    pan = -1.0 if pan < -1.0 else (1.0 if pan > 1.0 else pan)
+    j = 2 * int((pan + 1.0) * _PAN_INDEX_SCALE + 0.5)
+    gain_l = _PAN_LUT[j]
+    gain_r = _PAN_LUT[j + 1]
+    for i in range(len(base)):
+        v = base[i] * coeffs[i]
+        v = (1.0 if v > 1.0 else v) * gain
+        v = 0.0 if v < 0.0 or not gate[i] else (1.0 if v > 1.0 else v)
+        out[i, 0] = v * gain_l
+        out[i, 1] = v * gain_r
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def stem_mix(
+    volume: float,
+    brightness: float,
+    distortion: float,
+    pan: float,
+    master_volume: float,
+    base: np.ndarray,
+    coeffs: np.ndarray,
+    gate: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """由音乐参数更新四个分轨(drums/bass/vocals/other)的调制系数并计算音量表
+
+    Args:
+        volume/brightness/distortion/pan: 音乐参数
+        master_volume: 引擎主音量
+        base: 分轨基础音量
+        coeffs: 分轨动态调制系数(原地更新)
+        gate: 静音/独奏掩码(bool)
+        out: 形状为 (分轨数, 2) 的输出音量表
+    """
+    master = 0.0 if volume < 0.0 else (1.0 if volume > 1.0 else volume)
+    brightness = 0.0 if brightness < 0.0 else (1.0 if brightness > 1.0 else brightness)
+    distortion = 0.0 if distortion < 0.0 else (1.0 if distortion > 1.0 else distortion)
+
+    push = master + 0.5 * distortion
+    coeffs[0] = 0.8 + 0.4 * (1.0 if push > 1.0 else push)  # drums
+    coeffs[1] = 0.7 + 0.5 * master  # bass
+    coeffs[2] = 0.9 + 0.1 * master  # vocals
+    coeffs[3] = 0.6 + 0.4 * brightness  # other
+
+    volume_matrix(base, coeffs, gate, master * master_volume, pan, out)
+
+
+@njit(cache=True, fastmath=True)
+def feedback_smooth(x: np.ndarray, gain: float, feedback: float, order: int) -> None:
+    """递归平滑(IIR 低通), 原地处理样本缓冲
+
+    x[i] = gain * x[i] + feedback * (x[i-1] + ... + x[i-order]),
+    前 order 个样本保持不变。order=1 且 gain + feedback = 1 时即一阶低通。
+    逐样本依赖上一输出, 无法以 numpy 向量化, 故在内核中循环。
+
+    Args:
+        x: 单声道样本缓冲(原地更新)
+        gain: 当前输入样本的权重
+        feedback: 每个历史输出样本的权重
+        order: 参与反馈的历史样本数
+    """
+    for i in range(order, len(x)):
+        acc = 0.0
+        for k in range(1, order + 1):
+            acc += x[i - k]
+        x[i] = gain * x[i] + feedback * acc
+
+
+def warmup() -> None:
+    """预热内核, 在 numba 模式下触发(或从缓存加载)编译, 避免首个周期卡顿"""
+    compute_params(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.12, new_state())
+    # 参数类型与分轨引擎的状态数组一致, 以命中同一份编译结果
+    stems = np.ones(4, dtype=np.float32)
+    stem_mix(
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        1.0,
+        stems,
+        stems.copy(),
+        np.ones(4, dtype=bool),
+        np.empty((4, 2), dtype=np.float32),
+    )
@@ -12,11 +12,78 @@ ACC遥测交互音乐配置模块
 
 import json
 import os
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
-
-
-@dataclass
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from typing import Any, Dict, Optional, Tuple, get_type_hints
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson 为可选依赖, 缺失时使用标准库 json
+    orjson = None
+
+from acc_telemetry.core.compat import DATACLASS_OPTIONS
+
+# 最近一次经本模块读写的配置文件: 绝对路径 -> (mtime_ns, 大小, 内容)
+_FILE_SNAPSHOTS: Dict[str, Tuple[int, int, bytes]] = {}
+
+
+def _remember(path: str, raw: bytes) -> None:
+    """记录文件当前的修改时间、大小与内容"""
+    st = os.stat(path)
+    _FILE_SNAPSHOTS[path] = (st.st_mtime_ns, st.st_size, raw)
+
+
+def _is_current(path: str, raw: bytes) -> bool:
+    """判断文件是否仍为上次记录的内容且与 raw 相同(外部修改过则视为不同)"""
+    snapshot = _FILE_SNAPSHOTS.get(path)
+    if snapshot is None or snapshot[2] != raw:
+        return False
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return (st.st_mtime_ns, st.st_size) == snapshot[:2]
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """将配置字典序列化为 UTF-8 编码的 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """从 JSON 字节串解析配置字典"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _convert(hint: Any, value: Any) -> Any:
+    """按字段类型注解还原 JSON 丢失的类型(嵌套配置、元组、整数键)"""
+    if is_dataclass(hint) and isinstance(value, dict):
+        return _from_dict(hint, value)
+    origin = getattr(hint, "__origin__", None)
+    if origin is tuple and isinstance(value, list):
+        return tuple(value)
+    if origin is dict and isinstance(value, dict):
+        key_type = hint.__args__[0]
+        if key_type is int:
+            return {int(k): v for k, v in value.items()}
+    return value
+
+
+def _from_dict(cls: Any, data: Dict[str, Any]) -> Any:
+    """依据数据类字段递归构建配置对象, 缺失字段保留默认值"""
+    hints = get_type_hints(cls)
+    kwargs = {
+        f.name: _convert(hints[f.name], data[f.name])
+        for f in fields(cls)
+        if f.name in data
+    }
+    return cls(**kwargs)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class RhythmConfig:
     """节奏配置类"""
 
@@ -45,7 +112,7 @@ class RhythmConfig:
     speed_sensitivity: float = 1.0
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MelodyConfig:
     """旋律配置类"""
 
@@ -71,7 +138,7 @@ class MelodyConfig:
     brake_sensitivity: float = 1.0
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class EffectsConfig:
     """音效配置类"""
 
@@ -100,7 +167,7 @@ class EffectsConfig:
     effects_sensitivity: float = 1.0
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AmbienceConfig:
     """氛围配置类"""
 
@@ -121,7 +188,7 @@ class AmbienceConfig:
     ambient_type: str = "engine_hum"  # engine_hum, wind, road
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AudioConfig:
     """音频系统总配置类"""
 
@@ -132,7 +199,7 @@ class AudioConfig:
     ambience: AmbienceConfig = field(default_factory=AmbienceConfig)
 
     # 音频引擎选择
-    audio_engine: str = "mock"  # "mock" 为默认引擎
+    audio_engine: str = "mock"  # "mock"(默认) / "stems"(pygame) / "sounddevice"
 
     # 全局音频设置
     master_volume: float = 0.8
@@ -199,75 +266,21 @@ class AudioConfig:
     def save_to_file(self, filepath: str) -> None:
         """保存配置到文件
 
+        与文件现有内容相同(且文件自上次读写后未被外部修改)时跳过写入。
+
         Args:
             filepath: 配置文件路径
         """
         try:
-            config_dict = {
-                "rhythm": {
-                    "bpm_range": self.rhythm.bpm_range,
-                    "rpm_range": self.rhythm.rpm_range,
-                    "beat_intensity_range": self.rhythm.beat_intensity_range,
-                    "speed_range": self.rhythm.speed_range,
-                    "gear_beat_patterns": self.rhythm.gear_beat_patterns,
-                    "rpm_sensitivity": self.rhythm.rpm_sensitivity,
-                    "speed_sensitivity": self.rhythm.speed_sensitivity,
-                },
-                "melody": {
-                    "pitch_range": self.melody.pitch_range,
-                    "base_pitch": self.melody.base_pitch,
-                    "steer_angle_range": self.melody.steer_angle_range,
-                    "steer_pitch_influence": self.melody.steer_pitch_influence,
-                    "throttle_volume_range": self.melody.throttle_volume_range,
-                    "brake_pitch_drop": self.melody.brake_pitch_drop,
-                    "scale_type": self.melody.scale_type,
-                    "key": self.melody.key,
-                    "steer_sensitivity": self.melody.steer_sensitivity,
-                    "throttle_sensitivity": self.melody.throttle_sensitivity,
-                    "brake_sensitivity": self.melody.brake_sensitivity,
-                },
-                "effects": {
-                    "pan_range": self.effects.pan_range,
-                    "lateral_g_range": self.effects.lateral_g_range,
-                    "distortion_range": self.effects.distortion_range,
-                    "wheel_slip_threshold": self.effects.wheel_slip_threshold,
-                    "reverb_range": self.effects.reverb_range,
-                    "speed_reverb_range": self.effects.speed_reverb_range,
-                    "filter_freq_range": self.effects.filter_freq_range,
-                    "engine_temp_range": self.effects.engine_temp_range,
-                    "enable_turbo_sound": self.effects.enable_turbo_sound,
-                    "enable_drs_sound": self.effects.enable_drs_sound,
-                    "enable_tc_abs_sound": self.effects.enable_tc_abs_sound,
-                    "effects_sensitivity": self.effects.effects_sensitivity,
-                },
-                "ambience": {
-                    "warmth_range": self.ambience.warmth_range,
-                    "temp_range": self.ambience.temp_range,
-                    "enable_lap_feedback": self.ambience.enable_lap_feedback,
-                    "best_lap_celebration": self.ambience.best_lap_celebration,
-                    "enable_warning_sounds": self.ambience.enable_warning_sounds,
-                    "warning_volume": self.ambience.warning_volume,
-                    "ambient_volume": self.ambience.ambient_volume,
-                    "ambient_type": self.ambience.ambient_type,
-                },
-                "global": {
-                    "audio_engine": self.audio_engine,
-                    "master_volume": self.master_volume,
-                    "sample_rate": self.sample_rate,
-                    "buffer_size": self.buffer_size,
-                    "update_rate": self.update_rate,
-                    "output_device": self.output_device,
-                    "enable_rhythm": self.enable_rhythm,
-                    "enable_melody": self.enable_melody,
-                    "enable_effects": self.enable_effects,
-                    "enable_ambience": self.enable_ambience,
-                    "current_preset": self.current_preset,
-                },
-            }
-
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            path = os.path.abspath(filepath)
+            raw = _dumps(asdict(self))
+            if _is_current(path, raw):
+                return
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(raw)
+            _remember(path, raw)
 
         except Exception as e:
             raise Exception(f"保存配置文件失败: {e}")
@@ -276,6 +289,9 @@ class AudioConfig:
     def load_from_file(cls, filepath: str) -> "AudioConfig":
         """从文件加载配置
 
+        缺失的字段使用默认值, 未知字段被忽略; 兼容旧版本写出的
+        "global" 分组格式, 分组内的值优先于同名的顶层字段。
+
         Args:
             filepath: 配置文件路径
 
@@ -283,110 +299,19 @@ class AudioConfig:
             AudioConfig: 加载的配置对象
         """
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                config_dict = json.load(f)
-
-            # 创建配置对象
-            config = cls()
-
-            # 加载节奏配置
-            if "rhythm" in config_dict:
-                rhythm_data = config_dict["rhythm"]
-                config.rhythm = RhythmConfig(
-                    bpm_range=tuple(rhythm_data.get("bpm_range", (60, 180))),
-                    rpm_range=tuple(rhythm_data.get("rpm_range", (1000, 8000))),
-                    beat_intensity_range=tuple(
-                        rhythm_data.get("beat_intensity_range", (0.3, 1.0))
-                    ),
-                    speed_range=tuple(rhythm_data.get("speed_range", (0, 300))),
-                    gear_beat_patterns=rhythm_data.get("gear_beat_patterns", {}),
-                    rpm_sensitivity=rhythm_data.get("rpm_sensitivity", 1.0),
-                    speed_sensitivity=rhythm_data.get("speed_sensitivity", 1.0),
-                )
-
-            # 加载旋律配置
-            if "melody" in config_dict:
-                melody_data = config_dict["melody"]
-                config.melody = MelodyConfig(
-                    pitch_range=tuple(melody_data.get("pitch_range", (36, 84))),
-                    base_pitch=melody_data.get("base_pitch", 60),
-                    steer_angle_range=tuple(
-                        melody_data.get("steer_angle_range", (-540, 540))
-                    ),
-                    steer_pitch_influence=melody_data.get("steer_pitch_influence", 12),
-                    throttle_volume_range=tuple(
-                        melody_data.get("throttle_volume_range", (0.3, 1.0))
-                    ),
-                    brake_pitch_drop=melody_data.get("brake_pitch_drop", 6),
-                    scale_type=melody_data.get("scale_type", "pentatonic"),
-                    key=melody_data.get("key", "C"),
-                    steer_sensitivity=melody_data.get("steer_sensitivity", 1.0),
-                    throttle_sensitivity=melody_data.get("throttle_sensitivity", 1.0),
-                    brake_sensitivity=melody_data.get("brake_sensitivity", 1.0),
-                )
-
-            # 加载音效配置
-            if "effects" in config_dict:
-                effects_data = config_dict["effects"]
-                config.effects = EffectsConfig(
-                    pan_range=tuple(effects_data.get("pan_range", (-1.0, 1.0))),
-                    lateral_g_range=tuple(
-                        effects_data.get("lateral_g_range", (-3.0, 3.0))
-                    ),
-                    distortion_range=tuple(
-                        effects_data.get("distortion_range", (0.0, 0.8))
-                    ),
-                    wheel_slip_threshold=effects_data.get("wheel_slip_threshold", 0.1),
-                    reverb_range=tuple(effects_data.get("reverb_range", (0.1, 0.6))),
-                    speed_reverb_range=tuple(
-                        effects_data.get("speed_reverb_range", (50, 250))
-                    ),
-                    filter_freq_range=tuple(
-                        effects_data.get("filter_freq_range", (200, 8000))
-                    ),
-                    engine_temp_range=tuple(
-                        effects_data.get("engine_temp_range", (70, 120))
-                    ),
-                    enable_turbo_sound=effects_data.get("enable_turbo_sound", True),
-                    enable_drs_sound=effects_data.get("enable_drs_sound", True),
-                    enable_tc_abs_sound=effects_data.get("enable_tc_abs_sound", True),
-                    effects_sensitivity=effects_data.get("effects_sensitivity", 1.0),
-                )
-
-            # 加载氛围配置
-            if "ambience" in config_dict:
-                ambience_data = config_dict["ambience"]
-                config.ambience = AmbienceConfig(
-                    warmth_range=tuple(ambience_data.get("warmth_range", (0.2, 0.9))),
-                    temp_range=tuple(ambience_data.get("temp_range", (70, 120))),
-                    enable_lap_feedback=ambience_data.get("enable_lap_feedback", True),
-                    best_lap_celebration=ambience_data.get(
-                        "best_lap_celebration", True
-                    ),
-                    enable_warning_sounds=ambience_data.get(
-                        "enable_warning_sounds", True
-                    ),
-                    warning_volume=ambience_data.get("warning_volume", 0.7),
-                    ambient_volume=ambience_data.get("ambient_volume", 0.3),
-                    ambient_type=ambience_data.get("ambient_type", "engine_hum"),
-                )
-
-            # 加载全局配置
-            if "global" in config_dict:
-                global_data = config_dict["global"]
-                config.audio_engine = global_data.get("audio_engine", "mock")
-                config.master_volume = global_data.get("master_volume", 0.8)
-                config.sample_rate = global_data.get("sample_rate", 44100)
-                config.buffer_size = global_data.get("buffer_size", 512)
-                config.update_rate = global_data.get("update_rate", 60)
-                config.output_device = global_data.get("output_device")
-                config.enable_rhythm = global_data.get("enable_rhythm", True)
-                config.enable_melody = global_data.get("enable_melody", True)
-                config.enable_effects = global_data.get("enable_effects", True)
-                config.enable_ambience = global_data.get("enable_ambience", True)
-                config.current_preset = global_data.get("current_preset", "default")
-
-            return config
+            path = os.path.abspath(filepath)
+            with open(path, "rb") as f:
+                raw = f.read()
+            _remember(path, raw)
+            config_dict = _loads(raw)
+
+            # 旧格式将全局设置放在 "global" 分组下; 分组通常是按旧文档手工添加的,
+            # 其中的值覆盖保存时写出的顶层默认值
+            legacy_global = config_dict.pop("global", None)
+            if isinstance(legacy_global, dict):
+                config_dict = {**config_dict, **legacy_global}
+
+            return _from_dict(cls, config_dict)
 
         except FileNotFoundError:
             # 文件不存在时返回默认配置
@@ -394,44 +319,59 @@ class AudioConfig:
         except Exception as e:
             raise Exception(f"加载配置文件失败: {e}")
 
-    def get_preset_configs(self) -> Dict[str, "AudioConfig"]:
+    @classmethod
+    def get_preset_configs(cls) -> Dict[str, "AudioConfig"]:
         """获取预设配置
 
+        预设在首次调用时构建并缓存, 之后各次调用共享同一批实例;
+        返回的配置应视为只读模板, 需修改时请先自行复制。
+
         Returns:
             Dict[str, AudioConfig]: 预设配置字典
         """
-        presets = {}
-
-        # 默认预设
-        presets["default"] = AudioConfig()
-
-        # 激进驾驶预设
-        aggressive = AudioConfig()
-        aggressive.rhythm.bpm_range = (80, 200)
-        aggressive.melody.steer_pitch_influence = 18
-        aggressive.effects.distortion_range = (0.0, 1.0)
-        aggressive.effects.effects_sensitivity = 1.5
-        presets["aggressive"] = aggressive
-
-        # 平静驾驶预设
-        calm = AudioConfig()
-        calm.rhythm.bpm_range = (50, 120)
-        calm.melody.steer_pitch_influence = 6
-        calm.effects.distortion_range = (0.0, 0.3)
-        calm.ambience.ambient_volume = 0.5
-        presets["calm"] = calm
-
-        # 赛车模式预设
-        racing = AudioConfig()
-        racing.rhythm.bpm_range = (100, 220)
-        racing.melody.throttle_sensitivity = 2.0
-        racing.effects.effects_sensitivity = 2.0
-        racing.ambience.enable_lap_feedback = True
-        racing.ambience.best_lap_celebration = True
-        presets["racing"] = racing
-
-        return presets
-
+        global _PRESET_CONFIGS
+        if _PRESET_CONFIGS is None:
+            _PRESET_CONFIGS = _build_preset_configs()
+        return dict(_PRESET_CONFIGS)
+
+
+def _build_preset_configs() -> Dict[str, AudioConfig]:
+    """构建全部预设配置"""
+    presets = {}
+
+    # 默认预设
+    presets["default"] = AudioConfig()
+
+    # 激进驾驶预设
+    aggressive = AudioConfig()
+    aggressive.rhythm.bpm_range = (80, 200)
+    aggressive.melody.steer_pitch_influence = 18
+    aggressive.effects.distortion_range = (0.0, 1.0)
+    aggressive.effects.effects_sensitivity = 1.5
+    presets["aggressive"] = aggressive
+
+    # 平静驾驶预设
+    calm = AudioConfig()
+    calm.rhythm.bpm_range = (50, 120)
+    calm.melody.steer_pitch_influence = 6
+    calm.effects.distortion_range = (0.0, 0.3)
+    calm.ambience.ambient_volume = 0.5
+    presets["calm"] = calm
+
+    # 赛车模式预设
+    racing = AudioConfig()
+    racing.rhythm.bpm_range = (100, 220)
+    racing.melody.throttle_sensitivity = 2.0
+    racing.effects.effects_sensitivity = 2.0
+    racing.ambience.enable_lap_feedback = True
+    racing.ambience.best_lap_celebration = True
+    presets["racing"] = racing
+
+    return presets
+
+
+# 预设配置缓存(首次调用 get_preset_configs 时构建)
+_PRESET_CONFIGS: Optional[Dict[str, AudioConfig]] = None
 
 # 默认配置实例
 DEFAULT_AUDIO_CONFIG = AudioConfig()
@@ -21,16 +21,124 @@
 
 from __future__ import annotations
 
-import math
+import dataclasses
+import functools
+import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, Optional
 
 from acc_telemetry.core.telemetry import ACCTelemetry, TelemetryData
 
+from . import _kernels
 from .audio_config import AudioConfig
 from .music_engine import MusicEngine
-from .music_mapper import MusicParameters
+from .music_mapper import (
+    TRIG_DRS,
+    TRIG_TURBO,
+    TRIG_WARN,
+    MusicParameters,
+    ParameterRing,
+)
+
+logger = logging.getLogger(__name__)
+
+# 循环错误日志的最小间隔: 持续异常时合并为每秒一条, 避免同步输出拖慢控制线程
+_ERROR_LOG_INTERVAL_NS = 1_000_000_000
+
+# 数值内核的驾驶输入字段(顺序与 compute_params 参数一致), 以及参与失真估计的四轮滑移字段
+_INPUT_FIELDS = ("speed", "throttle", "brake", "acceleration_x", "rpm")
+_SLIP_FIELDS = ("wheel_slip_fl", "wheel_slip_fr", "wheel_slip_rl", "wheel_slip_rr")
+
+# 参数填充函数模板: 控制器初始化时按遥测字段探测结果生成专用版本。
+# 输入读取展开为直接的属性访问表达式(缺失的滑移字段退化为 getattr 默认值),
+# 触发分支与位标志常量直接折叠进源码, 仅对非 float 注解的输入保留 float() 转换,
+# 热路径对象以闭包变量绑定, 每个周期不再有 self 属性查找与 "字段是否存在" 的判断。
+_FILL_TEMPLATE = '''
+def _bind(expr, ring, compute_params):
+    acquire = ring.acquire
+    publish = ring.publish
+
+    def _fill_music_params(d, now):
+        """更新表达引擎状态, 并将其与遥测写入参数环的下一个槽位"""
+        # 使用轮胎滑移估计粗糙的失真量, 横向 G(acceleration_x) 驱动声像
+        bpm, presence, pan, base_pitch, brightness, reverb, distortion = (
+            compute_params(
+                {speed},
+                {throttle},
+                {brake},
+                {acceleration_x},
+                {rpm},
+                ({slip_sum}) * 0.25,
+                now,
+                expr.smoothing_factor,
+                expr.state,
+            )
+        )
+
+        # 一次性触发事件(按位打包)
+        flags = {trig_warn} if d.fuel < 5.0 else 0
+{trigger_checks}
+        params = acquire()
+        params.bpm = bpm
+        params.volume = presence
+        params.base_pitch = base_pitch
+        params.pan = pan
+        params.brightness = brightness
+        params.reverb_amount = reverb
+        params.distortion_amount = distortion
+        params.flags = flags
+        params.timestamp = now
+        return publish()
+
+    return _fill_music_params
+'''
+
+_TURBO_CHECK = """
+        turbo_boost = d.turbo_boost
+        if turbo_boost and turbo_boost > 0.8:
+            flags |= {trig_turbo}
+"""
+
+_DRS_CHECK = """
+        if d.drs == 1:
+            flags |= {trig_drs}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_fill_music_params(
+    fields: FrozenSet[str], float_fields: FrozenSet[str]
+) -> Callable[..., Any]:
+    """按遥测字段可用性与类型生成参数填充函数的绑定工厂
+
+    Args:
+        fields: TelemetryData 提供的字段名
+        float_fields: 其中注解为 float 的字段, 读取后无需再做 float() 转换
+
+    Returns:
+        Callable: _bind(expr, ring, compute_params) -> 填充函数
+    """
+    reads = {
+        name: f"d.{name}" if name in float_fields else f"float(d.{name})"
+        for name in _INPUT_FIELDS
+    }
+    reads["slip_sum"] = " + ".join(
+        f"d.{name}" if name in fields else f"getattr(d, {name!r}, 0.0)"
+        for name in _SLIP_FIELDS
+    )
+    trigger_checks = ""
+    if "turbo_boost" in fields:
+        trigger_checks += _TURBO_CHECK.format(trig_turbo=TRIG_TURBO)
+    if "drs" in fields:
+        trigger_checks += _DRS_CHECK.format(trig_drs=TRIG_DRS)
+    source = _FILL_TEMPLATE.format(
+        trig_warn=TRIG_WARN, trigger_checks=trigger_checks, **reads
+    )
+
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<mbux_controller._fill_music_params>", "exec"), namespace)
+    return namespace["_bind"]
 
 
 class MusicalExpressionEngine:
@@ -42,16 +150,60 @@ class MusicalExpressionEngine:
 
     def __init__(self) -> None:
         """初始化表达引擎"""
-        # 表现力状态
-        self.energy_density = 0.5  # 能量密度(速度驱动)
-        self.rhythmic_push = 0.5  # 节拍推力(油门驱动)
-        self.breathing_space = 0.5  # 呼吸空间(刹车驱动)
-        self.spatial_width = 0.0  # 立体宽度(横向G驱动)
-        self.tonal_brightness = 0.5  # 音色亮度(转速驱动)
+        # 表现力状态向量(能量密度/节拍推力/呼吸空间/立体宽度/音色亮度)
+        self.state = _kernels.new_state()
 
         # 平滑滤波
         self.smoothing_factor = 0.12
 
+    # ---------------------------------------------------------------------
+    # 表现力状态(状态向量的具名视图)
+    # ---------------------------------------------------------------------
+    @property
+    def energy_density(self) -> float:
+        """能量密度(速度驱动)"""
+        return float(self.state[_kernels.ENERGY])
+
+    @energy_density.setter
+    def energy_density(self, value: float) -> None:
+        self.state[_kernels.ENERGY] = value
+
+    @property
+    def rhythmic_push(self) -> float:
+        """节拍推力(油门驱动)"""
+        return float(self.state[_kernels.PUSH])
+
+    @rhythmic_push.setter
+    def rhythmic_push(self, value: float) -> None:
+        self.state[_kernels.PUSH] = value
+
+    @property
+    def breathing_space(self) -> float:
+        """呼吸空间(刹车驱动)"""
+        return float(self.state[_kernels.BREATHING])
+
+    @breathing_space.setter
+    def breathing_space(self, value: float) -> None:
+        self.state[_kernels.BREATHING] = value
+
+    @property
+    def spatial_width(self) -> float:
+        """立体宽度(横向G驱动)"""
+        return float(self.state[_kernels.WIDTH])
+
+    @spatial_width.setter
+    def spatial_width(self, value: float) -> None:
+        self.state[_kernels.WIDTH] = value
+
+    @property
+    def tonal_brightness(self) -> float:
+        """音色亮度(转速驱动)"""
+        return float(self.state[_kernels.BRIGHTNESS])
+
+    @tonal_brightness.setter
+    def tonal_brightness(self, value: float) -> None:
+        self.state[_kernels.BRIGHTNESS] = value
+
     # ---------------------------------------------------------------------
     # 更新与取值
     # ---------------------------------------------------------------------
@@ -59,58 +211,31 @@ class MusicalExpressionEngine:
         self, speed: float, throttle: float, brake: float, lat_g: float, rpm: float
     ) -> None:
         """根据驾驶输入更新表现力状态"""
-        # 能量密度: 低速轻柔, 高速饱满
-        if speed <= 50:
-            target_energy = 0.2 + 0.3 * (speed / 50.0)
-        elif speed <= 230:
-            target_energy = 0.5 + 0.3 * ((speed - 50) / 70.0)
-        else:
-            target_energy = 0.8 + 0.2 * min(1.0, (speed - 230) / 80.0)
-        self.energy_density = self._smooth(self.energy_density, target_energy)
-
-        # 节拍推力: 油门
-        target_push = 0.3 + 0.7 * max(0.0, min(1.0, throttle))
-        self.rhythmic_push = self._smooth(self.rhythmic_push, target_push)
-
-        # 呼吸空间: 刹车越强, 给出更多呼吸
-        target_breathing = 1.0 - 0.4 * max(0.0, min(1.0, brake))
-        self.breathing_space = self._smooth(self.breathing_space, target_breathing)
-
-        # 立体宽度: 横向G
-        target_width = max(-1.0, min(1.0, lat_g / 3.0))
-        self.spatial_width = self._smooth(self.spatial_width, target_width, factor=0.08)
-
-        # 音色亮度: 转速
-        rpm_norm = max(0.0, min(1.0, (rpm - 2000) / 6000))
-        target_brightness = 0.4 + 0.6 * rpm_norm
-        self.tonal_brightness = self._smooth(self.tonal_brightness, target_brightness)
+        _kernels.update_expression(
+            self.state,
+            float(speed),
+            float(throttle),
+            float(brake),
+            float(lat_g),
+            float(rpm),
+            self.smoothing_factor,
+            0.08,
+        )
 
     def get_master_presence(self, speed: float) -> float:
         """基于速度的主存在感(替代传统主音量)"""
-        if speed <= 30:
-            base_presence = 0.25 + 0.15 * (speed / 30.0)
-        elif speed <= 80:
-            base_presence = 0.4 + 0.3 * ((speed - 30) / 50.0)
-        else:
-            progress = min(1.0, (speed - 80) / 60.0)
-            base_presence = 0.7 + 0.25 * math.sqrt(progress)
-        return max(0.2, min(0.95, base_presence * (0.8 + 0.2 * self.energy_density)))
-
-    def get_spatial_position(self, base_pan: float) -> float:
-        """将机械声像转化为空间表达"""
-        musical_pan = base_pan + self.spatial_width * 0.3
-        time_breath = 0.1 * math.sin(time.time() * 0.5)
-        final_position = musical_pan + time_breath
-        return max(-1.0, min(1.0, final_position))
+        return _kernels.master_presence(self.state[_kernels.ENERGY], float(speed))
 
-    # ---------------------------------------------------------------------
-    # 工具
-    # ---------------------------------------------------------------------
-    def _smooth(
-        self, current: float, target: float, factor: Optional[float] = None
-    ) -> float:
-        alpha = factor if factor is not None else self.smoothing_factor
-        return current * (1 - alpha) + target * alpha
+    def get_spatial_position(self, base_pan: float, t: Optional[float] = None) -> float:
+        """将机械声像转化为空间表达
+
+        Args:
+            base_pan: 机械声像
+            t: 循环时钟时间(秒), 未传入时读取单调时钟
+        """
+        if t is None:
+            t = time.monotonic()
+        return _kernels.spatial_position(self.state[_kernels.WIDTH], float(base_pan), t)
 
 
 class MBUXSoundDriveController:
@@ -136,12 +261,40 @@ class MBUXSoundDriveController:
         self.expr = MusicalExpressionEngine()
         self.telemetry = ACCTelemetry()
 
+        # 预分配参数环: 引擎与 UI 线程持有已发布对象的引用,
+        # 每个周期写入下一个槽位, 而非新建 MusicParameters
+        self.params_ring = ParameterRing()
+
+        # 遥测字段探测: 按字段可用性与类型生成专用的参数填充函数,
+        # 避免每个周期的 getattr、默认值处理与类型转换
+        telemetry_fields = dataclasses.fields(TelemetryData)
+        bind = _compile_fill_music_params(
+            frozenset(f.name for f in telemetry_fields),
+            frozenset(f.name for f in telemetry_fields if f.type in (float, "float")),
+        )
+        self._fill_music_params: Callable[[TelemetryData, float], MusicParameters] = (
+            bind(self.expr, self.params_ring, _kernels.compute_params)
+        )
+
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        # 停止信号: 循环中的等待均可被 stop() 立即打断
+        self._stop_event = threading.Event()
 
         # 状态属性
         self.paused_due_to_no_data = False
 
+        # 状态字典(含嵌套段)预先构建, get_status 原地更新字段
+        self._expr_status: Dict[str, float] = {}
+        self._config_status: Dict[str, Any] = {}
+        self._status: Dict[str, Any] = {
+            "is_running": False,
+            "paused_due_to_no_data": False,
+            "engine_status": None,
+            "expression_engine": self._expr_status,
+            "config": self._config_status,
+        }
+
     # ------------------------------------------------------------------
     # 生命周期
     # ------------------------------------------------------------------
@@ -150,6 +303,7 @@ class MBUXSoundDriveController:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self.engine.start()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
@@ -157,6 +311,7 @@ class MBUXSoundDriveController:
     def stop(self) -> None:
         """停止控制器并清理资源"""
         self._running = False
+        self._stop_event.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
         try:
@@ -168,59 +323,71 @@ class MBUXSoundDriveController:
         """
         获取控制器状态
 
+        返回的字典(含嵌套段)在调用间复用并原地更新, 需要保留快照时请自行复制。
+
         Returns:
             Dict[str, Any]: 控制器状态字典
         """
-        engine_status = self.engine.get_status()
-
-        return {
-            "is_running": self._running,
-            "paused_due_to_no_data": self.paused_due_to_no_data,
-            "engine_status": engine_status,
-            "expression_engine": {
-                "energy_density": self.expr.energy_density,
-                "rhythmic_push": self.expr.rhythmic_push,
-                "breathing_space": self.expr.breathing_space,
-                "spatial_width": self.expr.spatial_width,
-                "tonal_brightness": self.expr.tonal_brightness,
-            },
-            "config": {
-                "auto_pause_timeout": getattr(self.config, "auto_pause_timeout", 0.5),
-                "enable_fade_transition": getattr(
-                    self.config, "enable_fade_transition", True
-                ),
-                "fade_duration": getattr(self.config, "fade_duration", 0.2),
-                "update_rate": self.config.update_rate,
-            },
-        }
+        status = self._status
+        status["is_running"] = self._running
+        status["paused_due_to_no_data"] = self.paused_due_to_no_data
+        status["engine_status"] = self.engine.get_status()
+
+        expr = self.expr
+        expr_status = self._expr_status
+        expr_status["energy_density"] = expr.energy_density
+        expr_status["rhythmic_push"] = expr.rhythmic_push
+        expr_status["breathing_space"] = expr.breathing_space
+        expr_status["spatial_width"] = expr.spatial_width
+        expr_status["tonal_brightness"] = expr.tonal_brightness
+
+        config = self.config
+        config_status = self._config_status
+        config_status["auto_pause_timeout"] = config.auto_pause_timeout
+        config_status["enable_fade_transition"] = config.enable_fade_transition
+        config_status["fade_duration"] = config.fade_duration
+        config_status["update_rate"] = config.update_rate
+        return status
 
     # ------------------------------------------------------------------
     # 主循环
     # ------------------------------------------------------------------
     def _loop(self) -> None:
         """读取遥测并驱动音乐引擎"""
-        last_params_time = 0.0
         target_hz = max(10, int(self.config.update_rate))  # 防御性: 至少10Hz
-        interval = 1.0 / target_hz
+        interval_ns = 1_000_000_000 // target_hz
 
-        # 额外: 跟踪最近一次成功遥测时间, 控制自动暂停/恢复
-        last_data_ts = 0.0
+        # 额外: 跟踪最近一次成功遥测时间(单调时钟, 纳秒), 控制自动暂停/恢复
+        last_data_ns = 0
 
         # 使用配置化的超时时间
-        pause_timeout = getattr(self.config, "auto_pause_timeout", 0.5)
-        enable_fade = getattr(self.config, "enable_fade_transition", True)
-        fade_duration = getattr(self.config, "fade_duration", 0.2)
+        pause_timeout = self.config.auto_pause_timeout
+        pause_timeout_ns = int(pause_timeout * 1e9)
+        enable_fade = self.config.enable_fade_transition
+        fade_duration = self.config.fade_duration
+
+        # 预热数值内核(numba 模式下触发编译), 避免首个周期卡顿
+        _kernels.warmup()
+
+        # 基于单调时钟的绝对截止时间调度, 不受系统校时影响且不会累积漂移;
+        # 等待通过停止事件完成, stop() 无需等到当前周期结束
+        wait = self._stop_event.wait
+        deadline_ns = time.monotonic_ns()
+
+        # 循环错误计数与上次输出时间(用于限速日志)
+        error_count = 0
+        last_error_log_ns = -_ERROR_LOG_INTERVAL_NS
 
         while self._running:
             try:
                 data = self.telemetry.get_telemetry()
-                now = time.time()
+                now_ns = time.monotonic_ns()
 
                 if data is None:
                     # 无遥测数据: 在配置的超时时间后暂停
                     if (
-                        now - last_data_ts
-                    ) > pause_timeout and not self.paused_due_to_no_data:
+                        now_ns - last_data_ns
+                    ) > pause_timeout_ns and not self.paused_due_to_no_data:
                         if enable_fade:
                             self.engine.fade_pause(fade_duration)
                         else:
@@ -228,15 +395,16 @@ class MBUXSoundDriveController:
                         self.paused_due_to_no_data = True
 
                         # 可选的调试日志
-                        if getattr(self.config, "enable_verbose_logging", False):
+                        if self.config.enable_verbose_logging:
                             print(
                                 f"[MBUXController] 因无遥测数据暂停音乐 (超时: {pause_timeout}s)"
                             )
-                    time.sleep(0.05)
+                    wait(0.05)
+                    deadline_ns = time.monotonic_ns()
                     continue
 
                 # 有数据: 如因无数据而暂停过, 则恢复
-                last_data_ts = now
+                last_data_ns = now_ns
                 if self.paused_due_to_no_data:
                     if enable_fade:
                         self.engine.fade_resume(fade_duration)
@@ -245,88 +413,33 @@ class MBUXSoundDriveController:
                     self.paused_due_to_no_data = False
 
                     # 可选的调试日志
-                    if getattr(self.config, "enable_verbose_logging", False):
+                    if self.config.enable_verbose_logging:
                         print("[MBUXController] 遥测恢复，恢复音乐播放")
 
-                # 更新表现力
-                self._update_expression(data)
-
-                # 产生参数并推送
-                params = self._make_music_params(data)
-                params.timestamp = now
+                # 更新表现力, 产生参数并推送
+                now = now_ns * 1e-9
+                params = self._fill_music_params(data, now)
                 self.engine.update_parameters(params)
                 self.engine.set_master_volume(params.volume)
 
-                # 控制速率
-                elapsed = now - last_params_time
-                sleep_time = max(0.0, interval - elapsed)
-                time.sleep(sleep_time)
-                last_params_time = now
+                # 控制速率: 推进截止时间, 仅休眠剩余部分
+                deadline_ns += interval_ns
+                sleep_ns = deadline_ns - time.monotonic_ns()
+                if sleep_ns > 0:
+                    wait(sleep_ns * 1e-9)
+                else:
+                    # 已落后于节拍, 重新对齐, 避免连续追赶
+                    deadline_ns = time.monotonic_ns()
 
             except Exception as e:
-                # 简单打印并继续, 避免线程退出
-                print(f"[MBUXController] 循环错误: {e}")
-                time.sleep(0.05)
-
-    # ------------------------------------------------------------------
-    # 计算逻辑
-    # ------------------------------------------------------------------
-    def _update_expression(self, d: TelemetryData) -> None:
-        """根据遥测更新表现力引擎"""
-        lat_g = d.acceleration_x  # 横向 G
-        self.expr.update(d.speed, d.throttle, d.brake, lat_g, float(d.rpm))
-
-    def _make_music_params(self, d: TelemetryData) -> MusicParameters:
-        """将表达引擎状态与遥测映射为 MusicParameters"""
-        # 1) BPM: 结合速度与转速
-        speed_norm = max(0.0, min(1.0, d.speed / 260.0))
-        rpm_norm = max(0.0, min(1.0, (d.rpm - 2000) / 6000))
-        bpm = 90.0 + 50.0 * speed_norm + 20.0 * rpm_norm
-
-        # 2) 主存在感与空间
-        presence = self.expr.get_master_presence(d.speed)
-        base_pan = d.acceleration_x / 4.0
-        pan = self.expr.get_spatial_position(base_pan)
-
-        # 3) 基础音高: 以 C4 为基, 随转速轻微上扬
-        base_pitch = 58 + int(8 * rpm_norm)  # 约 C#4 ~ G4
-
-        # 4) 音色亮度/混响/失真
-        brightness = self.expr.tonal_brightness
-        reverb_amount = 0.15 + 0.5 * (
-            1.0 - self.expr.breathing_space
-        )  # 刹车更多 -> 空间感更强
-
-        # 使用轮胎滑移估计粗糙的失真量(如无该值, 也不会报错)
-        slip_vals = [
-            getattr(d, n, 0.0)
-            for n in (
-                "wheel_slip_fl",
-                "wheel_slip_fr",
-                "wheel_slip_rl",
-                "wheel_slip_rr",
-            )
-        ]
-        slip_avg = sum(slip_vals) / len(slip_vals)
-        distortion_amount = max(0.0, min(0.8, slip_avg))
-
-        # 5) 一次性触发事件
-        trigger_turbo = bool(d.turbo_boost and d.turbo_boost > 0.8)
-        trigger_drs = bool(getattr(d, "drs", 0) == 1)
-        warn_low_fuel = bool(d.fuel < 5.0)
-        trigger_warning = warn_low_fuel
-
-        # 组装
-        return MusicParameters(
-            bpm=bpm,
-            volume=presence,
-            base_pitch=base_pitch,
-            pan=pan,
-            brightness=brightness,
-            reverb_amount=max(0.0, min(1.0, reverb_amount)),
-            distortion_amount=max(0.0, min(1.0, distortion_amount)),
-            trigger_turbo_sound=trigger_turbo,
-            trigger_drs_sound=trigger_drs,
-            trigger_warning_sound=trigger_warning,
-            trigger_celebration=False,
-        )
+                # 限速记录并继续, 避免线程退出
+                error_count += 1
+                error_ns = time.monotonic_ns()
+                if error_ns - last_error_log_ns >= _ERROR_LOG_INTERVAL_NS:
+                    logger.warning(
+                        "[MBUXController] 循环错误(近 %d 次): %s", error_count, e
+                    )
+                    error_count = 0
+                    last_error_log_ns = error_ns
+                wait(0.05)
+                deadline_ns = time.monotonic_ns()
@@ -11,14 +11,114 @@ ACC交互音乐引擎
 日期: 2024
 """
 
+import functools
+import importlib.util
 import os
+import queue
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from . import _kernels
 from .audio_config import AudioConfig
-from .music_mapper import MusicParameters
+from .music_mapper import (
+    TRIG_CELEBRATE,
+    TRIG_DRS,
+    TRIG_TURBO,
+    TRIG_WARN,
+    MusicParameters,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_available(name: str) -> bool:
+    """检查可选依赖是否可导入(仅查找模块规格, 不执行导入), 结果缓存"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _channel_volume(channel: Any) -> float:
+    """读取声道当前音量(兼容返回标量或左右声道元组的实现)"""
+    volume = channel.get_volume()
+    return volume[0] if hasattr(volume, "__getitem__") else volume
+
+
+# MusicEngine 转发的可选后端方法, 在绑定后端时一次性解析
+_OPTIONAL_BACKEND_METHODS = (
+    "set_stem_volume",
+    "set_stem_mute",
+    "set_stem_solo",
+    "fade_pause",
+    "fade_resume",
+    "update_config",
+)
+
+
+# 分轨调制输入的变化检测阈值(约为 8 位音量的量化步长)
+_MOD_EPSILON = 1.0 / 512
+
+
+# 一次性触发位 → 音效名称
+_TRIGGER_NAMES = {
+    TRIG_TURBO: "涡轮",
+    TRIG_DRS: "DRS",
+    TRIG_WARN: "警告",
+    TRIG_CELEBRATE: "庆祝",
+}
+
+
+# 触发日志环: 热路径只追加 (标签, 触发位), 由后台线程负责格式化与 print,
+# 避免控制线程在 stdout 锁与控制台写入上阻塞; 积压超过容量时丢弃最旧条目
+_trigger_log: "deque[Tuple[str, int]]" = deque(maxlen=256)
+_trigger_wakeup = threading.Event()
+_trigger_flusher: Optional[threading.Thread] = None
+_trigger_flusher_lock = threading.Lock()
+
+
+def _flush_trigger_log() -> None:
+    """后台线程: 等待新条目并按位序逐个输出触发日志"""
+    while True:
+        _trigger_wakeup.wait()
+        _trigger_wakeup.clear()
+        while _trigger_log:
+            tag, flags = _trigger_log.popleft()
+            while flags:
+                bit = flags & -flags  # 最低置位
+                print(f"[{tag}] 触发{_TRIGGER_NAMES[bit]}音效")
+                flags ^= bit
+
+
+def _report_triggers(tag: str, flags: int) -> None:
+    """记录一次触发(当前以日志代替音效), 首次调用时启动输出线程"""
+    global _trigger_flusher
+    if _trigger_flusher is None:
+        with _trigger_flusher_lock:
+            if _trigger_flusher is None:
+                _trigger_flusher = threading.Thread(
+                    target=_flush_trigger_log, daemon=True
+                )
+                _trigger_flusher.start()
+    _trigger_log.append((tag, flags))
+    _trigger_wakeup.set()
+
+
+# 默认示例分轨目录: <project_root>/songs/htdemucs/lose my mind
+_DEFAULT_STEMS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "songs",
+    "htdemucs",
+    "lose my mind",
+)
+
+# 声道音量写入的最小步长: 低于 SDL 混音精度的变化不再跨越 FFI 写入
+_VOLUME_WRITE_STEP = 1.0 / 256
 
 
 class AudioEngine(ABC):
@@ -146,11 +246,36 @@ class MusicEngine(AudioEngine):
         self.on_beat_callback: Optional[Callable] = None
         self.on_error_callback: Optional[Callable] = None
 
+        # 状态字典预先构建, get_status 原地更新字段
+        self._status: Dict[str, Any] = {
+            "is_playing": False,
+            "is_initialized": False,
+            "is_paused": False,
+            "current_bpm": 0,
+            "backend_type": "",
+            "backend_status": None,
+        }
+
         # 根据配置选择音频后端
-        self._audio_backend = self._create_audio_backend()
+        self._caps: Dict[str, Optional[Callable]] = {}
+        self._bind_backend(self._create_audio_backend())
 
         print(f"[音乐引擎] 使用音频后端: {type(self._audio_backend).__name__}")
 
+    def _bind_backend(self, backend: AudioEngine) -> None:
+        """绑定音频后端, 并一次性解析其可选能力(分轨控制/淡入淡出等)
+
+        每次替换后端时都应经由此处, 以保证 _caps 与当前后端一致。
+
+        Args:
+            backend: 音频后端实例
+        """
+        self._audio_backend = backend
+        self._status["backend_type"] = type(backend).__name__
+        self._caps = {
+            name: getattr(backend, name, None) for name in _OPTIONAL_BACKEND_METHODS
+        }
+
     def _create_audio_backend(self) -> AudioEngine:
         """
         根据配置创建音频后端
@@ -170,6 +295,12 @@ class MusicEngine(AudioEngine):
             except Exception as e:
                 print(f"[音乐引擎] 创建 Pygame 分轨后端失败, 回退为模拟后端: {e}")
 
+        if engine_name in ("sounddevice", "sounddevice_stems"):
+            try:
+                return SounddeviceStemsAudioEngine(self.config)
+            except Exception as e:
+                print(f"[音乐引擎] 创建 sounddevice 分轨后端失败, 回退为模拟后端: {e}")
+
         # 默认使用模拟后端
         print("[音乐引擎] 使用模拟音频引擎")
         return MockAudioEngine(self.config)
@@ -286,8 +417,9 @@ class MusicEngine(AudioEngine):
             stem: 分轨名称 ('drums', 'bass', 'vocals', 'other')
             volume: 音量 (0.0-2.0，1.0为默认)
         """
-        if hasattr(self._audio_backend, "set_stem_volume"):
-            self._audio_backend.set_stem_volume(stem, volume)
+        fn = self._caps["set_stem_volume"]
+        if fn is not None:
+            fn(stem, volume)
 
     def set_stem_mute(self, stem: str, muted: bool) -> None:
         """
@@ -297,8 +429,9 @@ class MusicEngine(AudioEngine):
             stem: 分轨名称
             muted: 是否静音
         """
-        if hasattr(self._audio_backend, "set_stem_mute"):
-            self._audio_backend.set_stem_mute(stem, muted)
+        fn = self._caps["set_stem_mute"]
+        if fn is not None:
+            fn(stem, muted)
 
     def set_stem_solo(self, stem: str, solo: bool) -> None:
         """
@@ -308,8 +441,9 @@ class MusicEngine(AudioEngine):
             stem: 分轨名称
             solo: 是否独奏
         """
-        if hasattr(self._audio_backend, "set_stem_solo"):
-            self._audio_backend.set_stem_solo(stem, solo)
+        fn = self._caps["set_stem_solo"]
+        if fn is not None:
+            fn(stem, solo)
 
     def fade_pause(self, duration: float = 0.2) -> None:
         """
@@ -318,8 +452,9 @@ class MusicEngine(AudioEngine):
         Args:
             duration: 淡出时长（秒）
         """
-        if hasattr(self._audio_backend, "fade_pause"):
-            self._audio_backend.fade_pause(duration)
+        fn = self._caps["fade_pause"]
+        if fn is not None:
+            fn(duration)
         else:
             self.pause()
 
@@ -330,8 +465,9 @@ class MusicEngine(AudioEngine):
         Args:
             duration: 淡入时长（秒）
         """
-        if hasattr(self._audio_backend, "fade_resume"):
-            self._audio_backend.fade_resume(duration)
+        fn = self._caps["fade_resume"]
+        if fn is not None:
+            fn(duration)
         else:
             self.resume()
 
@@ -344,26 +480,26 @@ class MusicEngine(AudioEngine):
         """
         self.config = config
         # 将配置更新传递给后端
-        if hasattr(self._audio_backend, "update_config"):
-            self._audio_backend.update_config(config)
+        fn = self._caps["update_config"]
+        if fn is not None:
+            fn(config)
 
     def get_status(self) -> Dict[str, Any]:
         """
         获取引擎状态
 
+        返回的字典在调用间复用并原地更新, 需要保留快照时请自行复制。
+
         Returns:
             Dict[str, Any]: 状态信息字典
         """
-        backend_status = self._audio_backend.get_status()
-
-        return {
-            "is_playing": self.is_playing,
-            "is_initialized": self.is_initialized,
-            "is_paused": self.is_paused(),
-            "current_bpm": self.current_params.bpm if self.current_params else 0,
-            "backend_type": type(self._audio_backend).__name__,
-            "backend_status": backend_status,
-        }
+        status = self._status
+        status["is_playing"] = self.is_playing
+        status["is_initialized"] = self.is_initialized
+        status["is_paused"] = self.is_paused()
+        status["current_bpm"] = self.current_params.bpm if self.current_params else 0
+        status["backend_status"] = self._audio_backend.get_status()
+        return status
 
     def cleanup(self) -> None:
         """
@@ -394,15 +530,40 @@ class MockAudioEngine(AudioEngine):
         self.master_volume = 1.0
         self.current_params: Optional[MusicParameters] = None
 
-        # 模拟播放线程
-        self.playback_thread: Optional[threading.Thread] = None
-        self.beat_count = 0
+        # 模拟节拍: 不使用播放线程, 而是记录已结算的节拍数与计时起点,
+        # 读取 beat_count 时按 (当前时间 - 起点) x BPM / 60 惰性补算
+        self._accum_beats = 0.0
+        self._beat_anchor: Optional[float] = None  # None 表示节拍未在推进
+        self._beat_bpm = 0.0
 
         # 暂停状态
         self._paused = False
 
+        # 状态字典预先构建, get_status 原地更新字段
+        self._status: Dict[str, Any] = {
+            "is_running": False,
+            "master_volume": self.master_volume,
+            "beat_count": 0,
+            "current_bpm": 0,
+        }
+
         print("[模拟音频引擎] 已初始化")
 
+    @property
+    def beat_count(self) -> int:
+        """已播放的模拟节拍数"""
+        beats = self._accum_beats
+        if self._beat_anchor is not None:
+            beats += (time.perf_counter() - self._beat_anchor) * self._beat_bpm / 60.0
+        return int(beats)
+
+    def _settle_beats(self, running: bool) -> None:
+        """将起点至今的节拍计入累计值, 并按 running 决定是否继续计时"""
+        now = time.perf_counter()
+        if self._beat_anchor is not None:
+            self._accum_beats += (now - self._beat_anchor) * self._beat_bpm / 60.0
+        self._beat_anchor = now if running else None
+
     def start(self) -> bool:
         """
         启动模拟音频引擎
@@ -414,13 +575,8 @@ class MockAudioEngine(AudioEngine):
             return True
 
         self.is_running = True
-        self.beat_count = 0
-
-        # 启动模拟播放线程
-        self.playback_thread = threading.Thread(
-            target=self._mock_playback_loop, daemon=True
-        )
-        self.playback_thread.start()
+        self._accum_beats = 0.0
+        self._beat_anchor = None if self._paused else time.perf_counter()
 
         print("[模拟音频引擎] 已启动")
         return True
@@ -429,16 +585,19 @@ class MockAudioEngine(AudioEngine):
         """
         停止模拟音频引擎
         """
+        self._settle_beats(running=False)
         self.is_running = False
         print("[模拟音频引擎] 已停止")
 
     def pause(self) -> None:
         """暂停(模拟)"""
+        self._settle_beats(running=False)
         self._paused = True
         print("[模拟音频引擎] 已暂停")
 
     def resume(self) -> None:
         """恢复(模拟)"""
+        self._settle_beats(running=self.is_running)
         self._paused = False
         print("[模拟音频引擎] 已恢复")
 
@@ -455,15 +614,14 @@ class MockAudioEngine(AudioEngine):
         """
         self.current_params = params
 
+        # BPM 变化时先按旧 BPM 结算节拍
+        if params.bpm != self._beat_bpm:
+            self._settle_beats(running=self._beat_anchor is not None)
+            self._beat_bpm = params.bpm
+
         # 模拟参数处理
-        if params.trigger_turbo_sound:
-            print("[模拟音频] 触发涡轮音效")
-        if params.trigger_drs_sound:
-            print("[模拟音频] 触发DRS音效")
-        if params.trigger_warning_sound:
-            print("[模拟音频] 触发警告音效")
-        if params.trigger_celebration:
-            print("[模拟音频] 触发庆祝音效")
+        if params.flags:
+            _report_triggers("模拟音频", params.flags)
 
     def set_master_volume(self, volume: float) -> None:
         """
@@ -472,22 +630,25 @@ class MockAudioEngine(AudioEngine):
         Args:
             volume: 音量值 (0.0 到 1.0)
         """
-        self.master_volume = max(0.0, min(1.0, volume))
+        # 控制器每周期调用, 以条件表达式钳位, 省去 max/min 的函数调用
+        self.master_volume = 0.0 if volume < 0.0 else (1.0 if volume > 1.0 else volume)
         print(f"[模拟音频] 主音量设置为: {self.master_volume:.2f}")
 
     def get_status(self) -> Dict[str, Any]:
         """
         获取引擎状态
 
+        返回的字典在调用间复用并原地更新, 需要保留快照时请自行复制。
+
         Returns:
             Dict[str, Any]: 状态信息字典
         """
-        return {
-            "is_running": self.is_running,
-            "master_volume": self.master_volume,
-            "beat_count": self.beat_count,
-            "current_bpm": self.current_params.bpm if self.current_params else 0,
-        }
+        status = self._status
+        status["is_running"] = self.is_running
+        status["master_volume"] = self.master_volume
+        status["beat_count"] = self.beat_count
+        status["current_bpm"] = self.current_params.bpm if self.current_params else 0
+        return status
 
     def cleanup(self) -> None:
         """
@@ -496,41 +657,6 @@ class MockAudioEngine(AudioEngine):
         self.stop()
         print("[模拟音频引擎] 资源已清理")
 
-    def _mock_playback_loop(self) -> None:
-        """
-        模拟播放循环
-        """
-        print("[模拟音频引擎] 播放循环已启动")
-
-        while self.is_running:
-            try:
-                if self._paused:
-                    time.sleep(0.05)
-                    continue
-                if self.current_params is None:
-                    time.sleep(0.1)
-                    continue
-
-                # 模拟节拍
-                beat_interval = 60.0 / self.current_params.bpm
-                time.sleep(beat_interval)
-
-                self.beat_count += 1
-
-                # 每10个节拍打印一次状态
-                if self.beat_count % 10 == 0:
-                    print(
-                        f"[模拟音频] 节拍: {self.beat_count}, "
-                        f"BPM: {self.current_params.bpm:.1f}, "
-                        f"音量: {self.current_params.volume:.2f}"
-                    )
-
-            except Exception as e:
-                print(f"[模拟音频] 播放循环错误: {e}")
-                time.sleep(0.1)
-
-        print("[模拟音频引擎] 播放循环已停止")
-
 
 class PygameStemsAudioEngine(AudioEngine):
     """基于 pygame.mixer 的分轨音频引擎
@@ -544,12 +670,21 @@ class PygameStemsAudioEngine(AudioEngine):
     - 若找不到分轨文件, 将抛出异常, 并在上层回退为模拟引擎。
     """
 
+    # 后端所需的可选依赖, 构造时仅检查可用性而不导入
+    _BACKEND_MODULES: Tuple[str, ...] = ("pygame",)
+    # 状态中报告的后端名称
+    _BACKEND_NAME = "pygame_stems"
+
     def __init__(self, config: AudioConfig) -> None:
         """初始化分轨音频引擎
 
         Args:
             config (AudioConfig): 音频配置
         """
+        missing = [m for m in self._BACKEND_MODULES if not _module_available(m)]
+        if missing:
+            raise RuntimeError(f"缺少音频后端依赖: {', '.join(missing)}")
+
         self.config = config
         self.is_running = False
         self.master_volume = 1.0
@@ -558,30 +693,44 @@ class PygameStemsAudioEngine(AudioEngine):
         # 资源
         self._channels: Dict[str, Any] = {}
         self._sounds: Dict[str, Any] = {}
+        # 已加载声音对应的分轨文件路径, 目录变化后再次启动时据此重新加载
+        self._sound_paths: Tuple[str, ...] = ()
+
+        # 分轨顺序固定, 各分轨状态以同序的定长向量保存, 音量/声像一次向量运算完成
+        self._stem_order = ("drums", "bass", "vocals", "other")
+        self._stem_index = {name: i for i, name in enumerate(self._stem_order)}
 
         # 分轨基础音量(为动态调制留余量)
-        self._base_volumes: Dict[str, float] = {
-            "drums": 0.8,
-            "bass": 0.75,
-            "vocals": 0.40,
-            "other": 0.65,
-        }
+        self._base_vol_arr = np.array([0.8, 0.75, 0.40, 0.65], dtype=np.float32)
+        # 最近一次参数更新得到的动态调制系数
+        self._stem_coeffs = np.ones(len(self._stem_order), dtype=np.float32)
+        # 静音/独奏标志, 及二者合成的掩码(仅在标志变化时重算)
+        self._stem_muted = np.zeros(len(self._stem_order), dtype=bool)
+        self._stem_solo = np.zeros(len(self._stem_order), dtype=bool)
+        self._gate = np.ones(len(self._stem_order), dtype=bool)
+        # 音量计算复用的缓冲区, 参数更新路径上不再分配数组
+        self._matrix_buf = np.empty((len(self._stem_order), 2), dtype=np.float32)
+        # 最近一次经 _apply_matrix 写入声道的音量, 负值表示未知(必须重写)
+        self._applied_lr = np.full((len(self._stem_order), 2), -1.0, dtype=np.float32)
+        # 最近一次实际应用的调制输入 (volume, brightness, distortion, pan, 主音量)
+        self._last_mod: Optional[Tuple[float, ...]] = None
 
         # 暂停状态
         self._paused = False
 
+        # pygame 模块, 在 start() 中导入后缓存
+        self._pg: Any = None
+
+        # 淡入淡出由单个常驻工作线程按命令队列执行(首次淡入淡出时启动)
+        self._fade_cmds: "queue.SimpleQueue[Tuple[bool, np.ndarray, float]]" = (
+            queue.SimpleQueue()
+        )
+        self._fade_thread: Optional[threading.Thread] = None
+
         # 解析分轨目录
         self.stems_dir = os.environ.get("ACC_STEMS_DIR", "").strip()
-        if not self.stems_dir:
-            # 默认示例目录: <project_root>/songs/htdemucs/lose my mind
-            project_root = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            )
-            default_dir = os.path.join(
-                project_root, "songs", "htdemucs", "lose my mind"
-            )
-            if os.path.isdir(default_dir):
-                self.stems_dir = default_dir
+        if not self.stems_dir and os.path.isdir(_DEFAULT_STEMS_DIR):
+            self.stems_dir = _DEFAULT_STEMS_DIR
 
         if not self.stems_dir:
             raise RuntimeError(
@@ -590,6 +739,18 @@ class PygameStemsAudioEngine(AudioEngine):
                 "drums.wav/bass.wav/vocals.wav/other.wav 的目录。"
             )
 
+        # 分轨文件名(按 _stem_order), 完整路径在 start() 时按当前目录拼接
+        self._stem_files = tuple(f"{n}.wav" for n in self._stem_order)
+
+        # 状态字典预先构建, get_status 原地更新字段
+        self._status: Dict[str, Any] = {
+            "is_running": False,
+            "backend": self._BACKEND_NAME,
+            "stems_dir": self.stems_dir,
+            "master_volume": self.master_volume,
+            "has_params": False,
+        }
+
     # ------------------------------------------------------------------
     # 生命周期
     # ------------------------------------------------------------------
@@ -598,18 +759,15 @@ class PygameStemsAudioEngine(AudioEngine):
         if self.is_running:
             return True
 
-        # 延迟导入, 避免模块级依赖导致导入失败
+        # 延迟导入, 避免模块级依赖导致导入失败; 模块对象缓存在实例上供后续控制调用
         try:
             import pygame  # type: ignore
         except Exception as e:
             raise RuntimeError(f"导入 pygame 失败: {e}")
+        self._pg = pygame
 
         # 校验分轨文件
-        required = ["drums", "bass", "vocals", "other"]
-        for n in required:
-            p = os.path.join(self.stems_dir, f"{n}.wav")
-            if not os.path.isfile(p):
-                raise FileNotFoundError(f"未找到分轨文件: {p}")
+        paths = self._stem_paths()
 
         # 初始化音频
         try:
@@ -638,19 +796,23 @@ class PygameStemsAudioEngine(AudioEngine):
         except Exception as e:
             raise RuntimeError(f"初始化 pygame 音频失败: {e}")
 
-        # 加载声音与分配声道
-        try:
-            for n in required:
-                self._sounds[n] = pygame.mixer.Sound(
-                    os.path.join(self.stems_dir, f"{n}.wav")
-                )
-            for idx, n in enumerate(required):
-                self._channels[n] = pygame.mixer.Channel(idx)
-        except Exception as e:
-            raise RuntimeError(f"加载分轨失败: {e}")
+        # 加载声音与分配声道: 各分轨的读取与解码在 SDL 内释放 GIL, 并行加载;
+        # stop() 只停止混音器, 再次启动且分轨路径未变时沿用已加载的声音与声道
+        if paths != self._sound_paths:
+            try:
+                with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+                    sounds = list(ex.map(pygame.mixer.Sound, paths))
+                self._sounds = dict(zip(self._stem_order, sounds))
+                for idx, n in enumerate(self._stem_order):
+                    self._channels[n] = pygame.mixer.Channel(idx)
+            except Exception as e:
+                raise RuntimeError(f"加载分轨失败: {e}")
+            self._sound_paths = paths
+            self._status["stems_dir"] = self.stems_dir
 
-        # 应用初始音量
-        self._apply_all_volumes(pan=0.0)
+        # 应用初始音量(新声道, 全部重写)
+        self._applied_lr.fill(-1.0)
+        self._apply_matrix(self._compute_volume_matrix(pan=0.0))
 
         # 循环播放
         for n, snd in self._sounds.items():
@@ -665,9 +827,7 @@ class PygameStemsAudioEngine(AudioEngine):
         if not self.is_running:
             return
         try:
-            import pygame  # type: ignore
-
-            pygame.mixer.stop()
+            self._pg.mixer.stop()
         except Exception:
             pass
         finally:
@@ -683,45 +843,59 @@ class PygameStemsAudioEngine(AudioEngine):
             return
         self.current_params = params
 
-        # 计算每轨目标音量(0-1), 融合主存在感(volume)
-        master = max(0.0, min(1.0, params.volume))
-        brightness = max(0.0, min(1.0, params.brightness))
-        distortion = max(0.0, min(1.0, params.distortion_amount))
-
-        vol_map: Dict[str, float] = {
-            "drums": self._base_volumes["drums"]
-            * (0.8 + 0.4 * min(1.0, master + 0.5 * distortion)),
-            "bass": self._base_volumes["bass"] * (0.7 + 0.5 * master),
-            "vocals": self._base_volumes["vocals"] * (0.9 + 0.1 * master),
-            "other": self._base_volumes["other"] * (0.6 + 0.4 * brightness),
-        }
+        # 暂停期间声道不出声, 只记录最新参数供恢复时使用(恢复后强制完整重算)
+        if self._paused:
+            return
 
-        # 应用主存在感与声像
-        self._apply_all_volumes(pan=params.pan, master=master, per_stem=vol_map)
+        # 变化检测: 调制输入相对上次应用值均小于阈值且无触发时, 跳过本次重算
+        mod = (
+            params.volume,
+            params.brightness,
+            params.distortion_amount,
+            params.pan,
+            self.master_volume,
+        )
+        last = self._last_mod
+        if (
+            last is not None
+            and not params.flags
+            and all(abs(a - b) < _MOD_EPSILON for a, b in zip(mod, last))
+        ):
+            return
+        self._last_mod = mod
+
+        # 计算每轨目标音量(0-1), 融合主存在感(volume), 并应用声像
+        matrix = self._matrix_buf
+        _kernels.stem_mix(
+            params.volume,
+            params.brightness,
+            params.distortion_amount,
+            params.pan,
+            self.master_volume,
+            self._base_vol_arr,
+            self._stem_coeffs,
+            self._gate,
+            matrix,
+        )
+        self._apply_matrix(matrix)
 
         # 处理一次性触发(当前以日志代替)
-        if params.trigger_turbo_sound:
-            print("[PygameStems] 触发涡轮音效")
-        if params.trigger_drs_sound:
-            print("[PygameStems] 触发DRS音效")
-        if params.trigger_warning_sound:
-            print("[PygameStems] 触发警告音效")
-        if params.trigger_celebration:
-            print("[PygameStems] 触发庆祝音效")
+        if params.flags:
+            _report_triggers("PygameStems", params.flags)
 
     def set_master_volume(self, volume: float) -> None:
         """设置主音量(存在感)"""
-        self.master_volume = max(0.0, min(1.0, float(volume)))
+        # 控制器每周期调用, 以条件表达式钳位, 省去 max/min 的函数调用
+        volume = float(volume)
+        self.master_volume = 0.0 if volume < 0.0 else (1.0 if volume > 1.0 else volume)
 
     def get_status(self) -> Dict[str, Any]:
-        """获取后端状态"""
-        return {
-            "is_running": self.is_running,
-            "backend": "pygame_stems",
-            "stems_dir": self.stems_dir,
-            "master_volume": getattr(self, "master_volume", 1.0),
-            "has_params": self.current_params is not None,
-        }
+        """获取后端状态(返回的字典在调用间复用)"""
+        status = self._status
+        status["is_running"] = self.is_running
+        status["master_volume"] = self.master_volume
+        status["has_params"] = self.current_params is not None
+        return status
 
     def cleanup(self) -> None:
         """清理资源"""
@@ -778,9 +952,7 @@ class PygameStemsAudioEngine(AudioEngine):
         if not self.is_running or self._paused:
             return
         try:
-            import pygame  # type: ignore
-
-            pygame.mixer.pause()
+            self._pg.mixer.pause()
             self._paused = True
         except Exception:
             # 忽略暂停过程中的异常，保持稳定
@@ -795,10 +967,9 @@ class PygameStemsAudioEngine(AudioEngine):
         if not self.is_running or not self._paused:
             return
         try:
-            import pygame  # type: ignore
-
-            pygame.mixer.unpause()
+            self._pg.mixer.unpause()
             self._paused = False
+            self._last_mod = None
         except Exception:
             # 忽略恢复过程中的异常
             pass
@@ -818,22 +989,14 @@ class PygameStemsAudioEngine(AudioEngine):
             stem: 分轨名称 ('drums', 'bass', 'vocals', 'other')
             volume: 音量 (0.0-2.0，1.0为默认)
         """
-        if not self.is_running:
-            return
-
         volume = max(0.0, min(2.0, float(volume)))
 
-        if stem in self._base_volumes:
-            # 更新基础音量并重新应用所有音量设置
-            self._base_volumes[stem] = volume * 0.8  # 保留原有缩放比例
-
-            # 重新应用当前的音量和声像设置
-            current_params = self.current_params
-            if current_params:
-                master = max(0.0, min(1.0, current_params.volume))
-                self._apply_all_volumes(pan=current_params.pan, master=master)
-            else:
-                self._apply_all_volumes()
+        idx = self._stem_index.get(stem)
+        if idx is not None:
+            # 更新基础音量; 未运行时只记录, 由 start() 应用
+            self._base_vol_arr[idx] = volume * 0.8  # 保留原有缩放比例
+            if self.is_running:
+                self._reapply_volumes()
 
     def set_stem_mute(self, stem: str, muted: bool) -> None:
         """设置分轨静音状态
@@ -842,26 +1005,16 @@ class PygameStemsAudioEngine(AudioEngine):
             stem: 分轨名称
             muted: 是否静音
         """
-        if not self.is_running or stem not in self._channels:
+        idx = self._stem_index.get(stem)
+        if idx is None:
             return
 
-        if not hasattr(self, "_stem_muted"):
-            self._stem_muted = {name: False for name in self._base_volumes.keys()}
+        self._stem_muted[idx] = bool(muted)
+        self._refresh_gate()
 
-        self._stem_muted[stem] = bool(muted)
-
-        # 立即应用静音设置
-        channel = self._channels[stem]
-        if muted:
-            channel.set_volume(0.0, 0.0)
-        else:
-            # 恢复正常音量
-            current_params = self.current_params
-            if current_params:
-                master = max(0.0, min(1.0, current_params.volume))
-                self._apply_all_volumes(pan=current_params.pan, master=master)
-            else:
-                self._apply_all_volumes()
+        # 运行中立即应用静音设置; 未运行时只记录, 由 start() 应用
+        if self.is_running:
+            self._reapply_volumes()
 
     def set_stem_solo(self, stem: str, solo: bool) -> None:
         """设置分轨独奏状态
@@ -870,29 +1023,15 @@ class PygameStemsAudioEngine(AudioEngine):
             stem: 分轨名称
             solo: 是否独奏
         """
-        if not self.is_running:
+        idx = self._stem_index.get(stem)
+        if idx is None:
             return
 
-        if not hasattr(self, "_stem_solo"):
-            self._stem_solo = {name: False for name in self._base_volumes.keys()}
-
-        self._stem_solo[stem] = bool(solo)
-
         # 应用独奏逻辑：如果有任何分轨独奏，其他分轨静音
-        has_solo = any(self._stem_solo.values())
-
-        for name in self._base_volumes.keys():
-            channel = self._channels[name]
-            if has_solo:
-                if self._stem_solo.get(name, False):
-                    # 独奏分轨：正常音量
-                    self._apply_single_stem_volume(name)
-                else:
-                    # 非独奏分轨：静音
-                    channel.set_volume(0.0, 0.0)
-            else:
-                # 无独奏：所有分轨正常
-                self._apply_single_stem_volume(name)
+        self._stem_solo[idx] = bool(solo)
+        self._refresh_gate()
+        if self.is_running:
+            self._reapply_volumes()
 
     def fade_pause(self, duration: float = 0.2) -> None:
         """淡入淡出暂停
@@ -904,47 +1043,17 @@ class PygameStemsAudioEngine(AudioEngine):
             return
 
         try:
-            import threading
-            import time
-
-            # 记录当前各分轨音量
-            current_volumes = {}
-            for name, channel in self._channels.items():
-                left_vol = (
-                    channel.get_volume()[0]
-                    if hasattr(channel.get_volume(), "__getitem__")
-                    else channel.get_volume()
-                )
-                current_volumes[name] = left_vol
-
-            def fade_out_thread():
-                try:
-                    steps = max(10, int(duration * 50))  # 50步每秒
-                    step_time = duration / steps
-
-                    for step in range(steps):
-                        if self._paused:  # 如果已经暂停则停止淡出
-                            break
-
-                        fade_factor = 1.0 - (step + 1) / steps
-
-                        for name, channel in self._channels.items():
-                            if name in current_volumes:
-                                target_vol = current_volumes[name] * fade_factor
-                                channel.set_volume(target_vol, target_vol)
-
-                        time.sleep(step_time)
-
-                    # 完成淡出后暂停
-                    if not self._paused:
-                        self.pause()
-
-                except Exception as e:
-                    print(f"[PygameStems] 淡出暂停失败: {e}")
-                    self.pause()  # 回退到直接暂停
+            # 记录当前各分轨音量, 并一次性预计算整条淡出包络 (步数 x 分轨)
+            start_volumes = np.array(
+                [_channel_volume(self._channels[n]) for n in self._stem_order],
+                dtype=np.float32,
+            )
+            steps = max(10, int(duration * 50))  # 50步每秒
+            envelope = np.linspace(1.0, 0.0, steps + 1, dtype=np.float32)[1:]
+            schedule = envelope[:, None] * start_volumes[None, :]
 
-            # 启动淡出线程
-            threading.Thread(target=fade_out_thread, daemon=True).start()
+            # 交给淡入淡出工作线程
+            self._post_fade(False, schedule, duration / steps)
 
         except Exception as e:
             print(f"[PygameStems] 淡出暂停初始化失败，使用直接暂停: {e}")
@@ -960,76 +1069,103 @@ class PygameStemsAudioEngine(AudioEngine):
             return
 
         try:
-            import threading
-            import time
-
             # 先恢复播放但音量为0
             self.resume()
 
             # 计算目标音量
-            target_volumes = {}
             current_params = self.current_params
             if current_params:
                 master = max(0.0, min(1.0, current_params.volume)) * self.master_volume
-                for name in self._base_volumes.keys():
-                    base_vol = self._base_volumes.get(name, 0.7)
-                    target_vol = max(0.0, min(1.0, base_vol * master))
-                    target_volumes[name] = target_vol
+                targets = np.clip(self._base_vol_arr * master, 0.0, 1.0)
             else:
-                for name in self._base_volumes.keys():
-                    target_volumes[name] = (
-                        self._base_volumes.get(name, 0.7) * self.master_volume
-                    )
+                targets = self._base_vol_arr * self.master_volume
 
-            def fade_in_thread():
-                try:
-                    steps = max(10, int(duration * 50))  # 50步每秒
-                    step_time = duration / steps
-
-                    for step in range(steps):
-                        if self._paused:  # 如果又被暂停则停止淡入
-                            break
-
-                        fade_factor = (step + 1) / steps
-
-                        for name, channel in self._channels.items():
-                            if name in target_volumes:
-                                current_vol = target_volumes[name] * fade_factor
-                                # 检查静音和独奏状态
-                                if hasattr(
-                                    self, "_stem_muted"
-                                ) and self._stem_muted.get(name, False):
-                                    current_vol = 0.0
-                                elif hasattr(self, "_stem_solo"):
-                                    has_solo = any(self._stem_solo.values())
-                                    if has_solo and not self._stem_solo.get(
-                                        name, False
-                                    ):
-                                        current_vol = 0.0
-
-                                channel.set_volume(current_vol, current_vol)
-
-                        time.sleep(step_time)
-
-                except Exception as e:
-                    print(f"[PygameStems] 淡入恢复失败: {e}")
-                    # 恢复正常音量
-                    if current_params:
-                        master = max(0.0, min(1.0, current_params.volume))
-                        self._apply_all_volumes(pan=current_params.pan, master=master)
-                    else:
-                        self._apply_all_volumes()
-
-            # 启动淡入线程
-            threading.Thread(target=fade_in_thread, daemon=True).start()
+            # 一次性预计算整条淡入包络 (步数 x 分轨)
+            steps = max(10, int(duration * 50))  # 50步每秒
+            envelope = np.linspace(0.0, 1.0, steps + 1, dtype=np.float32)[1:]
+            schedule = envelope[:, None] * targets[None, :]
+
+            # 交给淡入淡出工作线程
+            self._post_fade(True, schedule, duration / steps)
 
         except Exception as e:
             print(f"[PygameStems] 淡入恢复失败，使用直接恢复: {e}")
             self.resume()
 
+    def _post_fade(self, fade_in: bool, schedule: np.ndarray, step_time: float) -> None:
+        """提交一次淡入/淡出, 首次使用时启动常驻工作线程"""
+        if self._fade_thread is None:
+            self._fade_thread = threading.Thread(target=self._fade_worker, daemon=True)
+            self._fade_thread.start()
+        self._fade_cmds.put((fade_in, schedule, step_time))
+
+    def _fade_worker(self) -> None:
+        """常驻淡入淡出工作线程: 依次执行命令, 新命令到达时立即接管当前渐变"""
+        cmds = self._fade_cmds
+        while True:
+            cmd = cmds.get()
+            while cmd is not None:
+                cmd = self._run_fade(*cmd)
+
+    def _run_fade(
+        self, fade_in: bool, schedule: np.ndarray, step_time: float
+    ) -> Optional[Tuple[bool, np.ndarray, float]]:
+        """逐步写入渐变音量表
+
+        Returns:
+            渐变途中收到的新命令; 正常结束时返回 None
+        """
+        cmds = self._fade_cmds
+        # 渐变绕过 _apply_matrix 直接写声道, 之后须完整重写一次
+        self._applied_lr.fill(-1.0)
+        try:
+            channels = [self._channels[n] for n in self._stem_order]
+
+            # 淡入时静音/独奏掩码整块预乘进音量表; 掩码仅在标志变化时被替换,
+            # 渐变途中若发生替换再整块重算
+            gate = self._gate
+            rows = (schedule * gate if fade_in else schedule).tolist()
+
+            deadline = time.perf_counter()
+            for step in range(len(rows)):
+                if self._paused:  # 已暂停(淡出)或又被暂停(淡入)则停止
+                    break
+
+                if fade_in and self._gate is not gate:
+                    gate = self._gate
+                    rows = (schedule * gate).tolist()
+                for channel, vol in zip(channels, rows[step]):
+                    channel.set_volume(vol, vol)
+
+                # 按绝对截止时间等待, 期间若有新命令则放弃当前渐变
+                deadline += step_time
+                try:
+                    return cmds.get(timeout=max(0.0, deadline - time.perf_counter()))
+                except queue.Empty:
+                    pass
+
+            if fade_in:
+                # 淡入目标未含动态调制, 令下一次参数更新完整重算
+                self._last_mod = None
+            elif not self._paused:
+                # 完成淡出后暂停
+                self.pause()
+
+        except Exception as e:
+            if fade_in:
+                print(f"[PygameStems] 淡入恢复失败: {e}")
+                # 恢复正常音量
+                self._reapply_volumes()
+            else:
+                print(f"[PygameStems] 淡出暂停失败: {e}")
+                self.pause()  # 回退到直接暂停
+        return None
+
     def update_config(self, config: AudioConfig) -> None:
         """更新音频配置
 
+        未运行时分轨音量/静音/独奏同样写入内部状态, 在下次 start() 时生效
+
         Args:
             config: 新的音频配置
         """
@@ -1037,7 +1173,7 @@ class PygameStemsAudioEngine(AudioEngine):
 
         # 应用分轨音量配置
         for stem, volume in config.stem_volumes.items():
-            if stem in self._base_volumes:
+            if stem in self._stem_index:
                 self.set_stem_volume(stem, volume)
 
         # 应用静音配置
@@ -1054,81 +1190,341 @@ class PygameStemsAudioEngine(AudioEngine):
     # ------------------------------------------------------------------
     # 内部工具（更新以支持高级功能）
     # ------------------------------------------------------------------
-    def _apply_single_stem_volume(self, name: str) -> None:
-        """为单个分轨应用音量设置
+    def _stem_paths(self) -> Tuple[str, ...]:
+        """校验并按 _stem_order 返回各分轨文件路径
 
-        Args:
-            name: 分轨名称
+        Raises:
+            FileNotFoundError: 任一分轨文件不存在
         """
-        if name not in self._channels:
+        # 一次目录扫描取得全部文件项, 代替逐个 stat
+        try:
+            with os.scandir(self.stems_dir) as it:
+                files = {e.name for e in it if e.is_file()}
+        except OSError as e:
+            raise FileNotFoundError(f"无法读取分轨目录: {self.stems_dir} ({e})")
+
+        missing = [n for n in self._stem_files if n not in files]
+        if missing:
+            raise FileNotFoundError(
+                f"未找到分轨文件: {', '.join(missing)} (目录: {self.stems_dir})"
+            )
+        return tuple(os.path.join(self.stems_dir, f) for f in self._stem_files)
+
+    def _refresh_gate(self) -> None:
+        """重算静音/独奏掩码: 静音分轨为 0; 存在独奏分轨时, 非独奏分轨为 0"""
+        gate = ~self._stem_muted
+        if self._stem_solo.any():
+            gate &= self._stem_solo
+        self._gate = gate
+
+    def _reapply_volumes(self) -> None:
+        """按当前参数(若有)重新应用全部分轨的音量与声像"""
+        current_params = self.current_params
+        if current_params:
+            master = max(0.0, min(1.0, current_params.volume))
+            matrix = self._compute_volume_matrix(pan=current_params.pan, master=master)
+        else:
+            matrix = self._compute_volume_matrix()
+        self._apply_matrix(matrix)
+
+    def _compute_volume_matrix(
+        self, pan: float = 0.0, master: float = 1.0
+    ) -> np.ndarray:
+        """以当前调制系数计算全部分轨的 (左, 右) 音量表(见 _kernels.volume_matrix)
+
+        Returns:
+            np.ndarray: 形状为 (分轨数, 2) 的音量表, 行序同 _stem_order;
+            结果写入复用的缓冲区, 调用方应立即消费
+        """
+        # 归一化主音量
+        gain = max(0.0, min(1.0, master)) * self.master_volume
+        _kernels.volume_matrix(
+            self._base_vol_arr,
+            self._stem_coeffs,
+            self._gate,
+            gain,
+            float(pan),
+            self._matrix_buf,
+        )
+        return self._matrix_buf
+
+    def _apply_matrix(self, matrix: np.ndarray) -> None:
+        """将音量表写入各声道
+
+        每个分轨至多一次 set_volume 调用; 相对上次写入值左右变化均小于
+        _VOLUME_WRITE_STEP 的分轨直接跳过。
+        """
+        applied = self._applied_lr
+        changed = np.abs(matrix - applied).max(axis=1) >= _VOLUME_WRITE_STEP
+        if not changed.any():
             return
+        applied[changed] = matrix[changed]
+
+        channels = self._channels
+        for name, (left, right), dirty in zip(
+            self._stem_order, matrix.tolist(), changed.tolist()
+        ):
+            if dirty:
+                ch = channels.get(name)
+                if ch is not None:
+                    ch.set_volume(left, right)
+
+
+class _GainChannel:
+    """sounddevice 后端的声道代理
+
+    提供与 pygame.mixer.Channel 相同的 set_volume/get_volume 接口,
+    实际只写入共享增益表的一行, 由音频回调在下一个数据块读取。
+    """
+
+    __slots__ = ("_gains", "_row")
+
+    def __init__(self, gains: np.ndarray, row: int) -> None:
+        self._gains = gains
+        self._row = row
+
+    def set_volume(self, left: float, right: Optional[float] = None) -> None:
+        """设置左右声道增益(仅给出一个值时左右相同)"""
+        self._gains[self._row] = (left, left if right is None else right)
+
+    def get_volume(self) -> float:
+        """返回左声道增益"""
+        return float(self._gains[self._row, 0])
+
+
+class SounddeviceStemsAudioEngine(PygameStemsAudioEngine):
+    """基于 sounddevice(PortAudio) 输出流的分轨音频引擎
+
+    分轨解码后以 float32 整体常驻内存, 在音频回调中按块向量化混音:
+    控制线程(参数更新/淡入淡出)只写入 (分轨, 左右) 目标增益表,
+    回调在每个数据块内把当前增益线性过渡到目标增益, 因此增益变化
+    以块为粒度平滑生效, 不再受限于控制线程的唤醒频率。
+
+    音量/声像/静音/独奏/淡入淡出逻辑与 PygameStemsAudioEngine 共用;
+    需要额外安装 sounddevice 与 soundfile, 通过 audio_engine="sounddevice" 启用。
+    """
+
+    _BACKEND_MODULES = ("sounddevice", "soundfile")
+    _BACKEND_NAME = "sounddevice_stems"
+
+    def __init__(self, config: AudioConfig) -> None:
+        """初始化 sounddevice 分轨音频引擎
+
+        Args:
+            config (AudioConfig): 音频配置
+        """
+        super().__init__(config)
+
+        # 控制线程与音频回调之间的单槽增益快照(后写者胜出), 形状 (分轨数, 2):
+        # 控制线程整体切片写入, 回调在块边界整体复制到 _target_gains,
+        # 两者各自只是一次 C 层内存拷贝, 回调端无需加锁
+        self._gains = np.zeros((len(self._stem_order), 2), dtype=np.float32)
+        self._target_gains = np.zeros_like(self._gains)
+        self._current_gains = np.zeros_like(self._gains)
+        self._delta_gains = np.zeros_like(self._gains)
+
+        # 分轨数据 (分轨数, 采样数, 2) 与播放位置
+        self._stems: Optional[np.ndarray] = None
+        self._position = 0
+        self._stream: Any = None
+        # 回调按块长复用的缓冲区, 实时回调内不分配数组(见 _block_buffers)
+        self._block_cache: Dict[int, Tuple[np.ndarray, ...]] = {}
+
+    # ------------------------------------------------------------------
+    # 生命周期
+    # ------------------------------------------------------------------
+    def start(self) -> bool:
+        """加载分轨并打开输出流"""
+        if self.is_running:
+            return True
+
+        # 延迟导入, 避免模块级依赖导致导入失败
+        try:
+            import sounddevice as sd  # type: ignore
+            import soundfile as sf  # type: ignore
+        except Exception as e:
+            raise RuntimeError(f"导入 sounddevice/soundfile 失败: {e}")
+
+        # 校验并解码分轨
+        paths = self._stem_paths()
+        try:
+            # 各分轨的解码在 libsndfile 内释放 GIL, 并行读取
+            with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+                decoded = list(
+                    ex.map(lambda p: sf.read(p, dtype="int16", always_2d=True), paths)
+                )
+            stems = []
+            sample_rate = None
+            for p, (data, sr) in zip(paths, decoded):
+                if sample_rate is None:
+                    sample_rate = sr
+                elif sr != sample_rate:
+                    raise ValueError(f"分轨采样率不一致: {p} ({sr} != {sample_rate})")
+                if data.shape[1] == 1:
+                    data = np.repeat(data, 2, axis=1)
+                stems.append(data[:, :2])
+            # 以最短分轨为循环长度; 一次性转为 float32, 回调内不再逐块转换
+            length = min(len(d) for d in stems)
+            self._stems = np.stack([d[:length] for d in stems]).astype(np.float32)
+        except Exception as e:
+            raise RuntimeError(f"加载分轨失败: {e}")
 
-        # 检查静音状态
-        if hasattr(self, "_stem_muted") and self._stem_muted.get(name, False):
-            self._channels[name].set_volume(0.0, 0.0)
+        # 声道代理与初始音量
+        for idx, n in enumerate(self._stem_order):
+            self._channels[n] = _GainChannel(self._gains, idx)
+        self._apply_matrix(self._compute_volume_matrix(pan=0.0))
+        self._current_gains[:] = self._gains
+        self._position = 0
+
+        # 打开输出流
+        try:
+            self._stream = sd.OutputStream(
+                samplerate=sample_rate,
+                blocksize=max(256, int(self.config.buffer_size)),
+                channels=2,
+                dtype="int16",
+                device=self.config.output_device or None,
+                callback=self._audio_callback,
+            )
+            self._stream.start()
+        except Exception as e:
+            self._stream = None
+            raise RuntimeError(f"打开 sounddevice 输出流失败: {e}")
+
+        self.is_running = True
+        print("[SounddeviceStems] 分轨后端已启动")
+        return True
+
+    def stop(self) -> None:
+        """关闭输出流并释放分轨数据"""
+        if not self.is_running:
             return
+        try:
+            if self._stream is not None:
+                self._stream.stop()
+                self._stream.close()
+        except Exception:
+            pass
+        finally:
+            self._stream = None
+            self._stems = None
+            self.is_running = False
+            print("[SounddeviceStems] 分轨后端已停止")
 
-        # 检查独奏状态
-        if hasattr(self, "_stem_solo"):
-            has_solo = any(self._stem_solo.values())
-            if has_solo and not self._stem_solo.get(name, False):
-                self._channels[name].set_volume(0.0, 0.0)
-                return
+    @staticmethod
+    def list_audio_devices() -> List[str]:
+        """列出所有可用的音频输出设备
 
-        # 计算正常音量
-        base_vol = self._base_volumes.get(name, 0.7)
-        master = self.master_volume
+        Returns:
+            List[str]: 可用音频设备名称列表
+        """
+        try:
+            import sounddevice as sd  # type: ignore
 
-        if self.current_params:
-            master *= max(0.0, min(1.0, self.current_params.volume))
+            return [
+                d["name"] for d in sd.query_devices() if d["max_output_channels"] > 0
+            ]
+        except Exception as e:
+            print(f"[SounddeviceStems] 获取音频设备列表失败: {e}")
+            return []
 
-        final_vol = max(0.0, min(1.0, base_vol * master))
+    @staticmethod
+    def get_current_audio_device() -> Optional[str]:
+        """获取当前默认音频输出设备
 
-        # 应用声像
-        if self.current_params:
-            left, right = self._pan_to_lr(final_vol, self.current_params.pan)
-        else:
-            left = right = final_vol
+        Returns:
+            Optional[str]: 当前音频设备名称，如果无法获取则返回None
+        """
+        try:
+            import sounddevice as sd  # type: ignore
 
-        self._channels[name].set_volume(left, right)
+            return sd.query_devices(kind="output")["name"]
+        except Exception:
+            return None
 
-    def _apply_all_volumes(
-        self,
-        pan: float = 0.0,
-        master: float = 1.0,
-        per_stem: Optional[Dict[str, float]] = None,
-    ) -> None:
-        """将音量/声像应用到所有分轨"""
-        if per_stem is None:
-            per_stem = self._base_volumes
+    # ------------------------------------------------------------------
+    # 播放控制（暂停/恢复）: 回调在暂停期间输出静音并保持播放位置
+    # ------------------------------------------------------------------
+    def pause(self) -> None:
+        """暂停所有分轨的播放"""
+        if not self.is_running or self._paused:
+            return
+        self._paused = True
 
-        # 归一化主音量
-        master = max(0.0, min(1.0, master)) * self.master_volume
+    def resume(self) -> None:
+        """恢复所有分轨的播放"""
+        if not self.is_running or not self._paused:
+            return
+        self._paused = False
+        self._last_mod = None
+
+    # ------------------------------------------------------------------
+    # 内部工具
+    # ------------------------------------------------------------------
+    def _apply_matrix(self, matrix: np.ndarray) -> None:
+        """将音量表整体写入增益快照, 由音频回调在下一个数据块生效"""
+        np.copyto(self._gains, matrix)
+
+    def _block_buffers(self, frames: int) -> Tuple[np.ndarray, ...]:
+        """返回按块长缓存的回调缓冲区
 
-        for name in ("drums", "bass", "vocals", "other"):
-            base = max(
-                0.0, min(1.0, per_stem.get(name, self._base_volumes.get(name, 0.7)))
+        Returns:
+            Tuple: (形状 (frames, 1) 的 [0, 1) 线性过渡系数, 跨越循环终点时
+            拼接分轨块用的 (分轨数, frames, 2) 缓冲, 混音与暂存用的两个
+            (frames, 2) 缓冲)
+        """
+        bufs = self._block_cache.get(frames)
+        if bufs is None:
+            ramp = np.linspace(0.0, 1.0, frames, endpoint=False, dtype=np.float32)
+            bufs = (
+                ramp[:, None],
+                np.empty((len(self._stem_order), frames, 2), dtype=np.float32),
+                np.empty((frames, 2), dtype=np.float32),
+                np.empty((frames, 2), dtype=np.float32),
             )
-            vol = max(0.0, min(1.0, base * master))
-
-            # 检查静音状态
-            if hasattr(self, "_stem_muted") and self._stem_muted.get(name, False):
-                vol = 0.0
-
-            # 检查独奏状态
-            if hasattr(self, "_stem_solo"):
-                has_solo = any(self._stem_solo.values()) if self._stem_solo else False
-                if has_solo and not self._stem_solo.get(name, False):
-                    vol = 0.0
-
-            l, r = self._pan_to_lr(vol, pan)
-            ch = self._channels.get(name)
-            if ch is not None:
-                ch.set_volume(l, r)
-
-    def _pan_to_lr(self, vol: float, pan: float) -> tuple[float, float]:
-        """根据声像将总体音量分配到左右声道"""
-        pan = max(-1.0, min(1.0, float(pan)))
-        left = vol * (1.0 - max(0.0, pan))
-        right = vol * (1.0 + min(0.0, pan))
-        return max(0.0, min(1.0, left)), max(0.0, min(1.0, right))
+            self._block_cache[frames] = bufs
+        return bufs
+
+    def _audio_callback(
+        self, outdata: np.ndarray, frames: int, time_info, status
+    ) -> None:
+        """PortAudio 回调: 按块混合四个分轨并写入输出缓冲"""
+        stems = self._stems
+        if stems is None or self._paused:
+            outdata.fill(0)
+            return
+
+        ramp, wrapped, mix, scratch = self._block_buffers(frames)
+
+        # 取出本块各分轨数据(循环播放): 未跨越终点时直接取视图,
+        # 否则分段复制到预分配的块缓冲
+        length = stems.shape[1]
+        pos = self._position
+        end = pos + frames
+        if end <= length:
+            block = stems[:, pos:end]
+            self._position = end % length
+        else:
+            block = wrapped
+            filled = 0
+            while filled < frames:
+                n = min(frames - filled, length - pos)
+                block[:, filled : filled + n] = stems[:, pos : pos + n]
+                filled += n
+                pos = (pos + n) % length
+            self._position = pos
+
+        # 增益在块内由当前值线性过渡到目标值: mix = A + B * ramp
+        target = self._target_gains
+        np.copyto(target, self._gains)
+        current = self._current_gains
+        delta = self._delta_gains
+        np.subtract(target, current, out=delta)
+        np.einsum("snc,sc->nc", block, current, out=mix)
+        np.einsum("snc,sc->nc", block, delta, out=scratch)
+        np.multiply(scratch, ramp, out=scratch)
+        mix += scratch
+        np.copyto(current, target)
+
+        np.clip(mix, -32768, 32767, out=mix)
+        np.copyto(outdata, mix, casting="unsafe")
@@ -16,10 +16,33 @@
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
+from acc_telemetry.core.compat import DATACLASS_OPTIONS
 
-@dataclass
+# 一次性触发事件位标志(MusicParameters.flags)
+TRIG_TURBO = 1
+TRIG_DRS = 2
+TRIG_WARN = 4
+TRIG_CELEBRATE = 8
+
+
+def _flag_property(bit: int, doc: str) -> property:
+    """将 flags 中的单个位暴露为布尔属性"""
+
+    def getter(self: "MusicParameters") -> bool:
+        return bool(self.flags & bit)
+
+    def setter(self: "MusicParameters", value: bool) -> None:
+        if value:
+            self.flags |= bit
+        else:
+            self.flags &= ~bit
+
+    return property(getter, setter, doc=doc)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class MusicParameters:
     """音乐参数数据类
 
@@ -33,11 +56,11 @@ class MusicParameters:
     - brightness:      音色亮度(可映射到滤波/谐波), 0.0-1.0
     - reverb_amount:   混响量(可选), 0.0-1.0
     - distortion_amount: 失真量(可选), 0.0-1.0
-    - trigger_turbo_sound: 触发一次性涡轮音效
-    - trigger_drs_sound:   触发一次性 DRS 音效
-    - trigger_warning_sound: 触发一次性警告音效
-    - trigger_celebration:   触发一次性庆祝音效
+    - flags:           一次性触发事件位标志(TRIG_TURBO/TRIG_DRS/TRIG_WARN/TRIG_CELEBRATE)
     - timestamp:       时间戳(秒), 用于时序参考
+
+    trigger_turbo_sound/trigger_drs_sound/trigger_warning_sound/trigger_celebration
+    以布尔属性的形式读写 flags 中对应的位; 热路径中应直接测试 ``flags & TRIG_*``。
     """
 
     bpm: float
@@ -49,12 +72,63 @@ class MusicParameters:
     reverb_amount: float = 0.0
     distortion_amount: float = 0.0
 
-    trigger_turbo_sound: bool = False
-    trigger_drs_sound: bool = False
-    trigger_warning_sound: bool = False
-    trigger_celebration: bool = False
+    flags: int = 0
 
     timestamp: Optional[float] = None
 
+    trigger_turbo_sound = _flag_property(TRIG_TURBO, "触发一次性涡轮音效")
+    trigger_drs_sound = _flag_property(TRIG_DRS, "触发一次性 DRS 音效")
+    trigger_warning_sound = _flag_property(TRIG_WARN, "触发一次性警告音效")
+    trigger_celebration = _flag_property(TRIG_CELEBRATE, "触发一次性庆祝音效")
+
     # 预留扩展字段(不改变现有后端的前提下可被忽略)
     # 例如: sidechain_amount: float = 0.0
+
+
+class ParameterRing:
+    """预分配的最新值参数环(单生产者, 多读者)
+
+    生产者(控制器线程)依次写入固定槽位并发布; 读者(音频引擎、UI 线程)
+    只读取最近发布的槽位, 旧值自然被覆盖。槽位在构造时一次性分配,
+    运行期间不再创建 MusicParameters。发布序号为单个整数, 其赋值在
+    GIL 下是原子的, 读写双方均无需加锁。
+
+    读者拿到的对象在生产者绕环一圈(capacity - 1 个周期)之前保持不变,
+    足以覆盖 UI 线程延迟渲染的时间窗口。
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        """初始化参数环
+
+        Args:
+            capacity: 槽位数量, 须为不小于 2 的 2 的幂
+        """
+        if capacity < 2 or capacity & (capacity - 1):
+            raise ValueError(f"槽位数量必须为不小于 2 的 2 的幂: {capacity}")
+        self._slots: List[MusicParameters] = [
+            MusicParameters(bpm=120.0, volume=0.8, base_pitch=60, reverb_amount=0.15)
+            for _ in range(capacity)
+        ]
+        self._mask = capacity - 1
+        self._head = 0  # 已发布的槽位数量
+
+    def acquire(self) -> MusicParameters:
+        """取得下一个待写入的槽位(仅生产者调用)"""
+        return self._slots[self._head & self._mask]
+
+    def publish(self) -> MusicParameters:
+        """发布已写入的槽位, 使其成为最新值(仅生产者调用)
+
+        Returns:
+            MusicParameters: 刚发布的槽位
+        """
+        slot = self._slots[self._head & self._mask]
+        self._head += 1
+        return slot
+
+    def latest(self) -> Optional[MusicParameters]:
+        """返回最近发布的参数, 尚未发布过时返回 None"""
+        head = self._head
+        if head == 0:
+            return None
+        return self._slots[(head - 1) & self._mask]
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""
+模块: compat
+
+跨 Python 版本共用的兼容选项。
+"""
+
+import sys
+from typing import Any, Dict
+
+# Python 3.10+ 下数据类启用 __slots__: 实例不再携带 __dict__,
+# 每帧读写的字段通过槽描述符直接访问; 旧版本保持普通数据类
+DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
@@ -4,13 +4,14 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
+from .compat import DATACLASS_OPTIONS
 from .shared_memory import accSharedMemory
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TelemetryData:
     """遥测数据类
 
@@ -7,6 +7,80 @@ import customtkinter as ctk
 from ..core.telemetry import ACCTelemetry
 
 
+def _format_gear(value, unit):
+    """档位: 0 为倒挡, 1 为空挡"""
+    if value == 0:
+        return "R"
+    elif value == 1:
+        return "N"
+    else:
+        return str(value - 1)
+
+
+def _format_percent(value, unit):
+    return f"{value * 100:.0f}{unit}"
+
+
+def _format_switch(value, unit):
+    return "开启" if value else "关闭"
+
+
+def _format_lap_time(value, unit):
+    """圈速(毫秒) -> m:ss.sss"""
+    if value > 0:
+        seconds = value / 1000
+        minutes = int(seconds // 60)
+        seconds = seconds % 60
+        return f"{minutes}:{seconds:06.3f}"
+    else:
+        return "--:---.---"
+
+
+def _format_acceleration(value, unit):
+    if isinstance(value, float):
+        return f"{value:.2f}{unit}"
+    return f"{value}{unit}"
+
+
+def _format_wheel_slip(value, unit):
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return f"{value}{unit}"
+
+
+def _format_default(value, unit):
+    if isinstance(value, float):
+        return f"{value:.1f}{unit}"
+    return f"{value}{unit}"
+
+
+# 字段 -> 格式化函数; 未列出的字段使用 _format_default
+_FIELD_FORMATTERS = {
+    "gear": _format_gear,
+    "throttle": _format_percent,
+    "brake": _format_percent,
+    "clutch": _format_percent,
+    "drs": _format_switch,
+    "tc": _format_switch,
+    "abs": _format_switch,
+    "lap_time": _format_lap_time,
+    "last_lap": _format_lap_time,
+    "best_lap": _format_lap_time,
+    "acceleration_x": _format_acceleration,
+    "acceleration_y": _format_acceleration,
+    "acceleration_z": _format_acceleration,
+    "wheel_slip_fl": _format_wheel_slip,
+    "wheel_slip_fr": _format_wheel_slip,
+    "wheel_slip_rl": _format_wheel_slip,
+    "wheel_slip_rr": _format_wheel_slip,
+}
+
+
+def _select_formatter(field):
+    """按字段名选出格式化函数(创建控件时确定一次, 更新循环中不再逐帧比较字段名)"""
+    return _FIELD_FORMATTERS.get(field, _format_default)
+
+
 class AccDashboard(ctk.CTkFrame):
     def __init__(self, parent):
         super().__init__(parent, corner_radius=15)
@@ -321,6 +395,7 @@ class AccDashboard(ctk.CTkFrame):
                             "label": label,
                             "value": value_label,
                             "unit": config["unit"],
+                            "format": _select_formatter(field),
                         }
 
                         left_column_row += 1
@@ -355,6 +430,7 @@ class AccDashboard(ctk.CTkFrame):
                             "label": label,
                             "value": value_label,
                             "unit": config["unit"],
+                            "format": _select_formatter(field),
                         }
 
                         right_column_row += 1
@@ -391,10 +467,9 @@ class AccDashboard(ctk.CTkFrame):
         for field, widgets in self.data_labels.items():
             try:
                 value = getattr(data, field)
-                unit = widgets["unit"]
 
                 # 根据数据类型格式化显示
-                display_text = self._format_display_value(field, value, unit)
+                display_text = widgets["format"](value, widgets["unit"])
                 
                 # 仅在值变化时更新UI
                 current_text = widgets["value"].cget("text")
@@ -408,34 +483,7 @@ class AccDashboard(ctk.CTkFrame):
 
     def _format_display_value(self, field, value, unit):
         """根据字段类型格式化显示值"""
-        if field == "gear":
-            if value == 0:
-                return "R"
-            elif value == 1:
-                return "N"
-            else:
-                return str(value - 1)
-        elif field in ["throttle", "brake", "clutch"]:
-            return f"{value * 100:.0f}{unit}"
-        elif field in ["drs", "tc", "abs"]:
-            return "开启" if value else "关闭"
-        elif field in ["lap_time", "last_lap", "best_lap"]:
-            if value > 0:
-                seconds = value / 1000
-                minutes = int(seconds // 60)
-                seconds = seconds % 60
-                return f"{minutes}:{seconds:06.3f}"
-            else:
-                return "--:---.---"
-        elif isinstance(value, float):
-            if field in ["acceleration_x", "acceleration_y", "acceleration_z"]:
-                return f"{value:.2f}{unit}"
-            elif field in ["wheel_slip_fl", "wheel_slip_fr", "wheel_slip_rl", "wheel_slip_rr"]:
-                return f"{value:.3f}"
-            else:
-                return f"{value:.1f}{unit}"
-        else:
-            return f"{value}{unit}"
+        return _select_formatter(field)(value, unit)
 
     def cleanup(self):
         """清理资源，停止更新循环"""
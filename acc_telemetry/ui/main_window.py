@@ -16,6 +16,9 @@ from acc_telemetry.core.shared_memory import (
     accSharedMemory,
 )
 
+# 踏板进度条长度(像素, 随窗口拉伸时为最小长度); 进度值按该长度的像素精度量化
+PEDAL_BAR_LENGTH = 200
+
 
 class MainWindow:
     """
@@ -50,6 +53,13 @@ class MainWindow:
         )
         self.status_bar.grid(row=1, column=0, sticky=(tk.W, tk.E))
 
+        # 各控件选项最近一次写入的值: (控件, 选项) -> 值
+        self._shown = {}
+
+        # 状态栏时间精确到秒: 最近一次格式化的秒数与文本
+        self._status_second = None
+        self._status_text = ""
+
         # 创建显示标签
         self.create_dashboard_widgets()
 
@@ -136,7 +146,10 @@ class MainWindow:
         # 油门显示
         ttk.Label(pedals_frame, text="油门:").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.throttle_bar = ttk.Progressbar(
-            pedals_frame, orient=tk.HORIZONTAL, length=200, mode="determinate"
+            pedals_frame,
+            orient=tk.HORIZONTAL,
+            length=PEDAL_BAR_LENGTH,
+            mode="determinate",
         )
         self.throttle_bar.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
         self.throttle_value = ttk.Label(
@@ -147,7 +160,10 @@ class MainWindow:
         # 刹车显示
         ttk.Label(pedals_frame, text="刹车:").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.brake_bar = ttk.Progressbar(
-            pedals_frame, orient=tk.HORIZONTAL, length=200, mode="determinate"
+            pedals_frame,
+            orient=tk.HORIZONTAL,
+            length=PEDAL_BAR_LENGTH,
+            mode="determinate",
         )
         self.brake_bar.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
         self.brake_value = ttk.Label(
@@ -158,7 +174,10 @@ class MainWindow:
         # 离合显示
         ttk.Label(pedals_frame, text="离合:").grid(row=2, column=0, sticky=tk.W, pady=5)
         self.clutch_bar = ttk.Progressbar(
-            pedals_frame, orient=tk.HORIZONTAL, length=200, mode="determinate"
+            pedals_frame,
+            orient=tk.HORIZONTAL,
+            length=PEDAL_BAR_LENGTH,
+            mode="determinate",
         )
         self.clutch_bar.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
         self.clutch_value = ttk.Label(
@@ -224,73 +243,67 @@ class MainWindow:
             data = self.shared_memory.get_shared_memory_data()
 
             if data is not None:
-                # 更新状态栏
-                self.status_bar.config(
-                    text=f"已连接 ACC - 最后更新: {time.strftime('%H:%M:%S')}"
-                )
+                # 更新状态栏(仅在秒数变化时重新格式化时间)
+                second = int(time.time())
+                if second != self._status_second:
+                    self._status_second = second
+                    self._status_text = "已连接 ACC - 最后更新: " + time.strftime(
+                        "%H:%M:%S", time.localtime(second)
+                    )
+                self._set_option(self.status_bar, "text", self._status_text)
 
                 # 更新基础数据
-                self.speed_value.config(text=f"{data.Physics.speed_kmh:.1f} km/h")
-                self.rpm_value.config(text=f"{data.Physics.rpm} RPM")
+                physics = data.Physics
+                self._set_option(
+                    self.speed_value, "text", f"{physics.speed_kmh:.1f} km/h"
+                )
+                self._set_option(self.rpm_value, "text", f"{physics.rpm} RPM")
 
                 # 档位显示特殊处理
                 gear_text = (
                     "R"
-                    if data.Physics.gear == -1
-                    else "N" if data.Physics.gear == 0 else str(data.Physics.gear)
+                    if physics.gear == -1
+                    else "N" if physics.gear == 0 else str(physics.gear)
                 )
-                self.gear_value.config(text=gear_text)
+                self._set_option(self.gear_value, "text", gear_text)
 
-                self.fuel_value.config(text=f"{data.Physics.fuel:.1f} L")
+                self._set_option(self.fuel_value, "text", f"{physics.fuel:.1f} L")
 
                 # 更新踏板数据
-                throttle_percent = data.Physics.gas * 100
-                brake_percent = data.Physics.brake * 100
-                clutch_percent = data.Physics.clutch * 100
+                throttle_percent = physics.gas * 100
+                brake_percent = physics.brake * 100
+                clutch_percent = physics.clutch * 100
 
                 # 更新进度条
-                self.throttle_bar["value"] = throttle_percent
-                self.brake_bar["value"] = brake_percent
-                self.clutch_bar["value"] = clutch_percent
+                self._set_bar(self.throttle_bar, throttle_percent)
+                self._set_bar(self.brake_bar, brake_percent)
+                self._set_bar(self.clutch_bar, clutch_percent)
 
                 # 更新文本值
-                self.throttle_value.config(text=f"{throttle_percent:.0f}%")
-                self.brake_value.config(text=f"{brake_percent:.0f}%")
-                self.clutch_value.config(text=f"{clutch_percent:.0f}%")
-
-                # 更新轮胎压力数据
-                self.fl_pressure_value.config(
-                    text=f"{data.Physics.wheel_pressure.front_left:.1f}"
-                )
-                self.fr_pressure_value.config(
-                    text=f"{data.Physics.wheel_pressure.front_right:.1f}"
-                )
-                self.rl_pressure_value.config(
-                    text=f"{data.Physics.wheel_pressure.rear_left:.1f}"
-                )
-                self.rr_pressure_value.config(
-                    text=f"{data.Physics.wheel_pressure.rear_right:.1f}"
-                )
-
-                # 根据压力值设置颜色（简单的压力范围检查）
-                self.update_tire_pressure_color(
-                    self.fl_pressure_value, data.Physics.wheel_pressure.front_left
-                )
-                self.update_tire_pressure_color(
-                    self.fr_pressure_value, data.Physics.wheel_pressure.front_right
-                )
-                self.update_tire_pressure_color(
-                    self.rl_pressure_value, data.Physics.wheel_pressure.rear_left
-                )
-                self.update_tire_pressure_color(
-                    self.rr_pressure_value, data.Physics.wheel_pressure.rear_right
+                self._set_option(
+                    self.throttle_value, "text", f"{throttle_percent:.0f}%"
                 )
+                self._set_option(self.brake_value, "text", f"{brake_percent:.0f}%")
+                self._set_option(self.clutch_value, "text", f"{clutch_percent:.0f}%")
+
+                # 更新轮胎压力数据, 并根据压力值设置颜色
+                pressure = physics.wheel_pressure
+                for label, value in (
+                    (self.fl_pressure_value, pressure.front_left),
+                    (self.fr_pressure_value, pressure.front_right),
+                    (self.rl_pressure_value, pressure.rear_left),
+                    (self.rr_pressure_value, pressure.rear_right),
+                ):
+                    self._set_option(label, "text", f"{value:.1f}")
+                    self.update_tire_pressure_color(label, value)
         except SharedMemoryTimeout:
             # 未连接状态
-            self.status_bar.config(text="等待连接 ACC... (请确保游戏已启动)")
+            self._set_option(
+                self.status_bar, "text", "等待连接 ACC... (请确保游戏已启动)"
+            )
         except Exception as e:
             # 其他错误
-            self.status_bar.config(text=f"错误: {e}")
+            self._set_option(self.status_bar, "text", f"错误: {e}")
 
         # 根据配置的更新频率更新数据
         self.root.after(self.update_interval, self.update_dashboard)
@@ -306,11 +319,42 @@ class MainWindow:
             胎压值
         """
         if pressure < 27.0:  # 胎压过低
-            label.config(foreground="blue")
+            color = "blue"
         elif pressure > 30.0:  # 胎压过高
-            label.config(foreground="red")
+            color = "red"
         else:  # 胎压正常
-            label.config(foreground="green")
+            color = "green"
+        self._set_option(label, "foreground", color)
+
+    def _set_option(self, widget, option, value):
+        """
+        设置控件选项, 与上次写入的值相同时跳过
+
+        Parameters:
+        widget: tk.Widget
+            控件对象
+        option: str
+            选项名
+        value:
+            选项值
+        """
+        key = (widget, option)
+        if self._shown.get(key) != value:
+            widget[option] = value
+            self._shown[key] = value
+
+    def _set_bar(self, bar, percent):
+        """
+        以像素精度更新进度条, 同一像素内的变化不触发重绘
+
+        Parameters:
+        bar: ttk.Progressbar
+            进度条对象
+        percent: float
+            百分比 (0-100)
+        """
+        pixels = int(percent * PEDAL_BAR_LENGTH / 100 + 0.5)
+        self._set_option(bar, "value", pixels * 100 / PEDAL_BAR_LENGTH)
 
     def run(self):
         """
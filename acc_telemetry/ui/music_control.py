@@ -9,14 +9,28 @@
 日期: 2024
 """
 
-import threading
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import customtkinter as ctk
 
-from acc_telemetry.audio import AudioConfig, MBUXSoundDriveController
+from acc_telemetry.audio import AudioConfig, MBUXSoundDriveController, MusicEngine
 from acc_telemetry.ui.music_library import MusicLibraryPanel
 
+# 界面刷新间隔(毫秒), 与原后台线程的 10Hz 一致
+UI_REFRESH_INTERVAL_MS = 100
+
+# 启动时由控件写入 AudioConfig 的字段: (配置属性, 控件属性名, 类型转换)
+_CONFIG_BINDINGS: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("master_volume", "master_volume_slider", float),
+    ("update_rate", "update_rate_slider", int),
+    ("auto_pause_timeout", "auto_pause_timeout_slider", float),
+    ("enable_fade_transition", "fade_enable_switch", bool),
+    ("fade_duration", "fade_duration_slider", float),
+    ("log_level", "log_level_var", str),
+    ("enable_verbose_logging", "verbose_logging_switch", bool),
+)
+
 
 class MusicControlPanel(ctk.CTkFrame):
     """音乐控制面板类
@@ -40,13 +54,16 @@ class MusicControlPanel(ctk.CTkFrame):
         """
         super().__init__(parent, corner_radius=15)
 
-        # 音乐控制器
+        # 音乐控制器; 音乐引擎在多次启动/停止之间复用, 配置未变时不再重新应用
         self.controller: Optional[MBUXSoundDriveController] = None
+        self._engine: Optional[MusicEngine] = None
         self.is_running = False
 
-        # UI 更新线程
-        self.update_thread: Optional[threading.Thread] = None
-        self.should_update = False
+        # UI 刷新定时任务(主线程 after 链)
+        self._refresh_job: Optional[str] = None
+
+        # 待执行的滑块回调: 键 -> (回调, 参数), 同一空闲周期内只执行最后一次
+        self._pending_updates: Dict[Any, Tuple[Callable[..., None], tuple]] = {}
 
         # 分轨控制变量
         self.stem_volume_sliders: Dict[str, ctk.CTkSlider] = {}
@@ -59,7 +76,9 @@ class MusicControlPanel(ctk.CTkFrame):
     def create_tabbed_interface(self) -> None:
         """创建标签页界面"""
         # 创建标签页容器
-        self.tabview = ctk.CTkTabview(self, corner_radius=15)
+        self.tabview = ctk.CTkTabview(
+            self, corner_radius=15, command=self._on_tab_changed
+        )
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
 
         # 添加标签页
@@ -70,8 +89,14 @@ class MusicControlPanel(ctk.CTkFrame):
         self.music_library = MusicLibraryPanel(self.tabview.tab("音乐库管理"))
         self.music_library.pack(fill="both", expand=True)
 
-        # 创建MBUX控制面板
-        self.create_mbux_control_panel()
+        # MBUX控制面板控件较多, 首次切换到该页时再创建
+        self._tab_builders = {"MBUX 控制": self.create_mbux_control_panel}
+
+    def _on_tab_changed(self) -> None:
+        """标签页切换回调, 首次显示某页时创建其内容"""
+        builder = self._tab_builders.pop(self.tabview.get(), None)
+        if builder is not None:
+            builder()
 
     def create_mbux_control_panel(self) -> None:
         """创建MBUX控制面板"""
@@ -155,6 +180,7 @@ class MusicControlPanel(ctk.CTkFrame):
             status_container, text="", font=ctk.CTkFont(size=12), text_color="#f39c12"
         )
         self.pause_status_label.pack(anchor="w")
+        self._pause_status = ("", "#f39c12")
 
     def create_control_section(self) -> None:
         """创建控制按钮区域"""
@@ -233,8 +259,11 @@ class MusicControlPanel(ctk.CTkFrame):
                 from_=0.0,
                 to=2.0,
                 number_of_steps=200,
-                command=lambda value, stem=stem_key: self.on_stem_volume_change(
-                    stem, value
+                command=partial(
+                    self._coalesce,
+                    ("stem_volume", stem_key),
+                    self.on_stem_volume_change,
+                    stem_key,
                 ),
                 width=150,
             )
@@ -246,7 +275,7 @@ class MusicControlPanel(ctk.CTkFrame):
             mute_switch = ctk.CTkSwitch(
                 stem_container,
                 text="静音",
-                command=lambda stem=stem_key: self.on_stem_mute_toggle(stem),
+                command=partial(self.on_stem_mute_toggle, stem_key),
                 width=60,
             )
             mute_switch.pack(side="left", padx=(0, 10))
@@ -256,7 +285,7 @@ class MusicControlPanel(ctk.CTkFrame):
             solo_switch = ctk.CTkSwitch(
                 stem_container,
                 text="独奏",
-                command=lambda stem=stem_key: self.on_stem_solo_toggle(stem),
+                command=partial(self.on_stem_solo_toggle, stem_key),
                 width=60,
             )
             solo_switch.pack(side="left")
@@ -287,7 +316,11 @@ class MusicControlPanel(ctk.CTkFrame):
             from_=1.0,
             to=10.0,
             number_of_steps=90,
-            command=self.on_auto_pause_timeout_change,
+            command=partial(
+                self._coalesce,
+                "auto_pause_timeout",
+                self.on_auto_pause_timeout_change,
+            ),
         )
         self.auto_pause_timeout_slider.set(3.0)  # 默认3秒
         self.auto_pause_timeout_slider.pack(
@@ -336,7 +369,9 @@ class MusicControlPanel(ctk.CTkFrame):
             from_=0.1,
             to=2.0,
             number_of_steps=190,
-            command=self.on_fade_duration_change,
+            command=partial(
+                self._coalesce, "fade_duration", self.on_fade_duration_change
+            ),
         )
         self.fade_duration_slider.set(0.5)  # 默认0.5秒
         self.fade_duration_slider.pack(
@@ -405,8 +440,13 @@ class MusicControlPanel(ctk.CTkFrame):
         params_grid = ctk.CTkFrame(monitor_frame, fg_color="transparent")
         params_grid.pack(fill="x", padx=15, pady=(0, 15))
 
-        # 参数标签字典
+        # 参数标签字典; 标签绑定 StringVar, 刷新时只写变量不经 configure
         self.param_labels = {}
+        self.param_vars: Dict[str, ctk.StringVar] = {}
+        self._param_texts: Dict[str, str] = {}
+        for key in ("bpm", "volume", "pitch", "pan"):
+            self.param_vars[key] = ctk.StringVar(value="--")
+            self._param_texts[key] = "--"
 
         # 第一行：BPM 和音量
         row1 = ctk.CTkFrame(params_grid, fg_color="transparent")
@@ -421,7 +461,7 @@ class MusicControlPanel(ctk.CTkFrame):
         ).pack(pady=5)
         self.param_labels["bpm"] = ctk.CTkLabel(
             bpm_frame,
-            text="--",
+            textvariable=self.param_vars["bpm"],
             font=ctk.CTkFont(size=16, weight="bold"),
             text_color="#3498db",
         )
@@ -436,7 +476,7 @@ class MusicControlPanel(ctk.CTkFrame):
         ).pack(pady=5)
         self.param_labels["volume"] = ctk.CTkLabel(
             volume_frame,
-            text="--",
+            textvariable=self.param_vars["volume"],
             font=ctk.CTkFont(size=16, weight="bold"),
             text_color="#e67e22",
         )
@@ -455,7 +495,7 @@ class MusicControlPanel(ctk.CTkFrame):
         ).pack(pady=5)
         self.param_labels["pitch"] = ctk.CTkLabel(
             pitch_frame,
-            text="--",
+            textvariable=self.param_vars["pitch"],
             font=ctk.CTkFont(size=16, weight="bold"),
             text_color="#9b59b6",
         )
@@ -470,7 +510,7 @@ class MusicControlPanel(ctk.CTkFrame):
         ).pack(pady=5)
         self.param_labels["pan"] = ctk.CTkLabel(
             pan_frame,
-            text="--",
+            textvariable=self.param_vars["pan"],
             font=ctk.CTkFont(size=16, weight="bold"),
             text_color="#1abc9c",
         )
@@ -499,7 +539,7 @@ class MusicControlPanel(ctk.CTkFrame):
             from_=0.0,
             to=1.0,
             number_of_steps=100,
-            command=self.on_volume_change,
+            command=partial(self._coalesce, "master_volume", self.on_volume_change),
         )
         self.master_volume_slider.set(0.8)  # 默认音量
         self.master_volume_slider.pack(
@@ -536,33 +576,35 @@ class MusicControlPanel(ctk.CTkFrame):
             if self.is_running:
                 return
 
-            # 创建配置
+            # 创建配置: 主音量/更新频率/自动暂停/淡入淡出/日志设置取自对应控件
             config = AudioConfig()
-            config.master_volume = self.master_volume_slider.get()
-            config.update_rate = int(self.update_rate_slider.get())
+            for attr, widget, convert in _CONFIG_BINDINGS:
+                setattr(config, attr, convert(getattr(self, widget).get()))
 
-            # 设置分轨音量配置
+            # 设置分轨音量/静音/独奏配置
             for stem_key, slider in self.stem_volume_sliders.items():
-                if not hasattr(config, "stem_volumes"):
-                    config.stem_volumes = {}
                 config.stem_volumes[stem_key] = slider.get()
-
-            # 设置自动暂停配置
-            config.auto_pause_timeout = self.auto_pause_timeout_slider.get()
-
-            # 设置淡入淡出配置
-            config.enable_fade_transition = self.fade_enable_switch.get()
-            config.fade_duration = self.fade_duration_slider.get()
-
-            # 设置日志配置
-            config.log_level = self.log_level_var.get()
-            config.enable_verbose_logging = self.verbose_logging_switch.get()
+                config.stem_muted[stem_key] = bool(
+                    self.stem_mute_switches[stem_key].get()
+                )
+                config.stem_solo[stem_key] = bool(
+                    self.stem_solo_switches[stem_key].get()
+                )
 
             # 强制使用分轨后端 (pygame)
             config.audio_engine = "stems"
 
+            # 首次启动时创建音乐引擎, 之后复用并总是应用当前控件配置:
+            # 运行期间的分轨调节直接写入后端而不经 engine.config, 不能据其判断是否变化
+            if self._engine is None:
+                self._engine = MusicEngine(config)
+            else:
+                self._engine.update_config(config)
+
             # 创建控制器
-            self.controller = MBUXSoundDriveController(config=config)
+            self.controller = MBUXSoundDriveController(
+                config=config, engine=self._engine
+            )
             self.controller.start()
 
             # 启动后输出实际后端信息
@@ -582,17 +624,13 @@ class MusicControlPanel(ctk.CTkFrame):
             self.start_button.configure(state="disabled")
             self.stop_button.configure(state="disabled")  # 在初始化完成后再启用
 
-            # 启动UI更新线程
-            self.should_update = True
-            self.update_thread = threading.Thread(
-                target=self.update_ui_loop, daemon=True
-            )
-            self.update_thread.start()
+            # 启动UI刷新
+            self._refresh_job = self.after(UI_REFRESH_INTERVAL_MS, self.refresh_ui)
 
             print("[音乐控制面板] MBUX 音乐引擎已启动")
 
             # 延迟启用停止按钮
-            self.after(1000, lambda: self.stop_button.configure(state="normal"))
+            self.after(1000, partial(self.stop_button.configure, state="normal"))
 
         except Exception as e:
             self.show_error(f"启动音乐引擎失败: {e}")
@@ -603,8 +641,8 @@ class MusicControlPanel(ctk.CTkFrame):
             if not self.is_running:
                 return
 
-            # 停止UI更新
-            self.should_update = False
+            # 停止UI刷新
+            self._cancel_refresh()
 
             # 停止控制器
             if self.controller:
@@ -614,15 +652,15 @@ class MusicControlPanel(ctk.CTkFrame):
             # 更新状态
             self.is_running = False
             self.status_label.configure(text="🔴 音乐引擎已停止", text_color="#e74c3c")
-            self.pause_status_label.configure(text="")
+            self.update_pause_status_display("", "#f39c12")
 
             # 更新按钮状态
             self.start_button.configure(state="normal")
             self.stop_button.configure(state="disabled")
 
             # 清空参数显示
-            for label in self.param_labels.values():
-                label.configure(text="--")
+            for key in self.param_labels:
+                self._set_param_text(key, "--")
 
             print("[音乐控制面板] MBUX 音乐引擎已停止")
 
@@ -633,6 +671,21 @@ class MusicControlPanel(ctk.CTkFrame):
     # 回调函数
     # ------------------------------------------------------------------
 
+    def _coalesce(self, key: Any, callback: Callable[..., None], *args: Any) -> None:
+        """合并滑块拖动产生的连续回调
+
+        拖动时每移动一个像素都会触发回调; 这里只记录最新参数, 并在当前
+        事件批处理完后的空闲时刻执行一次, 标签与引擎不再逐像素更新。
+        """
+        if key not in self._pending_updates:
+            self.after_idle(self._flush_update, key)
+        self._pending_updates[key] = (callback, args)
+
+    def _flush_update(self, key: Any) -> None:
+        """执行合并后的滑块回调（主线程中执行）"""
+        callback, args = self._pending_updates.pop(key)
+        callback(*args)
+
     def on_volume_change(self, value: float) -> None:
         """主音量变化回调"""
         if self.controller and self.is_running:
@@ -690,56 +743,62 @@ class MusicControlPanel(ctk.CTkFrame):
         # 更新频率需要重新启动控制器
         pass  # 暂时不处理实时更改
 
-    def update_ui_loop(self) -> None:
-        """UI更新循环"""
-        import time
+    def refresh_ui(self) -> None:
+        """UI刷新（主线程中执行）
 
-        while self.should_update and self.is_running:
-            try:
-                if self.controller:
-                    # 获取控制器状态
-                    controller_status = self.controller.get_status()
-
-                    # 更新暂停状态显示
-                    if controller_status.get("paused_due_to_no_data", False):
-                        pause_text = "⏸️ 自动暂停 - 无数据输入"
-                        pause_color = "#f39c12"
-                    elif self.controller.engine.is_paused():
-                        pause_text = "⏸️ 已暂停"
-                        pause_color = "#e67e22"
-                    else:
-                        pause_text = ""
-                        pause_color = "#27ae60"
-
-                    # 在主线程中更新UI
-                    self.after(
-                        0, self.update_pause_status_display, pause_text, pause_color
-                    )
-
-                    # 更新音乐参数
-                    if self.controller.engine.current_params:
-                        params = self.controller.engine.current_params
-                        self.after(0, self.update_parameters_display, params)
-
-                time.sleep(0.1)  # 10Hz更新频率
-
-            except Exception as e:
-                print(f"[音乐控制面板] UI更新错误: {e}")
-                time.sleep(0.2)
+        控制器线程只向参数环发布最新参数, 不直接触碰 Tk; 本方法经 after
+        链按固定间隔读取最新值并刷新界面, 遥测频率再高也不会多画。
+        """
+        self._refresh_job = None
+        if not self.is_running or self.controller is None:
+            return
+
+        try:
+            controller = self.controller
+
+            # 更新暂停状态显示
+            if controller.paused_due_to_no_data:
+                pause_text = "⏸️ 自动暂停 - 无数据输入"
+                pause_color = "#f39c12"
+            elif controller.engine.is_paused():
+                pause_text = "⏸️ 已暂停"
+                pause_color = "#e67e22"
+            else:
+                pause_text = ""
+                pause_color = "#27ae60"
+            self.update_pause_status_display(pause_text, pause_color)
+
+            # 更新音乐参数(读取控制器最近发布的参数)
+            params = controller.params_ring.latest()
+            if params is not None:
+                self.update_parameters_display(params)
+
+        except Exception as e:
+            print(f"[音乐控制面板] UI更新错误: {e}")
+
+        self._refresh_job = self.after(UI_REFRESH_INTERVAL_MS, self.refresh_ui)
+
+    def _cancel_refresh(self) -> None:
+        """取消尚未执行的UI刷新"""
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
 
     def update_pause_status_display(self, text: str, color: str) -> None:
         """更新暂停状态显示（主线程中执行）"""
         try:
-            self.pause_status_label.configure(text=text, text_color=color)
+            if self._pause_status != (text, color):
+                self.pause_status_label.configure(text=text, text_color=color)
+                self._pause_status = (text, color)
         except Exception as e:
             print(f"[音乐控制面板] 暂停状态显示更新错误: {e}")
 
     def update_parameters_display(self, params) -> None:
         """更新参数显示（主线程中执行）"""
         try:
-            self.param_labels["bpm"].configure(text=f"{params.bpm:.1f}")
-            self.param_labels["volume"].configure(text=f"{params.volume:.2f}")
-            self.param_labels["pitch"].configure(text=f"{params.base_pitch}")
+            self._set_param_text("bpm", f"{params.bpm:.1f}")
+            self._set_param_text("volume", f"{params.volume:.2f}")
+            self._set_param_text("pitch", f"{params.base_pitch}")
 
             # 声像显示
             pan_text = "中央"
@@ -747,11 +806,17 @@ class MusicControlPanel(ctk.CTkFrame):
                 pan_text = f"右 {params.pan:.2f}"
             elif params.pan < -0.1:
                 pan_text = f"左 {abs(params.pan):.2f}"
-            self.param_labels["pan"].configure(text=pan_text)
+            self._set_param_text("pan", pan_text)
 
         except Exception as e:
             print(f"[音乐控制面板] 参数显示更新错误: {e}")
 
+    def _set_param_text(self, key: str, text: str) -> None:
+        """设置参数标签文本, 与上次写入相同时跳过变量写入"""
+        if self._param_texts.get(key) != text:
+            self.param_vars[key].set(text)
+            self._param_texts[key] = text
+
     def show_error(self, message: str) -> None:
         """显示错误信息"""
         print(f"[音乐控制面板] 错误: {message}")
@@ -759,6 +824,9 @@ class MusicControlPanel(ctk.CTkFrame):
 
     def cleanup(self) -> None:
         """清理资源"""
-        self.should_update = False
+        self._cancel_refresh()
         if self.is_running:
             self.stop_music_engine()
+        if self._engine is not None:
+            self._engine.cleanup()
+            self._engine = None
@@ -8,7 +8,7 @@
 
 import json
 import os
-import threading
+from functools import partial
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Any, Dict, List, Optional
@@ -308,7 +308,7 @@ class MusicLibraryPanel(ctk.CTkFrame):
             analyze_btn = ctk.CTkButton(
                 action_frame,
                 text="分析",
-                command=lambda m=music: self.analyze_single_music(m),
+                command=partial(self.analyze_single_music, music),
                 width=60,
                 height=25,
                 font=ctk.CTkFont(size=11),
@@ -316,30 +316,28 @@ class MusicLibraryPanel(ctk.CTkFrame):
             analyze_btn.pack()
 
     def analyze_single_music(self, music: Dict[str, Any]) -> None:
-        """分析单个音乐"""
+        """分析单个音乐
 
-        def run_analysis():
-            try:
-                # 这里简化处理，实际应该调用song_analyzer
-                messagebox.showinfo("分析", f"开始分析: {music['name']}")
-
-                # 模拟分析过程
-                import time
-
-                time.sleep(2)
+        分析过程为模拟(约 2 秒), 由 after 定时回调在主线程完成,
+        不再另起线程从后台调用 Tk。
+        """
+        # 这里简化处理，实际应该调用song_analyzer
+        messagebox.showinfo("分析", f"开始分析: {music['name']}")
 
-                # 更新状态
-                music["analyzed"] = True
-                self.refresh_library_display()
+        # 模拟分析过程
+        self.after(2000, self._finish_analysis, music)
 
-                messagebox.showinfo("完成", f"分析完成: {music['name']}")
+    def _finish_analysis(self, music: Dict[str, Any]) -> None:
+        """完成单个音乐的分析（主线程中执行）"""
+        try:
+            # 更新状态
+            music["analyzed"] = True
+            self.refresh_library_display()
 
-            except Exception as e:
-                messagebox.showerror("错误", f"分析失败: {str(e)}")
+            messagebox.showinfo("完成", f"分析完成: {music['name']}")
 
-        # 在新线程中运行分析
-        thread = threading.Thread(target=run_analysis, daemon=True)
-        thread.start()
+        except Exception as e:
+            messagebox.showerror("错误", f"分析失败: {str(e)}")
 
     def analyze_selected(self) -> None:
         """分析选中的音乐"""
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import time
 
+from pythonosc.osc_bundle_builder import IMMEDIATELY, OscBundleBuilder
+from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.udp_client import SimpleUDPClient
 
 from ..core.telemetry import ACCTelemetry
@@ -14,35 +16,53 @@ class ACCDataSender:
         self.telemetry = ACCTelemetry()
 
     def send_data(self):
-        """读取并发送遥测数据"""
+        """读取并发送遥测数据
+
+        一帧内的全部地址打包为单个 OSC bundle 发送, 每帧只产生一个 UDP 数据包;
+        标准 OSC 接收端(如 python-osc 的 dispatcher)会将其拆分为各条消息分发
+        """
         data = self.telemetry.get_telemetry()
 
         if data is not None:
-            # 发送基础数据
-            self.client.send_message("/acc/speed", float(data.speed))
-            self.client.send_message("/acc/rpm", int(data.rpm))
-            self.client.send_message("/acc/gear", int(data.gear))
-            self.client.send_message("/acc/fuel", float(data.fuel))
-
-            # 发送踏板数据
-            self.client.send_message("/acc/pedals/throttle", float(data.throttle))
-            self.client.send_message("/acc/pedals/brake", float(data.brake))
-            self.client.send_message("/acc/pedals/clutch", float(data.clutch))
-
-            # 发送轮胎压力数据
-            self.client.send_message("/acc/tires/fl", float(data.tire_pressure_fl))
-            self.client.send_message("/acc/tires/fr", float(data.tire_pressure_fr))
-            self.client.send_message("/acc/tires/rl", float(data.tire_pressure_rl))
-            self.client.send_message("/acc/tires/rr", float(data.tire_pressure_rr))
+            bundle = OscBundleBuilder(IMMEDIATELY)
+            for address, value in (
+                # 基础数据
+                ("/acc/speed", float(data.speed)),
+                ("/acc/rpm", int(data.rpm)),
+                ("/acc/gear", int(data.gear)),
+                ("/acc/fuel", float(data.fuel)),
+                # 踏板数据
+                ("/acc/pedals/throttle", float(data.throttle)),
+                ("/acc/pedals/brake", float(data.brake)),
+                ("/acc/pedals/clutch", float(data.clutch)),
+                # 轮胎压力数据
+                ("/acc/tires/fl", float(data.tire_pressure_fl)),
+                ("/acc/tires/fr", float(data.tire_pressure_fr)),
+                ("/acc/tires/rl", float(data.tire_pressure_rl)),
+                ("/acc/tires/rr", float(data.tire_pressure_rr)),
+            ):
+                message = OscMessageBuilder(address)
+                message.add_arg(value)
+                bundle.add_content(message.build())
+            self.client.send(bundle.build())
 
     def run(self):
         """运行数据发送循环"""
         try:
             print(f"开始发送数据...")
+            # 以60fps的频率发送数据: 按单调时钟推进绝对截止时间, 只休眠剩余部分,
+            # 读取与发送的耗时不会累积成漂移
+            interval = 1 / 60
+            deadline = time.monotonic()
             while True:
                 self.send_data()
-                # 以60fps的频率发送数据
-                time.sleep(1 / 60)
+                deadline += interval
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    # 已落后于节拍, 重新对齐, 避免连续追赶
+                    deadline = time.monotonic()
         except KeyboardInterrupt:
             print("\n停止发送数据")
         finally:
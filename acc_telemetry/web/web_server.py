@@ -9,6 +9,9 @@ from flask_socketio import SocketIO, emit
 
 from ..core.telemetry import ACCTelemetry
 
+# 推送循环错误输出的最小间隔（秒）
+ERROR_LOG_INTERVAL = 1.0
+
 
 class WebTelemetryServer:
     def __init__(self, host="0.0.0.0", port=8080):
@@ -28,9 +31,10 @@ class WebTelemetryServer:
         # 加载显示设置
         self.load_display_settings()
 
-        # 数据更新线程控制
+        # 数据更新线程控制: 置位即停止, 等待中的线程立即醒来
         self.running = False
         self.update_thread = None
+        self._stop_event = threading.Event()
 
         # 设置路由
         self.setup_routes()
@@ -273,23 +277,32 @@ class WebTelemetryServer:
     def update_data_loop(self):
         """数据更新循环（优化版本）"""
         update_interval = 1 / 30  # 降低到30fps，减少CPU占用
-        
-        while self.running:
+        wait = self._stop_event.wait
+
+        # 错误计数与上次输出时间：持续异常时合并为每秒一条，避免刷屏拖慢推送线程
+        error_count = 0
+        last_error_log = -ERROR_LOG_INTERVAL
+
+        while not wait(update_interval):
             try:
                 data = self.telemetry.get_telemetry()
                 formatted_data = self.format_telemetry_data(data)
 
                 if formatted_data:
                     self.socketio.emit("telemetry_update", formatted_data)
-
-                time.sleep(update_interval)
             except Exception as e:
-                print(f"数据更新错误: {e}")
-                time.sleep(0.1)  # 错误时延长等待时间
+                error_count += 1
+                now = time.monotonic()
+                if now - last_error_log >= ERROR_LOG_INTERVAL:
+                    print(f"数据更新错误(近 {error_count} 次): {e}")
+                    error_count = 0
+                    last_error_log = now
+                wait(0.1)  # 错误时延长等待时间
 
     def start(self):
         """启动Web服务器"""
         self.running = True
+        self._stop_event.clear()
         self.update_thread = threading.Thread(target=self.update_data_loop)
         self.update_thread.daemon = True
         self.update_thread.start()
@@ -302,8 +315,10 @@ class WebTelemetryServer:
     def stop(self):
         """停止Web服务器"""
         self.running = False
+        self._stop_event.set()
         if self.update_thread:
-            self.update_thread.join()
+            self.update_thread.join(timeout=0.5)
+            self.update_thread = None
 
 
 if __name__ == "__main__":
@@ -99,7 +99,12 @@ def main():
 
             with open(config_path, "r", encoding="utf-8") as f:
                 config = json.load(f)
-                current_output = config.get("global", {}).get("output_device", "未设置")
+                # 当前格式为顶层字段; 旧版 "global" 分组中的值优先(与加载逻辑一致)
+                current_output = config.get("global", {}).get(
+                    "output_device", config.get("output_device")
+                )
+                if current_output is None:
+                    current_output = "未设置"
                 print(f"6. 当前配置文件中的输出设备: {current_output}")
         else:
             print("6. 配置文件不存在，将使用默认设备")
@@ -107,7 +112,7 @@ def main():
         print()
         print("使用说明:")
         print("- 要指定特定输出设备，请编辑 acc_telemetry/config/audio_config.json")
-        print('- 在 global 部分添加: "output_device": "设备名称"')
+        print('- 在顶层添加或修改: "output_device": "设备名称"')
         print("- 重启应用程序使配置生效")
 
     except Exception as e:
@@ -13,7 +13,6 @@ ACC_Telemetry 数据可视化示例
 
 import sys
 import time
-from collections import deque
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -55,17 +54,10 @@ class TelemetryVisualizer:
         # 初始化遥测数据读取器
         self.telemetry = ACCTelemetry()
 
-        # 初始化数据缓冲区
-        self.timestamps = deque(maxlen=BUFFER_SIZE)
-        self.speeds = deque(maxlen=BUFFER_SIZE)
-        self.rpms = deque(maxlen=BUFFER_SIZE)
-        self.throttles = deque(maxlen=BUFFER_SIZE)
-        self.brakes = deque(maxlen=BUFFER_SIZE)
-        self.clutches = deque(maxlen=BUFFER_SIZE)
-        self.tire_fl = deque(maxlen=BUFFER_SIZE)
-        self.tire_fr = deque(maxlen=BUFFER_SIZE)
-        self.tire_rl = deque(maxlen=BUFFER_SIZE)
-        self.tire_rr = deque(maxlen=BUFFER_SIZE)
+        # 初始化数据缓冲区: 每行一路数据, 新样本写在末列
+        # 行顺序: 时间, 速度, 转速, 油门, 刹车, 离合, 左前/右前/左后/右后胎压
+        self.buffer = np.zeros((10, BUFFER_SIZE))
+        self.count = 0
 
         # 初始化时间基准
         self.start_time = time.time()
@@ -132,17 +124,22 @@ class TelemetryVisualizer:
             # 计算相对时间（从启动开始的秒数）
             current_time = time.time() - self.start_time
 
-            # 更新数据缓冲区
-            self.timestamps.append(current_time)
-            self.speeds.append(data.speed)
-            self.rpms.append(data.rpm)
-            self.throttles.append(data.throttle * 100)  # 转换为百分比
-            self.brakes.append(data.brake * 100)
-            self.clutches.append(data.clutch * 100)
-            self.tire_fl.append(data.tire_pressure_fl)
-            self.tire_fr.append(data.tire_pressure_fr)
-            self.tire_rl.append(data.tire_pressure_rl)
-            self.tire_rr.append(data.tire_pressure_rr)
+            # 整体左移一列后在末列写入新样本
+            buf = self.buffer
+            buf[:, :-1] = buf[:, 1:]
+            buf[:, -1] = (
+                current_time,
+                data.speed,
+                data.rpm,
+                data.throttle * 100,  # 转换为百分比
+                data.brake * 100,
+                data.clutch * 100,
+                data.tire_pressure_fl,
+                data.tire_pressure_fr,
+                data.tire_pressure_rl,
+                data.tire_pressure_rr,
+            )
+            self.count = min(self.count + 1, BUFFER_SIZE)
 
             return True
         return False
@@ -152,57 +149,37 @@ class TelemetryVisualizer:
         # 更新数据
         success = self.update_data()
 
-        if success and len(self.timestamps) > 1:
-            # 转换为数组以便绘图
-            times = np.array(self.timestamps)
+        if success and self.count > 1:
+            # 取有效样本区间的视图, 无需逐帧复制缓冲区
+            view = self.buffer[:, -self.count :]
+            times = view[0]
 
             # 更新线条数据
-            self.speed_line.set_data(times, np.array(self.speeds))
-            self.rpm_line.set_data(times, np.array(self.rpms))
+            self.speed_line.set_data(times, view[1])
+            self.rpm_line.set_data(times, view[2])
 
-            self.throttle_line.set_data(times, np.array(self.throttles))
-            self.brake_line.set_data(times, np.array(self.brakes))
-            self.clutch_line.set_data(times, np.array(self.clutches))
+            self.throttle_line.set_data(times, view[3])
+            self.brake_line.set_data(times, view[4])
+            self.clutch_line.set_data(times, view[5])
 
-            self.tire_fl_line.set_data(times, np.array(self.tire_fl))
-            self.tire_fr_line.set_data(times, np.array(self.tire_fr))
-            self.tire_rl_line.set_data(times, np.array(self.tire_rl))
-            self.tire_rr_line.set_data(times, np.array(self.tire_rr))
+            self.tire_fl_line.set_data(times, view[6])
+            self.tire_fr_line.set_data(times, view[7])
+            self.tire_rl_line.set_data(times, view[8])
+            self.tire_rr_line.set_data(times, view[9])
 
-            # 调整坐标轴范围
-            for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
-                ax.relim()
-                ax.autoscale_view()
-
-            # 设置固定的y轴范围
-            if len(self.speeds) > 0:
-                self.ax1.set_ylim(0, max(max(self.speeds) * 1.1, 10))
-
-            if len(self.rpms) > 0:
-                self.ax2.set_ylim(0, max(max(self.rpms) * 1.1, 1000))
+            # 坐标轴范围均显式给出, 无需 relim/autoscale_view
+            self.ax1.set_ylim(0, max(view[1].max() * 1.1, 10))
+            self.ax2.set_ylim(0, max(view[2].max() * 1.1, 1000))
 
             # 踏板状态固定为0-100%
             self.ax3.set_ylim(0, 100)
 
-            if len(self.tire_fl) > 0:
-                min_pressure = min(
-                    min(self.tire_fl),
-                    min(self.tire_fr),
-                    min(self.tire_rl),
-                    min(self.tire_rr),
-                )
-                max_pressure = max(
-                    max(self.tire_fl),
-                    max(self.tire_fr),
-                    max(self.tire_rl),
-                    max(self.tire_rr),
-                )
-                self.ax4.set_ylim(min_pressure * 0.9, max_pressure * 1.1)
+            tires = view[6:]
+            self.ax4.set_ylim(tires.min() * 0.9, tires.max() * 1.1)
 
             # 调整x轴范围，只显示最近的数据
             for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
-                if len(times) > 0:
-                    ax.set_xlim(max(0, times[-1] - 20), times[-1] + 1)
+                ax.set_xlim(max(0, times[-1] - 20), times[-1] + 1)
 
         return [
             self.speed_line,
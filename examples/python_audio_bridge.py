@@ -9,17 +9,50 @@ ACC 遥测 -> 纯 Python 音频 MVP 增强版 (MBUX Sound Drive 风格)
 - "越开越上头"的层次递进：低速平静环境音，高速全分轨燃爆，多层次渐入渐出
 """
 
+import functools
+import logging
 import math
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
 import pygame
 
+from acc_telemetry.audio import _kernels
 from acc_telemetry.core.telemetry import ACCTelemetry
 
+logger = logging.getLogger(__name__)
+
+# 声道音量写入的最小步长: 低于 SDL 混音精度(1/128)的变化不再写入
+_VOLUME_WRITE_STEP = 1.0 / 256
+
+# 变调网格（每半音的细分步数）与每个音轨缓存的变调 Sound 数量
+_RETUNE_STEPS = 16
+_RETUNE_CACHE_SIZE = 32
+
+# 变调网格上各步对应的重采样比率（±24 半音），按 step + _RETUNE_OFFSET 查表
+_RETUNE_OFFSET = 24 * _RETUNE_STEPS
+_RETUNE_RATIOS = 2.0 ** (
+    np.arange(-_RETUNE_OFFSET, _RETUNE_OFFSET + 1) / (12.0 * _RETUNE_STEPS)
+)
+
+# 鼓点一次性音色的专用声道数（轮转使用，允许相邻击打的尾音重叠）
+_DRUM_CHANNELS = 4
+
+# 重采样比率下限：输出长度至多为原循环的 1/_MIN_RATIO 倍
+_MIN_RATIO = 0.125
+
+
+@functools.lru_cache(maxsize=8)
+def _frame_ramp(n: int) -> np.ndarray:
+    """返回只读的 float32 帧序号 [0, n)，供重采样按需切片复用"""
+    ramp = np.arange(n, dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
 
 @dataclass
 class SineVoice:
@@ -27,7 +60,11 @@ class SineVoice:
 
     sound: pygame.mixer.Sound
     channel: pygame.mixer.Channel
-    base_buffer: np.ndarray
+    # 单声道循环缓冲（float32），变调时据此重采样；不变调的音轨为 None
+    base_buffer: Optional[np.ndarray]
+    volume: float = 0.0  # 最近一次写入声道的音量
+    # 变调缓存：变调网格步数 -> 重采样后的 Sound（LRU 顺序）
+    retuned: "OrderedDict[int, pygame.mixer.Sound]" = field(default_factory=OrderedDict)
 
 
 class MultiLayerSynth:
@@ -47,6 +84,8 @@ class MultiLayerSynth:
             sample_rate: 采样率
         """
         self.sample_rate = sample_rate
+        # 噪声源：PCG64 生成器，整段噪声一次生成
+        self._rng = np.random.default_rng()
 
         # 预生成分轨音色
         self.kick = self._make_kick()
@@ -59,41 +98,110 @@ class MultiLayerSynth:
         self.lead_voice = self._create_lead_voice()
         self.ambient_voice = self._create_ambient_voice()
 
+        # 鼓点专用声道：在持续音轨占用的声道之后追加并预先取得 Channel 对象，
+        # 每次击打只需在轮转到的声道上设音量并播放，无需临时查找空闲声道
+        first = pygame.mixer.get_num_channels()
+        pygame.mixer.set_num_channels(first + _DRUM_CHANNELS)
+        self._drum_channels = [
+            pygame.mixer.Channel(first + i) for i in range(_DRUM_CHANNELS)
+        ]
+        self._next_drum = 0
+
         # 内部状态：避免过于频繁地重采样导致点击
         self._pad_last_semitones = 0.0
         self._bass_last_semitones = 0.0
 
+    def _time_axis(self, dur: float) -> np.ndarray:
+        """生成 dur 秒的采样时间轴（秒），所有分轨生成器共用
+
+        时间轴为 float32，其后的 sin/exp 与包络运算随之以 float32 进行
+        （Python 浮点常量不会把结果提升为 float64），输出为 16 位 PCM，
+        float32 精度绰绰有余。
+        """
+        n = int(self.sample_rate * dur)
+        return np.arange(n, dtype=np.float32) * np.float32(1.0 / self.sample_rate)
+
+    def _noise(self, n: int) -> np.ndarray:
+        """生成 n 个 [-1, 1) 均匀分布的 float32 白噪声样本"""
+        noise = self._rng.random(n, dtype=np.float32)
+        noise *= 2.0
+        noise -= 1.0
+        return noise
+
+    def _pcm16(self, mono: np.ndarray) -> np.ndarray:
+        """单声道浮点缓冲 -> 立体声 int16 PCM
+
+        缩放与限幅在单声道 float32 缓冲上原地完成，仅在量化时写入左右两列，
+        不再先复制成立体声再逐步缩放、限幅、转换。
+        """
+        scaled = np.multiply(mono, 32767.0, dtype=np.float32)
+        np.clip(scaled, -32767.0, 32767.0, out=scaled)
+        pcm = np.empty((scaled.shape[0], 2), dtype=np.int16)
+        pcm[:, 0] = scaled
+        pcm[:, 1] = scaled
+        return pcm
+
     def _to_sound(self, mono: np.ndarray) -> pygame.mixer.Sound:
-        """转换单声道为立体声 Sound 对象"""
-        mono = np.clip(mono, -1.0, 1.0)
-        stereo = np.stack([mono, mono], axis=1)
-        data = (stereo * 32767).astype(np.int16)
-        return pygame.mixer.Sound(buffer=data.tobytes())
+        """转换单声道为立体声 Sound 对象
+
+        (N, 2) 的 C 连续 int16 数组即 SDL 所需的交错立体声布局，
+        直接经缓冲区协议交给 pygame，不再经 tobytes() 多复制一份。
+        """
+        return pygame.mixer.Sound(buffer=self._pcm16(mono))
+
+    def _start_loop(self, buffer: np.ndarray, retunable: bool = True) -> SineVoice:
+        """以单声道缓冲创建循环持续音轨，并以静音开始播放
+
+        Args:
+            buffer: 单声道循环缓冲
+            retunable: 是否需要变调；否则 int16 Sound 即唯一副本，不再保留浮点缓冲
+        """
+        sound = self._to_sound(buffer)
+        channel = pygame.mixer.find_channel(True)
+        if channel:
+            channel.play(sound, loops=-1)
+            channel.set_volume(0.0)  # 初始静音
+
+        # 左右声道相同，只保留单声道副本供变调，立体声在量化时才展开
+        voice = SineVoice(
+            sound=sound, channel=channel, base_buffer=buffer if retunable else None
+        )
+        voice.retuned[0] = sound  # 原调即未变调的循环本身
+        return voice
 
     def _make_kick(self, dur: float = 0.18) -> pygame.mixer.Sound:
         """生成深沉底鼓：双层下滑正弦"""
-        t = np.linspace(0.0, dur, int(self.sample_rate * dur), endpoint=False)
-        # 主体：60Hz -> 35Hz
-        f1 = 60.0 * np.exp(-t * 8.0)
-        wave1 = np.sin(2 * np.pi * f1 * t) * np.exp(-t * 20.0)
+        t = self._time_axis(dur)
+        # 主体：60Hz -> 35Hz（频率 -> 相位 -> 波形在同一缓冲上原地推进）
+        wave = np.exp(-t * 8.0)
+        wave *= 60.0 * 2 * np.pi
+        wave *= t
+        np.sin(wave, out=wave)
+        wave *= np.exp(-t * 20.0)
         # 点击感：140Hz -> 80Hz
-        f2 = 140.0 * np.exp(-t * 12.0)
-        wave2 = np.sin(2 * np.pi * f2 * t) * np.exp(-t * 35.0) * 0.4
-        sig = wave1 + wave2
-        return self._to_sound(sig.astype(np.float32))
+        click = np.exp(-t * 12.0)
+        click *= 140.0 * 2 * np.pi
+        click *= t
+        np.sin(click, out=click)
+        click *= np.exp(-t * 35.0)
+        click *= 0.4
+        wave += click
+        return self._to_sound(wave)
 
     def _make_snare(self, dur: float = 0.15) -> pygame.mixer.Sound:
         """生成电子军鼓：噪声+音调成分"""
-        n = int(self.sample_rate * dur)
-        t = np.linspace(0.0, dur, n, endpoint=False)
+        t = self._time_axis(dur)
+        n = t.shape[0]
 
         # 噪声成分
-        noise = np.random.uniform(-1.0, 1.0, size=n)
+        noise = self._noise(n)
         # 音调成分（200Hz）
-        tone = np.sin(2 * np.pi * 200.0 * t) * 0.3
-        # 混合与包络
-        sig = (noise + tone) * np.exp(-t * 25.0)
-        return self._to_sound(sig.astype(np.float32))
+        tone = np.sin(2 * np.pi * 200.0 * t)
+        tone *= 0.3
+        # 混合与包络（原地写回噪声缓冲）
+        noise += tone
+        noise *= np.exp(-t * 25.0)
+        return self._to_sound(noise)
 
     def _make_hat(self, dur: float = 0.06) -> pygame.mixer.Sound:
         """生成现代踩镲：更柔和的高频质感，避免刺耳
@@ -103,58 +211,44 @@ class MultiLayerSynth:
         - 保留快速衰减的包络，减少持续的高频残响
         - 降低整体增益，避免在高密度节拍下累积成刺耳的高频
         """
-        n = int(self.sample_rate * dur)
-        t = np.linspace(0.0, dur, n, endpoint=False)
+        t = self._time_axis(dur)
+        n = t.shape[0]
 
         # 随机噪声作为基础
-        noise = np.random.uniform(-1.0, 1.0, size=n).astype(np.float32)
+        noise = self._noise(n)
 
-        # 简单高通（去除低频成分）
-        hp = np.empty_like(noise)
-        hp[0] = 0.0
-        hp[1:] = noise[1:] - 0.90 * noise[:-1]
+        # 简单高通（去除低频成分）：右侧先求值为临时量，可安全原地写回
+        noise[1:] -= 0.90 * noise[:-1]
+        noise[0] = 0.0
 
-        # 轻度低通平滑，驯服最尖锐的高频
-        lp = np.empty_like(hp)
-        lp[0] = hp[0]
+        # 轻度低通平滑（原地），驯服最尖锐的高频
         alpha = 0.25  # 越小越平滑
-        for i in range(1, n):
-            lp[i] = lp[i - 1] + alpha * (hp[i] - lp[i - 1])
+        _kernels.feedback_smooth(noise, alpha, 1.0 - alpha, 1)
 
         # 快速衰减包络，减少延音
-        env = np.exp(-t * 45.0).astype(np.float32)
-        sig = (lp * env * 0.45).astype(np.float32)
+        noise *= np.exp(-t * 45.0)
+        noise *= 0.45
 
-        return self._to_sound(sig)
+        return self._to_sound(noise)
 
     def _create_bass_voice(self, base_freq: float = 55.0) -> SineVoice:
         """创建贝斯声部：深沉持续音，可调音高和音量"""
         dur = 0.1  # 循环片段
-        t = np.linspace(0.0, dur, int(self.sample_rate * dur), endpoint=False)
+        t = self._time_axis(dur)
         # 基频 + 八度泛音
         wave = np.sin(2 * np.pi * base_freq * t) + 0.3 * np.sin(
             2 * np.pi * base_freq * 2 * t
         )
         # 轻微低通特征
-        for i in range(1, len(wave)):
-            wave[i] = wave[i] * 0.95 + wave[i - 1] * 0.05
+        _kernels.feedback_smooth(wave, 0.95, 0.05, 1)
 
-        buffer = (wave * 0.4).astype(np.float32)
-        stereo = np.stack([buffer, buffer], axis=1)
-        data = (stereo * 32767).astype(np.int16)
-
-        sound = pygame.mixer.Sound(buffer=data.tobytes())
-        channel = pygame.mixer.find_channel(True)
-        if channel:
-            channel.play(sound, loops=-1)
-            channel.set_volume(0.0)  # 初始静音
-
-        return SineVoice(sound=sound, channel=channel, base_buffer=stereo)
+        wave *= 0.4
+        return self._start_loop(wave)
 
     def _create_pad_voice(self, base_freq: float = 220.0) -> SineVoice:
         """创建合成器垫子：温暖和声，转向时变化音高"""
         dur = 0.2
-        t = np.linspace(0.0, dur, int(self.sample_rate * dur), endpoint=False)
+        t = self._time_axis(dur)
         # 和弦式复合波形
         wave = (
             0.6 * np.sin(2 * np.pi * base_freq * t)  # 根音
@@ -163,66 +257,40 @@ class MultiLayerSynth:
         )  # 完全五度
 
         # 软化处理
-        for i in range(3, len(wave)):
-            wave[i] = wave[i] * 0.7 + (wave[i - 1] + wave[i - 2] + wave[i - 3]) * 0.1
-
-        buffer = (wave * 0.25).astype(np.float32)
-        stereo = np.stack([buffer, buffer], axis=1)
-        data = (stereo * 32767).astype(np.int16)
-
-        sound = pygame.mixer.Sound(buffer=data.tobytes())
-        channel = pygame.mixer.find_channel(True)
-        if channel:
-            channel.play(sound, loops=-1)
-            channel.set_volume(0.0)
+        _kernels.feedback_smooth(wave, 0.7, 0.1, 3)
 
-        return SineVoice(sound=sound, channel=channel, base_buffer=stereo)
+        wave *= 0.25
+        return self._start_loop(wave)
 
     def _create_lead_voice(self, base_freq: float = 440.0) -> SineVoice:
         """创建主旋律声部：明亮lead，高转速时激活"""
         dur = 0.08
-        t = np.linspace(0.0, dur, int(self.sample_rate * dur), endpoint=False)
+        t = self._time_axis(dur)
         # 锯齿波近似（基频+泛音） - 柔化：减少高频泛音数量
-        wave = np.sin(2 * np.pi * base_freq * t)
-        for n in range(2, 4):  # 仅保留前两次泛音，减少高频能量
-            wave += np.sin(2 * np.pi * base_freq * n * t) / n
+        # 各次谐波以外积一次性求值后按 1/n 加权求和
+        harmonics = np.arange(1, 4, dtype=np.float32)  # 仅保留前两次泛音，减少高频能量
+        partials = np.sin(np.multiply.outer(t, 2 * np.pi * base_freq * harmonics))
+        wave = partials @ (1.0 / harmonics)
 
         # 更轻微的软限幅以避免过多高频尖峰
-        wave = np.tanh(wave * 1.1) * 0.6
+        wave *= 1.1
+        np.tanh(wave, out=wave)
+        wave *= 0.6
 
-        buffer = wave.astype(np.float32) * 0.3
-        stereo = np.stack([buffer, buffer], axis=1)
-        data = (stereo * 32767).astype(np.int16)
-
-        sound = pygame.mixer.Sound(buffer=data.tobytes())
-        channel = pygame.mixer.find_channel(True)
-        if channel:
-            channel.play(sound, loops=-1)
-            channel.set_volume(0.0)
-
-        return SineVoice(sound=sound, channel=channel, base_buffer=stereo)
+        wave *= 0.3
+        return self._start_loop(wave, retunable=False)
 
     def _create_ambient_voice(self) -> SineVoice:
         """创建氛围声部：白噪声基底，G力驱动"""
         dur = 0.5
         n = int(self.sample_rate * dur)
         # 粉红噪声近似
-        noise = np.random.uniform(-1.0, 1.0, size=n)
+        noise = self._noise(n)
         # 简单低通（模拟粉红噪声特征）
-        for i in range(1, len(noise)):
-            noise[i] = noise[i] * 0.8 + noise[i - 1] * 0.2
+        _kernels.feedback_smooth(noise, 0.8, 0.2, 1)
 
-        buffer = (noise * 0.15).astype(np.float32)
-        stereo = np.stack([buffer, buffer], axis=1)
-        data = (stereo * 32767).astype(np.int16)
-
-        sound = pygame.mixer.Sound(buffer=data.tobytes())
-        channel = pygame.mixer.find_channel(True)
-        if channel:
-            channel.play(sound, loops=-1)
-            channel.set_volume(0.0)
-
-        return SineVoice(sound=sound, channel=channel, base_buffer=stereo)
+        noise *= 0.15
+        return self._start_loop(noise, retunable=False)
 
     def update_bass(self, volume: float, pitch_shift: float = 1.0) -> None:
         """更新贝斯音量和音高
@@ -232,7 +300,7 @@ class MultiLayerSynth:
             pitch_shift: 以半音为单位的变调值（正升负降）
         """
         if self.bass_voice.channel:
-            self.bass_voice.channel.set_volume(max(0.0, min(1.0, volume)))
+            self._set_voice_volume(self.bass_voice, volume)
             # 根据半音阈值进行重采样变调，避免频繁操作点击
             semitones = max(-24.0, min(24.0, pitch_shift))
             if abs(semitones - self._bass_last_semitones) >= 0.5:
@@ -242,7 +310,7 @@ class MultiLayerSynth:
     def update_pad(self, volume: float, pitch_shift: float = 1.0) -> None:
         """更新合成器垫子：音量和音高变化"""
         if self.pad_voice.channel:
-            self.pad_voice.channel.set_volume(max(0.0, min(1.0, volume)))
+            self._set_voice_volume(self.pad_voice, volume)
             # 音高变化通过重采样实现（简化版）
             semitones = max(-12.0, min(12.0, pitch_shift))
             # 仅当变化超过 0.5 半音时才重采样，降低咔哒声风险
@@ -253,78 +321,118 @@ class MultiLayerSynth:
     def update_lead(self, volume: float, pitch_shift: float = 1.0) -> None:
         """更新主旋律音量"""
         if self.lead_voice.channel:
-            self.lead_voice.channel.set_volume(max(0.0, min(1.0, volume)))
+            self._set_voice_volume(self.lead_voice, volume)
 
     def update_ambient(self, volume: float) -> None:
         """更新氛围音量"""
         if self.ambient_voice.channel:
-            self.ambient_voice.channel.set_volume(max(0.0, min(1.0, volume)))
+            self._set_voice_volume(self.ambient_voice, volume)
+
+    def _set_voice_volume(self, voice: SineVoice, volume: float) -> None:
+        """写入持续音轨音量
+
+        模板每帧都会调用 update_*，平滑收敛后或静音保持时音量不再变化；
+        与上次写入值相差不足 _VOLUME_WRITE_STEP 时跳过写入（归零除外）。
+        """
+        volume = max(0.0, min(1.0, volume))
+        last = voice.volume
+        if volume == last or (volume and abs(volume - last) < _VOLUME_WRITE_STEP):
+            return
+        voice.volume = volume
+        voice.channel.set_volume(volume)
 
     def _retune_loop(self, voice: SineVoice, semitones: float) -> None:
         """对循环持续音进行半音级重采样变调
 
         Args:
-            voice: 需要变调的持续音轨（包含原始立体声循环缓冲）
+            voice: 需要变调的持续音轨（包含原始单声道循环缓冲）
             semitones: 目标变调量（正值升高，负值降低），单位：半音
+        注意：
+            - 变调量对齐到 1/_RETUNE_STEPS 半音，重采样结果按音轨缓存，
+              和弦根音等重复出现的音高直接复用已有 Sound
+        """
+        semitones = max(-24.0, min(24.0, semitones))
+        step = int(round(semitones * _RETUNE_STEPS))
+        cache = voice.retuned
+        new_sound = cache.get(step)
+        if new_sound is None:
+            ratio = float(_RETUNE_RATIOS[step + _RETUNE_OFFSET])
+            new_sound = self._render_retuned(voice.base_buffer, ratio)
+            if new_sound is None:
+                return
+            cache[step] = new_sound
+            if len(cache) > _RETUNE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(step)
+
+        if voice.channel:
+            # 沿用最近一次写入的音量，无需再回读声道
+            voice.channel.stop()
+            voice.channel.play(new_sound, loops=-1)
+            voice.channel.set_volume(voice.volume)
+
+        voice.sound = new_sound
+
+    def _render_retuned(
+        self, base: np.ndarray, ratio: float
+    ) -> Optional[pygame.mixer.Sound]:
+        """以线性插值重采样循环缓冲，生成变调后的 Sound
+
+        Args:
+            base: 原始单声道循环缓冲
+            ratio: 重采样比率（>1 升调、<1 降调）
         注意：
             - 使用线性插值重采样，保证实时性与稳定性
             - 控制重采样比率范围，防止极端比率造成长度为 0 或音质异常
         """
-        # 计算重采样比率：>1 升调、<1 降调
-        ratio = float(2.0 ** (max(-24.0, min(24.0, semitones)) / 12.0))
-        base = voice.base_buffer  # shape: (N, 2) stereo float32/float
         if base is None or base.shape[0] < 4:
-            return
+            return None
 
         n = base.shape[0]
         # 约束比率，避免极端导致输出长度过短或过长
-        ratio = max(0.125, min(8.0, ratio))
+        ratio = max(_MIN_RATIO, min(8.0, ratio))
         n_out = max(8, int(n / ratio))
 
-        # 构建采样位置，并进行线性插值（逐通道）
-        pos = (np.arange(n_out, dtype=np.float32) * ratio).astype(np.float32)
-        max_pos = float(n - 2) - 1e-6  # 保障 idx+1 不越界
-        pos = np.clip(pos, 0.0, max_pos)
-        idx = pos.astype(np.int32)
-        frac = pos - idx
-
-        left = base[idx, 0] * (1.0 - frac) + base[idx + 1, 0] * frac
-        right = base[idx, 1] * (1.0 - frac) + base[idx + 1, 1] * frac
-        stereo = np.stack([left, right], axis=1).astype(np.float32)
-
-        # 转换为 pygame Sound 并无缝替换播放
-        data = (np.clip(stereo, -1.0, 1.0) * 32767).astype(np.int16)
-        new_sound = pygame.mixer.Sound(buffer=data.tobytes())
-
-        prev_vol = 0.0
-        if voice.channel:
-            try:
-                prev_vol = voice.channel.get_volume()
-            except Exception:
-                prev_vol = 0.0
-            voice.channel.stop()
-            voice.channel.play(new_sound, loops=-1)
-            voice.channel.set_volume(prev_vol)
-
-        voice.sound = new_sound
+        # 构建采样位置，并进行线性插值
+        # 帧序号按循环长度缓存，每次只取前 n_out 个的视图
+        pos = _frame_ramp(int(n / _MIN_RATIO))[:n_out] * np.float32(ratio)
+        idx = pos.astype(np.intp)
+        pos -= idx  # 就地转为帧内小数位置
+
+        # 在单声道缓冲上插值（原地完成），到量化时才展开为立体声。
+        # 缓冲是循环片段，末帧之后的相邻帧即首帧：以 wrap 模式取样，
+        # 无需钳位位置，循环接缝处也不再停留在倒数第二帧
+        lo = np.take(base, idx, mode="wrap")
+        mono = np.take(base, idx + 1, mode="wrap")
+        mono -= lo
+        mono *= pos
+        mono += lo
+        return self._to_sound(mono)
+
+    def _play_drum(self, sound: pygame.mixer.Sound, vol: float) -> None:
+        """在下一个鼓点专用声道上播放一次性音色
+
+        音量在播放前写入（Channel.play 不会重置声道音量），
+        避免先以满音量起音再降下来。
+        """
+        i = self._next_drum
+        self._next_drum = (i + 1) % _DRUM_CHANNELS
+        ch = self._drum_channels[i]
+        ch.set_volume(max(0.0, min(1.0, vol)))
+        ch.play(sound)
 
     def play_kick(self, vol: float = 0.8) -> None:
         """播放底鼓"""
-        ch = self.kick.play()
-        if ch:
-            ch.set_volume(max(0.0, min(1.0, vol)))
+        self._play_drum(self.kick, vol)
 
     def play_snare(self, vol: float = 0.7) -> None:
         """播放军鼓"""
-        ch = self.snare.play()
-        if ch:
-            ch.set_volume(max(0.0, min(1.0, vol)))
+        self._play_drum(self.snare, vol)
 
     def play_hat(self, vol: float = 0.5) -> None:
         """播放踩镲"""
-        ch = self.hat.play()
-        if ch:
-            ch.set_volume(max(0.0, min(1.0, vol)))
+        self._play_drum(self.hat, vol)
 
 
 class MusicTemplate808:
@@ -362,7 +470,8 @@ class MusicTemplate808:
 
         # 拍速与调度
         self.beat_index = 0
-        self.next_beat_time = time.time() + 0.2
+        # 节拍调度使用单调时钟，不受系统校时影响
+        self.next_beat_time = time.monotonic() + 0.2
         self.next_hat_time = self.next_beat_time + 0.25
 
         # 内部平滑，以免音量跳变
@@ -499,7 +608,7 @@ class MusicTemplate808:
     def run(self) -> None:
         """主循环：MBUX Sound Drive 风格的多维度音乐交互（三轨模板版）"""
         print("[MBUX Audio] 开始运行，体验分轨式驾驶音乐（Ctrl+C 结束）…")
-        prev_print = time.time()
+        prev_print = time.monotonic()
 
         try:
             while True:
@@ -531,7 +640,7 @@ class MusicTemplate808:
                 )
 
                 # 使用三轨音乐模板驱动编排与参数（核心调用）
-                now = time.time()
+                now = time.monotonic()
                 self.template.update(
                     now=now,
                     energy=self.energy_level,
@@ -549,8 +658,13 @@ class MusicTemplate808:
 
                 # 周期性状态打印
                 if now - prev_print > 2.0:
-                    print(
-                        f"能量 {self.energy_level:.2f} | 速度 {self.s_speed:5.1f} | 转向 {self.s_steer:5.1f}° | 油门 {self.s_throttle:.2f} | 刹车 {self.s_brake:.2f}"
+                    logger.info(
+                        "能量 %.2f | 速度 %5.1f | 转向 %5.1f° | 油门 %.2f | 刹车 %.2f",
+                        self.energy_level,
+                        self.s_speed,
+                        self.s_steer,
+                        self.s_throttle,
+                        self.s_brake,
                     )
                     prev_print = now
 
@@ -585,6 +699,8 @@ class PythonAudioBridge:
         self.sample_rate = sample_rate
         self.update_rate = update_rate
         self.sleep_time = 1.0 / max(1, update_rate)
+        # 停止信号：主循环的等待均可被 stop() 立即打断
+        self._stop_event = threading.Event()
 
         # 初始化 pygame 音频
         pygame.mixer.pre_init(
@@ -626,14 +742,18 @@ class PythonAudioBridge:
         - 速度映射至 300km/h 上限，采用 0.9 次幂以增强中高段可感提升
         - 速度权重 0.7、转速权重 0.3，适配 GT 赛事高速巡航特性
         """
-        spd_norm = max(0.0, min(1.0, speed / 300.0))
+        # 每帧调用：以条件表达式钳位，省去 max/min 的函数调用
+        spd_norm = speed / 300.0
+        spd_norm = 0.0 if spd_norm < 0.0 else (1.0 if spd_norm > 1.0 else spd_norm)
         spd_curve = spd_norm**0.9
         speed_factor = 0.7 * spd_curve
 
-        rpm_norm = max(0.0, min(1.0, rpm / 8000.0))
+        rpm_norm = rpm / 8000.0
+        rpm_norm = 0.0 if rpm_norm < 0.0 else (1.0 if rpm_norm > 1.0 else rpm_norm)
         rpm_factor = 0.3 * rpm_norm
 
-        return min(1.0, speed_factor + rpm_factor)
+        energy = speed_factor + rpm_factor
+        return 1.0 if energy > 1.0 else energy
 
     def _handle_gear_change(self, new_gear: int, prev_gear: int) -> None:
         """换挡时的特殊音效：升档兴奋、降档紧张
@@ -658,16 +778,26 @@ class PythonAudioBridge:
                 cur = self.synth.bass_voice.channel.get_volume()
                 self.synth.update_bass(min(1.0, cur + 0.2))
 
+    def stop(self) -> None:
+        """请求主循环退出（可从其它线程调用）"""
+        self._stop_event.set()
+
     def run(self) -> None:
         """主循环：采集遥测并驱动 MusicTemplate808 进行实时编排"""
         print("[MBUX Audio] 开始运行，体验三轨 808 模板（Ctrl+C 结束）…")
-        prev_print = time.time()
+        prev_print = time.monotonic()
+
+        # 基于单调时钟的绝对截止时间调度：只休眠到下一帧的剩余时间，
+        # 每帧的处理耗时不会累积成漂移
+        wait = self._stop_event.wait
+        deadline = time.monotonic()
 
         try:
-            while True:
+            while not self._stop_event.is_set():
                 data = self.telemetry.get_telemetry()
                 if data is None:
-                    time.sleep(0.5)
+                    wait(0.5)
+                    deadline = time.monotonic()
                     continue
 
                 # 平滑更新
@@ -692,7 +822,7 @@ class PythonAudioBridge:
                 )
 
                 # 三轨模板驱动
-                now = time.time()
+                now = time.monotonic()
                 self.template.update(
                     now=now,
                     energy=self.energy_level,
@@ -710,12 +840,23 @@ class PythonAudioBridge:
 
                 # 打印状态
                 if now - prev_print > 2.0:
-                    print(
-                        f"能量 {self.energy_level:.2f} | 速度 {self.s_speed:5.1f} | 转向 {self.s_steer:5.1f}° | 油门 {self.s_throttle:.2f} | 刹车 {self.s_brake:.2f}"
+                    logger.info(
+                        "能量 %.2f | 速度 %5.1f | 转向 %5.1f° | 油门 %.2f | 刹车 %.2f",
+                        self.energy_level,
+                        self.s_speed,
+                        self.s_steer,
+                        self.s_throttle,
+                        self.s_brake,
                     )
                     prev_print = now
 
-                time.sleep(self.sleep_time)
+                # 控制速率：推进截止时间，落后于节拍时重新对齐，避免连续追赶
+                deadline += self.sleep_time
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    wait(remaining)
+                else:
+                    deadline = time.monotonic()
 
         except KeyboardInterrupt:
             print("\n[MBUX Audio] 停止三轨音乐系统")
@@ -735,6 +876,9 @@ def main():
 
     args = parser.parse_args()
 
+    # 周期状态行经 logging 输出（参数惰性格式化），默认显示 INFO 级别
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     bridge = PythonAudioBridge(
         sample_rate=args.sr, buffer_ms=args.buf, update_rate=args.rate
     )
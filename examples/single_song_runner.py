@@ -64,6 +64,15 @@ class MusicalExpressionEngine:
         self.max_rpm = 8000.0  # 最大转速
         self.max_lateral_g = 3.0  # 最大横向G力
 
+        # 表现状态字典预先构建, update 每帧原地更新字段
+        self._expressions: Dict[str, float] = {
+            "energy_density": self.energy_density,
+            "rhythmic_push": self.rhythmic_push,
+            "breathing_space": self.breathing_space,
+            "spatial_width": self.spatial_width,
+            "tonal_brightness": self.tonal_brightness,
+        }
+
     def update(self, telemetry: TelemetryData) -> Dict[str, float]:
         """
         根据遥测数据更新音乐表现状态
@@ -72,7 +81,7 @@ class MusicalExpressionEngine:
             telemetry: ACC遥测数据
 
         Returns:
-            更新后的音乐表现状态字典
+            更新后的音乐表现状态字典(在调用间复用并原地更新, 需要保留快照时请自行复制)
         """
         # 计算标准化输入
         speed_norm = min(telemetry.speed / self.max_speed, 1.0)
@@ -99,13 +108,13 @@ class MusicalExpressionEngine:
             self.tonal_brightness, target_tonal
         )
 
-        return {
-            "energy_density": self.energy_density,
-            "rhythmic_push": self.rhythmic_push,
-            "breathing_space": self.breathing_space,
-            "spatial_width": self.spatial_width,
-            "tonal_brightness": self.tonal_brightness,
-        }
+        expressions = self._expressions
+        expressions["energy_density"] = self.energy_density
+        expressions["rhythmic_push"] = self.rhythmic_push
+        expressions["breathing_space"] = self.breathing_space
+        expressions["spatial_width"] = self.spatial_width
+        expressions["tonal_brightness"] = self.tonal_brightness
+        return expressions
 
     def _smooth_parameter(self, current: float, target: float) -> float:
         """
@@ -243,6 +252,9 @@ class SingleSongRunner:
             print("正在连接到ACC...")
             self.telemetry.connect()
 
+        # 60Hz 更新频率: 推进绝对截止时间而非固定休眠, 补偿每个周期的处理耗时
+        interval = 1 / 60
+        deadline = time.monotonic()
         while self._running:
             try:
                 telemetry = self.telemetry.read_data()
@@ -250,11 +262,17 @@ class SingleSongRunner:
                     expressions = self.expression_engine.update(telemetry)
                     self._apply_expressions(expressions)
 
-                time.sleep(1 / 60)  # 60Hz 更新频率
+                deadline += interval
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    deadline = time.monotonic()
 
             except Exception as e:
                 print(f"遥测处理错误: {e}")
                 time.sleep(1)
+                deadline = time.monotonic()
 
     def _apply_expressions(self, expressions: Dict[str, float]):
         """
@@ -9,9 +9,11 @@ __version__ = "1.0.0"
 
 import logging
 import os
+import queue
 import subprocess
 import sys
 import threading
+import time
 
 import customtkinter as ctk
 from PIL import Image, ImageTk
@@ -21,6 +23,10 @@ from acc_telemetry.utils.config import get_config
 from acc_telemetry.utils.error_handling import setup_exception_handling
 from acc_telemetry.utils.logging_config import setup_logging
 
+# 后台线程错误队列容量与错误对话框的最小间隔(秒)
+ERROR_QUEUE_SIZE = 8
+ERROR_DIALOG_INTERVAL = 1.0
+
 # 初始化配置和日志
 config = get_config()
 logger = setup_logging("acc_telemetry", log_to_console=True)
@@ -45,6 +51,11 @@ class App(ctk.CTk):
         # 绑定窗口关闭事件，确保资源被正确释放
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+        # 后台线程上报的错误: 由主线程定时取出, 每秒最多弹出一个对话框
+        self._error_queue = queue.Queue(maxsize=ERROR_QUEUE_SIZE)
+        self._last_error_dialog = 0.0
+        self.after(250, self._drain_error_queue)
+
         # 记录应用程序启动完成
         logger.debug("应用程序界面初始化完成")
         # 创建主容器
@@ -392,11 +403,9 @@ class App(ctk.CTk):
                     try:
                         self.web_server.start()
                     except Exception as e:
-                        self.after(
-                            0, lambda: self.show_error_dialog(f"Web服务器启动失败: {e}")
-                        )
-                        self.after(
-                            0, lambda: status_label.configure(text="🔴 服务器启动失败")
+                        self.report_error(
+                            f"Web服务器启动失败: {e}",
+                            lambda: status_label.configure(text="🔴 服务器启动失败"),
                         )
 
                 self.web_server_thread = threading.Thread(target=run_server)
@@ -659,6 +668,37 @@ class App(ctk.CTk):
 
         return osc_frame
 
+    def report_error(self, message, on_shown=None):
+        """供后台线程上报错误（不直接调用 Tk）
+
+        Args:
+            message: 错误信息
+            on_shown: 可选, 显示该错误时在主线程执行的回调(如更新状态标签)
+        """
+        try:
+            self._error_queue.put_nowait((message, on_shown))
+        except queue.Full:
+            # 队列已满说明错误在持续发生, 只记录日志不再排队弹窗
+            logger.error(message)
+
+    def _drain_error_queue(self):
+        """主线程定时取出后台错误并显示, 每秒最多一个对话框"""
+        now = time.monotonic()
+        try:
+            if now - self._last_error_dialog >= ERROR_DIALOG_INTERVAL:
+                message, on_shown = self._error_queue.get_nowait()
+                self._last_error_dialog = now
+                logger.error(message)
+                if on_shown is not None:
+                    on_shown()
+                self.show_error_dialog(message)
+        except queue.Empty:
+            pass
+        except Exception as e:
+            logger.warning(f"显示错误对话框时出错: {e}")
+        finally:
+            self.after(250, self._drain_error_queue)
+
     def show_error_dialog(self, message: str):
         """显示现代化错误对话框"""
         dialog = ctk.CTkToplevel(self)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+音频模块测试脚本
+
+覆盖表现力引擎与遥测 → 音乐参数的数值内核
+"""
+
+import importlib.machinery
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from acc_telemetry.audio import _kernels
+from acc_telemetry.audio.audio_config import AudioConfig
+from acc_telemetry.audio.mbux_controller import MusicalExpressionEngine
+from acc_telemetry.audio.music_engine import (
+    PygameStemsAudioEngine,
+    SounddeviceStemsAudioEngine,
+)
+from acc_telemetry.audio.music_mapper import (
+    TRIG_DRS,
+    TRIG_WARN,
+    MusicParameters,
+    ParameterRing,
+)
+
+
+class TestMusicalExpressionEngine(unittest.TestCase):
+    """表现力引擎测试类"""
+
+    def test_initial_state(self):
+        """测试初始表现力状态"""
+        expr = MusicalExpressionEngine()
+        self.assertAlmostEqual(expr.energy_density, 0.5)
+        self.assertAlmostEqual(expr.spatial_width, 0.0)
+        self.assertAlmostEqual(expr.tonal_brightness, 0.5)
+
+    def test_update_converges_to_target(self):
+        """测试持续输入下状态收敛到目标值"""
+        expr = MusicalExpressionEngine()
+        for _ in range(500):
+            expr.update(speed=300.0, throttle=1.0, brake=0.0, lat_g=6.0, rpm=8000)
+
+        self.assertAlmostEqual(expr.energy_density, 0.975, places=3)
+        self.assertAlmostEqual(expr.rhythmic_push, 1.0, places=3)
+        self.assertAlmostEqual(expr.breathing_space, 1.0, places=3)
+        self.assertAlmostEqual(expr.spatial_width, 1.0, places=3)
+        self.assertAlmostEqual(expr.tonal_brightness, 1.0, places=3)
+
+    def test_master_presence_range(self):
+        """测试主存在感始终位于 [0.2, 0.95]"""
+        expr = MusicalExpressionEngine()
+        for speed in range(0, 320, 5):
+            presence = expr.get_master_presence(float(speed))
+            self.assertGreaterEqual(presence, 0.2)
+            self.assertLessEqual(presence, 0.95)
+
+
+class TestKernels(unittest.TestCase):
+    """数值内核测试类"""
+
+    def test_compute_params_ranges(self):
+        """测试内核输出范围"""
+        state = _kernels.new_state()
+        for speed, rpm, slip in (
+            (0.0, 800.0, -0.5),
+            (150.0, 5000.0, 0.3),
+            (320.0, 9500.0, 2.0),
+        ):
+            bpm, presence, pan, pitch, brightness, reverb, distortion = (
+                _kernels.compute_params(
+                    speed, 0.5, 0.5, 4.0, rpm, slip, 0.0, 0.12, state
+                )
+            )
+            self.assertGreaterEqual(bpm, 90.0)
+            self.assertLessEqual(bpm, 160.0)
+            self.assertGreaterEqual(pan, -1.0)
+            self.assertLessEqual(pan, 1.0)
+            self.assertGreaterEqual(pitch, 58)
+            self.assertLessEqual(pitch, 66)
+            self.assertGreaterEqual(reverb, 0.0)
+            self.assertLessEqual(reverb, 1.0)
+            self.assertGreaterEqual(distortion, 0.0)
+            self.assertLessEqual(distortion, 0.8)
+
+    def test_compute_params_updates_state(self):
+        """测试内核原地更新表现力状态"""
+        state = _kernels.new_state()
+        _kernels.compute_params(300.0, 1.0, 0.0, 0.0, 8000.0, 0.0, 0.0, 0.12, state)
+        self.assertGreater(state[_kernels.ENERGY], 0.5)
+        self.assertGreater(state[_kernels.BRIGHTNESS], 0.5)
+
+    def test_stem_mix_gate_and_pan(self):
+        """测试分轨音量表: 掩码置零, 声像等功率"""
+        base = np.array([0.8, 0.75, 0.4, 0.65], dtype=np.float32)
+        coeffs = np.ones(4, dtype=np.float32)
+        gate = np.array([True, False, True, True])
+        out = np.empty((4, 2), dtype=np.float32)
+        _kernels.stem_mix(0.7, 0.6, 0.2, 0.3, 1.0, base, coeffs, gate, out)
+
+        self.assertEqual(out[1].tolist(), [0.0, 0.0])
+        power = (out**2).sum(axis=1)
+        volume = np.minimum(base * coeffs, 1.0) * 0.7 * gate
+        np.testing.assert_allclose(power, volume**2, rtol=1e-3)
+        self.assertLess(out[0, 0], out[0, 1])
+
+    def test_feedback_smooth_matches_recursion(self):
+        """测试递归平滑与逐样本参考实现一致"""
+        x = np.random.default_rng(0).uniform(-1.0, 1.0, 64)
+        expected = x.copy()
+        for i in range(3, len(expected)):
+            expected[i] = expected[i] * 0.7 + sum(expected[i - 3 : i]) * 0.1
+
+        _kernels.feedback_smooth(x, 0.7, 0.1, 3)
+        np.testing.assert_allclose(x, expected, rtol=1e-9)
+
+
+class TestMusicParameters(unittest.TestCase):
+    """音乐参数测试类"""
+
+    def test_trigger_flags(self):
+        """测试触发属性与位标志相互一致"""
+        params = MusicParameters(bpm=120.0, volume=0.8, base_pitch=60)
+        params.trigger_drs_sound = True
+        params.trigger_warning_sound = True
+        self.assertEqual(params.flags, TRIG_DRS | TRIG_WARN)
+
+        params.trigger_drs_sound = False
+        self.assertEqual(params.flags, TRIG_WARN)
+        self.assertFalse(params.trigger_turbo_sound)
+        self.assertTrue(params.trigger_warning_sound)
+
+
+class TestParameterRing(unittest.TestCase):
+    """参数环测试类"""
+
+    def test_latest_wins(self):
+        """测试读者总是取得最近发布的槽位, 且槽位循环复用"""
+        ring = ParameterRing(capacity=4)
+        self.assertIsNone(ring.latest())
+
+        published = []
+        for i in range(6):
+            slot = ring.acquire()
+            slot.bpm = float(i)
+            published.append(ring.publish())
+            self.assertIs(ring.latest(), slot)
+            self.assertEqual(ring.latest().bpm, float(i))
+
+        self.assertIs(published[0], published[4])
+
+    def test_invalid_capacity(self):
+        """测试非 2 的幂容量被拒绝"""
+        with self.assertRaises(ValueError):
+            ParameterRing(capacity=6)
+
+
+class TestAudioConfig(unittest.TestCase):
+    """音频配置测试类"""
+
+    def test_save_load_roundtrip(self):
+        """测试配置保存后可完整还原(含元组与整数键)"""
+        config = AudioConfig()
+        config.master_volume = 0.3
+        config.rhythm.bpm_range = (70, 150)
+        config.stem_volumes["bass"] = 1.5
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "audio_config.json")
+            config.save_to_file(path)
+            loaded = AudioConfig.load_from_file(path)
+
+        self.assertEqual(loaded, config)
+        self.assertIsInstance(loaded.rhythm.bpm_range, tuple)
+        self.assertIn(1, loaded.rhythm.gear_beat_patterns)
+
+    def test_save_rewrites_externally_modified_file(self):
+        """测试未变更的配置跳过写入, 但文件被外部改动后仍会重新写出"""
+        config = AudioConfig()
+        config.master_volume = 0.4
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "audio_config.json")
+            config.save_to_file(path)
+            config.save_to_file(path)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("{}")
+            config.save_to_file(path)
+            loaded = AudioConfig.load_from_file(path)
+
+        self.assertEqual(loaded, config)
+
+    def test_legacy_global_section_overrides_top_level(self):
+        """测试手工添加的旧版 "global" 分组覆盖保存时写出的顶层字段"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "audio_config.json")
+            AudioConfig().save_to_file(path)
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data["global"] = {"output_device": "立体声混音"}
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            loaded = AudioConfig.load_from_file(path)
+
+        self.assertEqual(loaded.output_device, "立体声混音")
+
+
+class TestPygameStemsAudioEngine(unittest.TestCase):
+    """分轨后端测试类(以模拟的 pygame 模块运行)"""
+
+    def setUp(self):
+        self.pygame = mock.MagicMock()
+        self.pygame.__spec__ = importlib.machinery.ModuleSpec("pygame", None)
+        self.pygame.mixer.Channel.side_effect = lambda idx: mock.MagicMock()
+        patcher = mock.patch.dict(sys.modules, {"pygame": self.pygame})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.stems_dir = self._make_stems_dir()
+        patcher = mock.patch.dict(os.environ, {"ACC_STEMS_DIR": self.stems_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _make_stems_dir(self):
+        """创建包含四个空分轨文件的临时目录"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for name in ("drums", "bass", "vocals", "other"):
+            open(os.path.join(tmp.name, f"{name}.wav"), "wb").close()
+        return tmp.name
+
+    def test_update_config_while_stopped(self):
+        """测试未运行时更新配置, 分轨音量/静音/独奏在启动后生效"""
+        engine = PygameStemsAudioEngine(AudioConfig())
+        config = AudioConfig()
+        config.stem_volumes["bass"] = 0.1
+        config.stem_muted["drums"] = True
+        config.stem_solo["vocals"] = True
+        engine.update_config(config)
+        engine.start()
+
+        self.assertAlmostEqual(float(engine._base_vol_arr[1]), 0.08, places=6)
+        self.assertEqual(engine._gate.tolist(), [False, False, True, False])
+        drums_left, drums_right = engine._channels["drums"].set_volume.call_args[0]
+        self.assertEqual((drums_left, drums_right), (0.0, 0.0))
+        vocals_left, _ = engine._channels["vocals"].set_volume.call_args[0]
+        self.assertGreater(vocals_left, 0.0)
+
+    def test_restart_reloads_only_changed_stems_dir(self):
+        """测试重启沿用已加载的分轨, 分轨目录变化后重新加载"""
+        engine = PygameStemsAudioEngine(AudioConfig())
+        load = self.pygame.mixer.Sound
+        engine.start()
+        engine.stop()
+        engine.start()
+        self.assertEqual(load.call_count, 4)
+
+        engine.stop()
+        engine.stems_dir = self._make_stems_dir()
+        engine.start()
+        self.assertEqual(load.call_count, 8)
+        self.assertTrue(load.call_args[0][0].startswith(engine.stems_dir))
+
+
+class TestSounddeviceStemsAudioEngine(unittest.TestCase):
+    """sounddevice 分轨后端测试类(直接调用音频回调)"""
+
+    def setUp(self):
+        modules = {}
+        for name in ("sounddevice", "soundfile"):
+            module = mock.MagicMock()
+            module.__spec__ = importlib.machinery.ModuleSpec(name, None)
+            modules[name] = module
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.dict(os.environ, {"ACC_STEMS_DIR": tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.engine = SounddeviceStemsAudioEngine(AudioConfig())
+        # 长度 6 的分轨: drums 左右声道均为 0, 100, ..., 500, 其余分轨静音
+        stems = np.zeros((4, 6, 2), dtype=np.float32)
+        stems[0] = (np.arange(6, dtype=np.float32) * 100.0)[:, None]
+        self.engine._stems = stems
+
+    def _callback(self, frames):
+        outdata = np.empty((frames, 2), dtype=np.int16)
+        self.engine._audio_callback(outdata, frames, None, None)
+        return outdata[:, 0].tolist()
+
+    def test_gain_ramp_and_wrap_around(self):
+        """测试块内增益线性过渡, 以及跨越循环终点时按顺序拼接分轨"""
+        self.engine._gains[0] = 1.0
+
+        # 首块增益由 0 线性过渡到 1
+        self.assertEqual(self._callback(4), [0, 25, 100, 225])
+        # 次块增益保持 1, 播放位置 4 -> 5 -> 0 -> 1
+        self.assertEqual(self._callback(4), [400, 500, 0, 100])
+        self.assertEqual(self.engine._position, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()